@@ -11,7 +11,17 @@ class Config:
     """
     BASE_DIR: str = base_dir
     DB_POOL_RECYCLE: int = 900
-    DB_ECHO: bool = True
+    # 워커(프로세스)별 커넥션 풀
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_WARMUP: int = 1
+    DB_ECHO: bool = False
+    DB_CREATE_ALL: bool = False
+    DB_ASYNC: bool = False
+    DB_READER_URLS: list = field(default_factory=list)
+    DB_READER_SELECT: str = 'round_robin'
+    DB_READ_YOUR_WRITES_SEC: int = 0
     DEBUG: bool = False
     TEST_MODE: bool = False
     DEV_MODE: bool = False
@@ -19,12 +29,53 @@ class Config:
     REDIS_HOST: str = 'localhost'
     TRUSTED_HOSTS: list = field(default_factory=lambda: ["*"])
     ALLOW_SITE: list = field(default_factory=lambda: ["*"])
+    # /internal 경로 접근 허용 대역 (프록시를 거치지 않은 직접 접속만 허용)
+    INTERNAL_ALLOW_NETWORKS: list = field(
+        default_factory=lambda: ["127.0.0.0/8", "10.0.0.0/8", "172.16.0.0/12", "192.168.0.0/16", "::1/128"]
+    )
+    AUTOCOMPLETE_INDEX: bool = True
+    AUTOCOMPLETE_REFRESH_SEC: int = 10
+    AUTOCOMPLETE_REBUILD_SEC: int = 3600
+    REDIS_PORT: int = 6379
+    CACHE_ENABLED: bool = True
+    CACHE_BACKEND: str = 'memory'
+    CACHE_REDIS_TIMEOUT: float = 0.05
+    CACHE_REDIS_RETRY_SEC: int = 30
+    CACHE_MAXSIZE: int = 1024
+    CACHE_TTL: int = 60
+    SQL_PROFILER: bool = True
+    SQL_N_PLUS_ONE_THRESHOLD: int = 10
+    TRACING_ENABLED: bool = False
+    TRACING_SAMPLE_RATE: float = 1.0
+    TRACING_EXPORTER: str = 'otlp'
+    TRACING_BATCH_EXPORT: bool = True
+    TRACING_MAX_QUEUE_SIZE: int = 2048
+    TRACING_MAX_EXPORT_BATCH_SIZE: int = 512
+    TRACING_SCHEDULE_DELAY_MS: int = 5000
+    TRACING_SERVICE_NAME: str = 'choco-api'
+    LOG_SAMPLE_RATE_2XX: float = 1.0
+    LOG_QUEUE_SIZE: int = 10000
+    METRICS_FLUSH_SEC: int = 5
+    FAST_JSON_RESPONSE: bool = False
+    SINGLE_FLIGHT_ENABLED: bool = True
+    SINGLE_FLIGHT_TIMEOUT_SEC: float = 5.0
+    # 라우트별 동시 실행 한도 (워커별, 느린 응답시 자동 감소)
+    CONCURRENCY_LIMIT_ENABLED: bool = True
+    CONCURRENCY_LIMIT_INITIAL: int = 20
+    CONCURRENCY_LIMIT_MIN: int = 2
+    CONCURRENCY_LIMIT_MAX: int = 200
+    CONCURRENCY_LIMIT_LATENCY_SEC: float = 1.0
+    CONCURRENCY_LIMIT_BACKOFF: float = 0.9
+    # 일괄 등록, 일괄 태그 변경 라우트의 느린 응답 기준 (초)
+    CONCURRENCY_LIMIT_BULK_LATENCY_SEC: float = 60.0
+    CONCURRENCY_RETRY_AFTER_SEC: int = 1
 
 
 @dataclass
 class LocalConfig(Config):
     TRUSTED_HOSTS = ["*"]
     ALLOW_SITE = ["*"]
+    DB_CREATE_ALL: bool = True
 
 
 @dataclass
@@ -32,6 +83,10 @@ class ProdConfig(Config):
     TRUSTED_HOSTS = ["*"]
     ALLOW_SITE = ["*"]
     DB_ECHO: bool = False
+    # gunicorn 다중 워커 간 캐시 무효화 공유
+    CACHE_BACKEND: str = 'redis'
+    TRACING_ENABLED: bool = True
+    TRACING_SAMPLE_RATE: float = 0.1
 
 
 @dataclass
@@ -39,6 +94,10 @@ class StageConfig(Config):
     TRUSTED_HOSTS = ["*"]
     ALLOW_SITE = ["*"]
     DB_ECHO: bool = False
+    # gunicorn 다중 워커 간 캐시 무효화 공유
+    CACHE_BACKEND: str = 'redis'
+    TRACING_ENABLED: bool = True
+    TRACING_SAMPLE_RATE: float = 0.1
 
 
 @dataclass
@@ -54,6 +113,7 @@ class TestConfig(Config):
     TRUSTED_HOSTS = ["*"]
     ALLOW_SITE = ["*"]
     TEST_MODE: bool = True
+    DB_CREATE_ALL: bool = True
 
 
 def conf():
@@ -8,9 +8,15 @@ c = conf()
 conf_dict = asdict(c)
 EXCEPT_PATH_LIST = ["/", "/openapi.json", "/api/v1/common-util/health"]
 EXCEPT_PATH_REGEX = "^(/docs|/redoc|/api/auth)"
+# 내부망에서만 접근 가능한 경로 (INTERNAL_ALLOW_NETWORKS)
+INTERNAL_PATH_PREFIX = "/internal"
 
 MYSQL_HOST = environ.get('MYSQL_HOST')
 MYSQL_PORT = environ.get('MYSQL_PORT')
 MYSQL_DATABASE = environ.get('MYSQL_DATABASE')
 MYSQL_USER = environ.get('MYSQL_USER')
 MYSQL_PASSWORD = environ.get('MYSQL_PASSWORD')
+# host:port 콤마 구분
+MYSQL_READER_HOSTS = environ.get('MYSQL_READER_HOSTS')
+# gunicorn 다중 워커 메트릭 합산용 디렉터리 (워커별 파일)
+METRICS_MULTIPROC_DIR = environ.get('METRICS_MULTIPROC_DIR')
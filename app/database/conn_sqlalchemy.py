@@ -1,10 +1,22 @@
-from fastapi import FastAPI
-from sqlalchemy import create_engine
+import asyncio
+import itertools
+import os
+import time
+
+from fastapi import FastAPI, Request, Response
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.orm import sessionmaker, declarative_base
+from starlette.concurrency import run_in_threadpool
 import logging
-from app.common.consts import MYSQL_USER, MYSQL_PASSWORD, MYSQL_HOST, MYSQL_PORT, MYSQL_DATABASE
+from app.database.pool import TimedAsyncAdaptedQueuePool, TimedQueuePool
+from app.database.profiler import sql_profiler
+from app.common.consts import MYSQL_USER, MYSQL_PASSWORD, MYSQL_HOST, MYSQL_PORT, MYSQL_DATABASE, \
+    MYSQL_READER_HOSTS
 from sqlalchemy import text
 
+READ_YOUR_WRITES_COOKIE = "db_rw_until"
+
 
 def _database_exist(engine, schema_name):
     query = f"SELECT SCHEMA_NAME FROM INFORMATION_SCHEMA.SCHEMATA WHERE SCHEMA_NAME = '{schema_name}'"
@@ -30,12 +42,21 @@ class SQLAlchemy:
         self._session = None
         self._engine_dict = None
         self._session_dict = None
+        self._async_engine_dict = None
+        self._async_session_dict = None
+        self._reader_keys = []
+        self._reader_cycle = None
+        self._reader_select = "round_robin"
+        self._read_your_writes_sec = 0
+        self._pool_warmup = 1
         if app is not None:
             self.init_app(app=app, **kwargs)
 
     def init_app(self, app: FastAPI, **kwargs):
         """
         DB 초기화 함수
+        writer("db")와 reader("reader_0", "reader_1", ...) 엔진 생성
+        reader가 없으면 writer로 읽기 처리
         :param app: FastAPI 인스턴스
         :param kwargs:
         :return:
@@ -51,33 +72,174 @@ class SQLAlchemy:
             database_url_dict = {
                 "db": f"mysql+pymysql://{MYSQL_USER}:{MYSQL_PASSWORD}@{MYSQL_HOST}:{MYSQL_PORT}/{MYSQL_DATABASE}?charset=utf8mb4"
             }
+        if kwargs.get("DB_WRITER_URL"):
+            database_url_dict["db"] = kwargs["DB_WRITER_URL"]
+
+        reader_urls = kwargs.get("DB_READER_URLS") or [
+            f"mysql+pymysql://{MYSQL_USER}:{MYSQL_PASSWORD}@{host}/{MYSQL_DATABASE}?charset=utf8mb4"
+            for host in (MYSQL_READER_HOSTS or "").split(",") if host
+        ]
+        for i, url in enumerate(reader_urls):
+            database_url_dict[f"reader_{i}"] = url
+        self._reader_keys = [f"reader_{i}" for i in range(len(reader_urls))] or ["db"]
+        self._reader_cycle = itertools.cycle(self._reader_keys)
+        self._reader_select = kwargs.setdefault("DB_READER_SELECT", "round_robin")
+        self._read_your_writes_sec = kwargs.setdefault("DB_READ_YOUR_WRITES_SEC", 0)
+
         pool_recycle = kwargs.setdefault("DB_POOL_RECYCLE", 900)
-        echo = kwargs.setdefault("DB_ECHO", True)
+        echo = kwargs.setdefault("DB_ECHO", False)
+        pool_options = dict(
+            pool_size=kwargs.setdefault("DB_POOL_SIZE", 5),
+            max_overflow=kwargs.setdefault("DB_MAX_OVERFLOW", 10),
+            pool_timeout=kwargs.setdefault("DB_POOL_TIMEOUT", 30),
+        )
+        self._pool_warmup = min(kwargs.setdefault("DB_POOL_WARMUP", 1), pool_options["pool_size"])
         self._engine_dict = {
-            "db": create_engine(
-                database_url_dict['db'],
+            key: create_engine(
+                url,
                 echo=echo,
                 pool_recycle=pool_recycle,
                 pool_pre_ping=True,
-            )
+                poolclass=TimedQueuePool,
+                **pool_options
+            ) for key, url in database_url_dict.items()
         }
 
+        # commit 후 응답 생성에 세션 객체를 그대로 사용 (재조회 방지)
         self._session_dict = {
-            "db": sessionmaker(autocommit=False, autoflush=False, bind=self._engine_dict['db'])
+            key: sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+            for key, engine in self._engine_dict.items()
         }
+        event.listen(self._session_dict["db"], "after_commit", self._mark_write)
+
+        if kwargs.setdefault("DB_ASYNC", False):
+            # 같은 DB를 asyncio 드라이버로 접속
+            self._async_engine_dict = {
+                key: create_async_engine(
+                    url.replace("mysql+pymysql://", "mysql+aiomysql://", 1),
+                    echo=echo,
+                    pool_recycle=pool_recycle,
+                    pool_pre_ping=True,
+                    poolclass=TimedAsyncAdaptedQueuePool,
+                    **pool_options
+                ) for key, url in database_url_dict.items()
+            }
+            self._async_session_dict = {
+                key: async_sessionmaker(autoflush=False, expire_on_commit=False, bind=engine)
+                for key, engine in self._async_engine_dict.items()
+            }
+
+        sql_profiler.init_app(
+            [
+                *self._engine_dict.values(),
+                *(engine.sync_engine for engine in (self._async_engine_dict or {}).values())
+            ],
+            **kwargs
+        )
 
         @app.on_event("startup")
-        def startup():
-            self._engine_dict["db"].connect()
-            logging.info("DB connected.")
+        async def startup():
+            # 커넥션 미리 생성은 백그라운드에서 실행 (워커 시작을 막지 않음)
+            app.state.db_warm_up = asyncio.create_task(self._warm_up_all())
 
         @app.on_event("shutdown")
-        def shutdown():
-            self._session_dict['db'].close_all()
-            self._engine_dict["db"].dispose()
+        async def shutdown():
+            app.state.db_warm_up.cancel()
+            for session in self._session_dict.values():
+                session.close_all()
+            for engine in self._engine_dict.values():
+                engine.dispose()
+            if self._async_engine_dict is not None:
+                for engine in self._async_engine_dict.values():
+                    await engine.dispose()
             logging.info("DB disconnected")
 
-    def get_writer_db(self):
+    async def _warm_up_all(self):
+        try:
+            for engine in self._engine_dict.values():
+                await run_in_threadpool(self._warm_up, engine)
+            for engine in (self._async_engine_dict or {}).values():
+                await self._warm_up_async(engine)
+            logging.info("DB connected.")
+        except Exception:
+            logging.exception("DB warm up failed.")
+
+    def _warm_up(self, engine):
+        """
+        첫 요청의 접속 지연을 줄이기 위해 DB_POOL_WARMUP 개수만큼 커넥션을 미리 생성
+        사용한 커넥션은 닫아서 풀로 반환
+        """
+        connections = [engine.connect() for _ in range(self._pool_warmup)]
+        for connection in connections:
+            connection.close()
+
+    async def _warm_up_async(self, engine):
+        """
+        DB_ASYNC 엔진도 DB_POOL_WARMUP 개수만큼 커넥션을 미리 생성
+        """
+        connections = [await engine.connect() for _ in range(self._pool_warmup)]
+        for connection in connections:
+            await connection.close()
+
+    def pool_stats(self):
+        """
+        워커(프로세스)별 커넥션 풀 상태
+        :return: 엔진별 사용중, overflow, 대기 시간 통계
+        """
+        pools = {key: engine.pool.stats() for key, engine in self._engine_dict.items()}
+        if self._async_engine_dict is not None:
+            pools.update(
+                (f"async_{key}", engine.pool.stats()) for key, engine in self._async_engine_dict.items()
+            )
+        return dict(pid=os.getpid(), pools=pools)
+
+    def pool_gauges(self):
+        """
+        커넥션 풀 상태 메트릭 (gauge collector)
+        """
+        for key, stats in self.pool_stats()["pools"].items():
+            labels = dict(engine=key)
+            yield "db_pool_size", labels, stats["size"]
+            yield "db_pool_checked_out", labels, stats["checked_out"]
+            yield "db_pool_overflow", labels, stats["overflow"]
+            yield "db_pool_checkouts", labels, stats["checkouts"]
+            yield "db_pool_waits", labels, stats["waits"]
+            yield "db_pool_wait_seconds", labels, stats["wait_time_ms"] / 1000
+            yield "db_pool_timeouts", labels, stats["timeouts"]
+
+    def _mark_write(self, session):
+        """
+        commit 후 read-your-writes 쿠키 설정
+        설정 시간 동안 같은 클라이언트의 읽기는 writer에서 처리
+        """
+        response = session.info.get("response")
+        if self._read_your_writes_sec and response is not None:
+            response.set_cookie(
+                READ_YOUR_WRITES_COOKIE,
+                str(int(time.time()) + self._read_your_writes_sec),
+                max_age=self._read_your_writes_sec,
+                httponly=True,
+            )
+
+    def _select_reader(self, request: Request = None) -> str:
+        """
+        읽기에 사용할 엔진 선택
+        round_robin: 순서대로 선택
+        least_connections: 사용중인 커넥션이 가장 적은 reader 선택
+        """
+        if request is not None and self._read_your_writes_sec:
+            try:
+                if float(request.cookies.get(READ_YOUR_WRITES_COOKIE, 0)) > time.time():
+                    return "db"
+            except ValueError:
+                pass
+        if len(self._reader_keys) == 1:
+            return self._reader_keys[0]
+        if self._reader_select == "least_connections":
+            return min(self._reader_keys, key=lambda key: self._engine_dict[key].pool.checkedout())
+        return next(self._reader_cycle)
+
+    def get_writer_db(self, response: Response = None):
         """
         요청마다 DB 세션 유지 함수
         :return:
@@ -87,6 +249,7 @@ class SQLAlchemy:
         db_session = None
         try:
             db_session = self._session_dict['db']()
+            db_session.info["response"] = response
             yield db_session
         finally:
             db_session.close()
@@ -105,16 +268,17 @@ class SQLAlchemy:
     def session_writer(self):
         return self.get_writer_db
 
-    def get_reader_db(self):
+    def get_reader_db(self, request: Request = None):
         """
         요청마다 DB 세션 유지 함수
+        reader replica 세션 반환
         :return:
         """
         if self._session_dict['db'] is None:
             raise Exception("must be called 'init_app'")
         db_session = None
         try:
-            db_session = self._session_dict['db']()
+            db_session = self._session_dict[self._select_reader(request)]()
             yield db_session
         finally:
             db_session.close()
@@ -123,10 +287,50 @@ class SQLAlchemy:
     def session_reader(self):
         return self.get_reader_db
 
+    async def get_async_writer_db(self, response: Response = None):
+        """
+        요청마다 비동기 DB 세션 유지 함수
+        :return:
+        """
+        if self._async_session_dict is None:
+            raise Exception("must be called 'init_app' with DB_ASYNC")
+        async with self._async_session_dict['db']() as db_session:
+            db_session.info["response"] = response
+            if self._read_your_writes_sec:
+                event.listen(db_session.sync_session, "after_commit", self._mark_write)
+            yield db_session
+
+    @property
+    def async_session_writer(self):
+        return self.get_async_writer_db
+
+    async def get_async_reader_db(self, request: Request = None):
+        """
+        요청마다 비동기 DB 세션 유지 함수
+        reader replica 세션 반환
+        :return:
+        """
+        if self._async_session_dict is None:
+            raise Exception("must be called 'init_app' with DB_ASYNC")
+        async with self._async_session_dict[self._select_reader(request)]() as db_session:
+            yield db_session
+
+    @property
+    def async_session_reader(self):
+        return self.get_async_reader_db
+
     @property
     def engine(self):
         return self._engine_dict['db']
 
+    @property
+    def reader_engines(self):
+        return [self._engine_dict[key] for key in self._reader_keys]
+
+    @property
+    def async_engine(self):
+        return self._async_engine_dict['db'] if self._async_engine_dict else None
+
 
 db = SQLAlchemy()
 Base = declarative_base()
@@ -0,0 +1,87 @@
+import logging
+
+from sqlalchemy import create_engine, delete, func, inspect, select, UniqueConstraint
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.schema import AddConstraint, CreateColumn
+
+from app.common.consts import MYSQL_USER, MYSQL_PASSWORD, MYSQL_HOST, MYSQL_PORT, MYSQL_DATABASE
+from app.database.conn_sqlalchemy import Base
+from app.database.schema.company import CompanyTag, TagGroupTranslation
+
+
+def _delete_duplicates(conn: Connection, model, *columns):
+    """
+    unique 제약 추가 전 중복 행 삭제
+    컬럼 조합별로 가장 작은 id만 남김
+    """
+    keep_ids = (
+        select(func.min(model.id).label("id"))
+        .group_by(*columns)
+        .subquery()
+    )
+    result = conn.execute(
+        delete(model).where(model.id.not_in(select(keep_ids.c.id)))
+    )
+    if result.rowcount:
+        logging.info("Deleted %s duplicate rows from %s.", result.rowcount, model.__tablename__)
+
+
+def _add_missing_columns(conn: Connection):
+    """
+    스키마에 정의된 컬럼 중 DB에 없는 것만 추가
+    """
+    inspector = inspect(conn)
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {c["name"] for c in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name not in existing:
+                ddl = CreateColumn(column).compile(dialect=conn.dialect)
+                conn.exec_driver_sql(f"ALTER TABLE {table.name} ADD COLUMN {ddl}")
+                logging.info("Added column %s.%s.", table.name, column.name)
+
+
+def _create_missing_indexes(conn: Connection):
+    """
+    스키마에 정의된 인덱스, unique 제약 중 DB에 없는 것만 생성
+    """
+    inspector = inspect(conn)
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {i["name"] for i in inspector.get_indexes(table.name)}
+        existing |= {u["name"] for u in inspector.get_unique_constraints(table.name)}
+
+        for constraint in table.constraints:
+            if isinstance(constraint, UniqueConstraint) and constraint.name and constraint.name not in existing:
+                conn.execute(AddConstraint(constraint))
+                logging.info("Created constraint %s.", constraint.name)
+
+        for index in table.indexes:
+            if index.name not in existing:
+                index.create(conn)
+                logging.info("Created index %s.", index.name)
+
+
+def upgrade(engine: Engine):
+    """
+    기존 DB에 스키마 변경사항 반영
+    여러번 실행해도 같은 결과
+    """
+    with engine.begin() as conn:
+        _add_missing_columns(conn)
+        _delete_duplicates(conn, CompanyTag, CompanyTag.company_id, CompanyTag.tag_group_id)
+        _delete_duplicates(
+            conn, TagGroupTranslation, TagGroupTranslation.tag_group_id, TagGroupTranslation.language_code
+        )
+        _create_missing_indexes(conn)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    upgrade(
+        create_engine(
+            f"mysql+pymysql://{MYSQL_USER}:{MYSQL_PASSWORD}@{MYSQL_HOST}:{MYSQL_PORT}/{MYSQL_DATABASE}?charset=utf8mb4"
+        )
+    )
@@ -0,0 +1,65 @@
+import threading
+import time
+from typing import Any, Dict
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+
+class _TimedPoolMixin:
+    """
+    커넥션 체크아웃 대기 시간 기록
+    엔진이 호출하는 공개 메서드 Pool.connect()를 감싸서 측정 (QueuePool 내부 메서드는 사용하지 않음)
+    빈 커넥션이 없고 overflow도 최대인 상태에서 받은 체크아웃을 대기로 집계
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.max_overflow = kwargs.get("max_overflow", 10)
+        self._stats_lock = threading.Lock()
+        self.checkouts = 0
+        self.waits = 0
+        self.wait_time = 0.0
+        self.max_wait_time = 0.0
+        self.timeouts = 0
+
+    def connect(self):
+        must_wait = self.checkedin() == 0 and -1 < self.max_overflow <= self.overflow()
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            with self._stats_lock:
+                self.timeouts += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._stats_lock:
+                self.checkouts += 1
+                if must_wait:
+                    self.waits += 1
+                    self.wait_time += elapsed
+                    self.max_wait_time = max(self.max_wait_time, elapsed)
+
+    def stats(self) -> Dict[str, Any]:
+        return dict(
+            size=self.size(),
+            checked_in=self.checkedin(),
+            checked_out=self.checkedout(),
+            overflow=max(self.overflow(), 0),
+            max_overflow=self.max_overflow,
+            timeout=self.timeout(),
+            checkouts=self.checkouts,
+            waits=self.waits,
+            wait_time_ms=round(self.wait_time * 1000, 3),
+            max_wait_time_ms=round(self.max_wait_time * 1000, 3),
+            timeouts=self.timeouts,
+        )
+
+
+class TimedQueuePool(_TimedPoolMixin, QueuePool):
+    pass
+
+
+class TimedAsyncAdaptedQueuePool(_TimedPoolMixin, AsyncAdaptedQueuePool):
+    pass
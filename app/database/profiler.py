@@ -0,0 +1,160 @@
+import logging
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# IN (%s, %s, ...) 처럼 파라미터 개수만 다른 쿼리는 같은 형태로 취급
+_IN_PARAMS = re.compile(r"\(\s*(?:%s|\?|:\w+)(?:\s*,\s*(?:%s|\?|:\w+))*\s*\)")
+_IN_ROWS = re.compile(r"\(\s*\(\?\)(?:\s*,\s*\(\?\))*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=1024)
+def statement_shape(statement: str) -> str:
+    """
+    쿼리 형태 (공백, IN 파라미터 개수 정규화)
+    """
+    shape = _IN_PARAMS.sub("(?)", _WHITESPACE.sub(" ", statement).strip())
+    return _IN_ROWS.sub("((?))", shape)
+
+
+class QueryStats:
+    """
+    쿼리 수, DB 시간, 쿼리 형태별 실행 횟수
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.total_time = 0.0
+        self.shapes: Counter = Counter()
+
+    def record(self, statement: str, elapsed: float):
+        self.count += 1
+        self.total_time += elapsed
+        self.shapes[statement_shape(statement)] += 1
+
+    def repeated(self, threshold: int = 2) -> Dict[str, int]:
+        """
+        threshold번 이상 실행된 쿼리 형태
+        """
+        return {shape: n for shape, n in self.shapes.most_common() if n >= threshold}
+
+    def as_dict(self) -> Dict[str, Any]:
+        return dict(
+            count=self.count,
+            time=str(round(self.total_time * 1000, 3)) + "ms",
+            repeated=self.repeated(),
+        )
+
+
+class SqlProfiler:
+    """
+    요청별 SQL 프로파일러
+    엔진 이벤트로 쿼리 수, DB 시간, 반복 쿼리를 요청 단위(ContextVar)로 집계
+    같은 형태의 쿼리가 n_plus_one_threshold번 이상 실행되면 경고 로그
+    """
+
+    def __init__(self, n_plus_one_threshold: int = 10):
+        self.enabled = True
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self._current: ContextVar[Optional[QueryStats]] = ContextVar("sql_profiler_stats", default=None)
+        self._lock = threading.Lock()
+        self._captures: List[QueryStats] = []
+        self._engines = set()
+
+    def init_app(self, engines: List[Engine], **kwargs):
+        """
+        프로파일러 초기화 함수
+        :param engines: 쿼리를 집계할 엔진 (AsyncEngine은 sync_engine)
+        :param kwargs:
+        :return:
+        """
+        self.enabled = kwargs.get("SQL_PROFILER", True)
+        self.n_plus_one_threshold = kwargs.get("SQL_N_PLUS_ONE_THRESHOLD", self.n_plus_one_threshold)
+        if not self.enabled:
+            return
+        for engine in engines:
+            self.attach(engine)
+
+    def attach(self, engine: Engine):
+        if engine in self._engines:
+            return
+        self._engines.add(engine)
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+        event.listen(engine, "handle_error", self._handle_error)
+
+    @contextmanager
+    def track(self, label: str = ""):
+        """
+        요청 단위 집계
+        블록 안에서 실행된 쿼리(스레드풀 포함)를 반환된 QueryStats에 기록
+        """
+        stats = QueryStats()
+        token = self._current.set(stats)
+        try:
+            yield stats
+        finally:
+            self._current.reset(token)
+            repeated = stats.repeated(self.n_plus_one_threshold)
+            if repeated:
+                logging.warning("Possible N+1 queries in %s: %s", label, repeated)
+
+    @contextmanager
+    def capture(self):
+        """
+        컨텍스트와 관계없이 블록 안에서 실행된 모든 쿼리 집계 (테스트용)
+        """
+        stats = QueryStats()
+        with self._lock:
+            self._captures.append(stats)
+        try:
+            yield stats
+        finally:
+            with self._lock:
+                self._captures.remove(stats)
+
+    @contextmanager
+    def assert_max_queries(self, max_count: int):
+        """
+        쿼리 수가 max_count를 넘으면 AssertionError 발생 (테스트용)
+        예) with sql_profiler.assert_max_queries(3):
+                api.get("/companies/원티드랩")
+        """
+        with self.capture() as stats:
+            yield stats
+        if stats.count > max_count:
+            shapes = "\n".join(f"{n} x {shape}" for shape, n in stats.shapes.most_common())
+            raise AssertionError(f"Expected at most {max_count} queries, {stats.count} executed:\n{shapes}")
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        start_times = conn.info.get("query_start_time")
+        if not start_times:
+            return
+        elapsed = time.perf_counter() - start_times.pop()
+        stats = self._current.get()
+        if stats is not None:
+            stats.record(statement, elapsed)
+        if self._captures:
+            with self._lock:
+                for captured in self._captures:
+                    captured.record(statement, elapsed)
+
+    def _handle_error(self, exception_context):
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("query_start_time"):
+            conn.info["query_start_time"].pop()
+
+
+sql_profiler = SqlProfiler()
@@ -1,14 +1,19 @@
 from sqlalchemy import (
-    Column, BigInteger, String, Text, DateTime, ForeignKey
+    Column, BigInteger, String, Text, DateTime, ForeignKey, Index, UniqueConstraint
 )
 from app.database.conn_sqlalchemy import Base
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
+# Text 컬럼 인덱스 prefix 길이 (utf8mb4 기준 767 byte 이내)
+NAME_PREFIX_LENGTH = 191
+
 
 class Company(Base):
     __tablename__ = "company"
     id = Column(BigInteger, primary_key=True)
+    # 회사-태그 연결 변경시 증가 (ETag)
+    version = Column(BigInteger, nullable=False, default=1, server_default="1")
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -18,6 +23,18 @@ class Company(Base):
 
 class CompanyTranslation(Base):
     __tablename__ = "company_translation"
+    __table_args__ = (
+        Index(
+            "ix_company_translation_language_code_name",
+            "language_code", "name",
+            mysql_length={"name": NAME_PREFIX_LENGTH}
+        ),
+        Index(
+            "ix_company_translation_name",
+            "name",
+            mysql_length={"name": NAME_PREFIX_LENGTH}
+        ),
+    )
     id = Column(BigInteger, primary_key=True)
     company_id = Column(BigInteger, ForeignKey("company.id"), nullable=False)
     language_code = Column(String(10), nullable=False)
@@ -29,6 +46,8 @@ class CompanyTranslation(Base):
 class TagGroup(Base):
     __tablename__ = "tag_group"
     id = Column(BigInteger, primary_key=True)
+    # 연결된 회사, 태그명 변경시 증가 (ETag)
+    version = Column(BigInteger, nullable=False, default=1, server_default="1")
     created_at = Column(DateTime, default=datetime.utcnow)
 
     translations = relationship("TagGroupTranslation", back_populates="tag_group")
@@ -37,6 +56,22 @@ class TagGroup(Base):
 
 class TagGroupTranslation(Base):
     __tablename__ = "tag_group_translation"
+    __table_args__ = (
+        UniqueConstraint(
+            "tag_group_id", "language_code",
+            name="uq_tag_group_translation_tag_group_id_language_code"
+        ),
+        Index(
+            "ix_tag_group_translation_language_code_name",
+            "language_code", "name",
+            mysql_length={"name": NAME_PREFIX_LENGTH}
+        ),
+        Index(
+            "ix_tag_group_translation_name",
+            "name",
+            mysql_length={"name": NAME_PREFIX_LENGTH}
+        ),
+    )
     id = Column(BigInteger, primary_key=True)
     tag_group_id = Column(BigInteger, ForeignKey("tag_group.id"), nullable=False)
     language_code = Column(String(10), nullable=False)
@@ -47,6 +82,12 @@ class TagGroupTranslation(Base):
 
 class CompanyTag(Base):
     __tablename__ = "company_tag"
+    __table_args__ = (
+        UniqueConstraint(
+            "company_id", "tag_group_id",
+            name="uq_company_tag_company_id_tag_group_id"
+        ),
+    )
     id = Column(BigInteger, primary_key=True)
     company_id = Column(BigInteger, ForeignKey("company.id"), nullable=False)
     tag_group_id = Column(BigInteger, ForeignKey("tag_group.id"), nullable=False)
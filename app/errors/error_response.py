@@ -11,6 +11,7 @@ class ErrorResponseModel(BaseModel):
 
 error_response_map: Dict[str, ErrorResponseModel] = {
     "ERR50001": ErrorResponseModel(msg="Internal Server Error", code="ERR50001", status_code="500"),
+    "ERR50301": ErrorResponseModel(msg="Service Unavailable Error", code="ERR50301", status_code="503"),
     "ERR40001": ErrorResponseModel(msg="Bad Request Error", code="ERR40002", status_code="400"),
     "ERR40101": ErrorResponseModel(msg="Unauthorized Error", code="ERR40101", status_code="401"),
     "ERR40301": ErrorResponseModel(msg="Forbidden Error", code="ERR40301", status_code="403"),
@@ -5,6 +5,7 @@ class StatusCode:
     HTTP_204 = 204
     HTTP_500 = 500
     HTTP_501 = 501
+    HTTP_503 = 503
     HTTP_400 = 400
     HTTP_401 = 401
     HTTP_403 = 403
@@ -20,6 +21,8 @@ class APIException(Exception):
     code: str
     ex: Exception
     data: dict
+    # 에러 응답에 추가할 헤더
+    headers: dict = None
 
     def __init__(
         self,
@@ -178,4 +181,16 @@ class ForbiddenEx(APIException):
             code="ERR40301" if code is None else code,
             ex=ex,
             data=data,
-        )
\ No newline at end of file
+        )
+
+
+class ServiceUnavailableEx(APIException):
+    def __init__(self, ex: Exception = None, code: str = None, data: dict = None, retry_after: int = 1):
+        super().__init__(
+            status_code=StatusCode.HTTP_503,
+            msg=error_response_map.get("ERR50301").msg if code is None else error_response_map.get(code).msg,
+            code="ERR50301" if code is None else code,
+            ex=ex,
+            data=data,
+        )
+        self.headers = {"Retry-After": str(retry_after)}
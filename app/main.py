@@ -1,15 +1,30 @@
+import logging
+import time
+
+_import_started = time.perf_counter()
+
 import uvicorn
-from fastapi import FastAPI
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import Depends, FastAPI
 from starlette.middleware.cors import CORSMiddleware
 
-from app.middlewares.access_validator import access_control
+from app.middlewares.access_validator import AccessControlMiddleware
 from app.middlewares.trusted_hosts import TrustedHostMiddleware
-from app.routes.v1 import company
+from app.routes.v1 import company, company_async, company_import, company_tag_batch, internal
 from app.database.conn_sqlalchemy import db, Base
+from app.services.autocomplete import autocomplete_index
+from app.utils.boot_profile import BootTimer, time_startup_hooks
+from app.utils.cache import cache
+from app.utils.concurrency import concurrency_limiter
+from app.utils.json_response import fast_json
+from app.utils.logger_fastapi import access_log
+from app.utils.metrics import metrics, threadpool_gauges
+from app.utils.singleflight import single_flight
+from app.utils.tracing import tracing
 from app.common.config import conf
 from dataclasses import asdict
 
+IMPORT_SEC = time.perf_counter() - _import_started
+
 description = """
 Choco API Swagger. 🚀
 """
@@ -20,6 +35,7 @@ def create_app():
     앱 함수 실행
     :return:
     """
+    timer = BootTimer()
     app = FastAPI(
         title="Choco API v1.0",
         description=description,
@@ -27,13 +43,37 @@ def create_app():
     )
     c = conf()
     conf_dict = asdict(c)
-    db.init_app(app, **conf_dict)
-    # 데이터 베이스 이니셜라이즈
-    Base.metadata.create_all(db.engine)
+    with timer.phase("db"):
+        db.init_app(app, **conf_dict)
+    # 데이터 베이스 이니셜라이즈 (DB_CREATE_ALL인 경우만, 운영 스키마는 migration으로 관리)
+    if c.DB_CREATE_ALL:
+        with timer.phase("create_all"):
+            Base.metadata.create_all(db.engine)
+    # 캐시 이니셜라이즈
+    with timer.phase("cache"):
+        cache.init_app(app, **conf_dict)
+    # 접근 로그 이니셜라이즈
+    access_log.init_app(app, **conf_dict)
+    # 동일 조회 요청 병합
+    single_flight.init_app(app, **conf_dict)
+    # 라우트별 동시 실행 한도
+    concurrency_limiter.init_app(app, **conf_dict)
+    # 목록 응답 빠른 직렬화
+    fast_json.init_app(app, **conf_dict)
+    # 메트릭 이니셜라이즈
+    metrics.init_app(app, **conf_dict)
+    metrics.register_gauges(db.pool_gauges)
+    metrics.register_gauges(cache.metric_gauges)
+    metrics.register_gauges(threadpool_gauges)
+    metrics.register_gauges(concurrency_limiter.metric_gauges)
+    # 트레이싱 이니셜라이즈
+    with timer.phase("tracing"):
+        tracing.init_app(app, **conf_dict)
+    # 회사명 자동완성 색인
+    autocomplete_index.init_app(app, db.get_background_writer_db, **conf_dict)
 
     # 미들웨어 정의
-    app.add_middleware(middleware_class=BaseHTTPMiddleware,
-                       dispatch=access_control)
+    app.add_middleware(AccessControlMiddleware, internal_networks=c.INTERNAL_ALLOW_NETWORKS)
     app.add_middleware(
         CORSMiddleware,
         allow_origins=conf().ALLOW_SITE,
@@ -47,13 +87,34 @@ def create_app():
         except_path=["/health"]
     )
 
-    # 라우터 정의
-    app.include_router(company.router, tags=['회사'])
-    
+    # 라우터 정의 (서비스 라우터는 DB 커넥션을 기다리기 전에 동시 실행 한도 확인)
+    limited = [Depends(concurrency_limiter)]
+    if c.DB_ASYNC:
+        app.include_router(company_async.router, tags=['회사'], dependencies=limited)
+    else:
+        app.include_router(company.router, tags=['회사'], dependencies=limited)
+    # 일괄 처리 라우트는 처리 시간이 본문 크기에 비례하므로 별도 지연 기준 사용
+    bulk_limited = [Depends(concurrency_limiter.bulk)]
+    app.include_router(company_import.router, tags=['회사'], dependencies=bulk_limited)
+    app.include_router(company_tag_batch.router, tags=['회사'], dependencies=bulk_limited)
+    app.include_router(internal.router, tags=['내부'])
+
+    # 워커별 startup 훅 소요 시간 기록 (재시작된 워커는 create_app 없이 startup 훅만 실행)
+    time_startup_hooks(app)
+
+    logging.info("App created in %s, imports %.1fms", timer.report(), IMPORT_SEC * 1000)
     return app
 
 
-app = create_app()
+def __getattr__(name):
+    """
+    app은 처음 사용할 때 생성 (gunicorn "app.main:create_app()"으로 실행시 중복 생성 방지)
+    """
+    if name == "app":
+        global app
+        app = create_app()
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == "__main__":
@@ -1,81 +1,161 @@
+import ipaddress
 import time
 import re
 import sys
+import typing
 
 import sqlalchemy.exc
-from aws_xray_sdk.core.async_context import AsyncContext
-from opentelemetry.trace import Status, StatusCode
 
+from starlette.datastructures import Headers
 from starlette.requests import Request
 from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from app.common.consts import EXCEPT_PATH_LIST, EXCEPT_PATH_REGEX
-from app.errors.exceptions import APIException, SqlFailureEx, UnauthorizedEx
+from app.common.consts import EXCEPT_PATH_LIST, EXCEPT_PATH_REGEX, INTERNAL_PATH_PREFIX, env
+from app.database.profiler import sql_profiler
+from app.errors.exceptions import APIException, ForbiddenEx, SqlFailureEx
 
-from app.utils.date_utils import D
 from app.utils.logger_fastapi import api_logger
-from os import environ
-from opentelemetry import trace
-
-
-async def access_control(request: Request, call_next):
-    request.state.req_time = D.datetime()
-    request.state.start = time.time()
-    request.state.inspect = None
-    request.state.user = None
-    request.state.service = None
-    ip = request.headers["x-forwarded-for"] if "x-forwarded-for" in request.headers.keys() else request.client.host if request.client is not None else "localhost"
-    request.state.ip = ip.split(",")[0] if "," in ip else ip
-    headers = request.headers
-    url = request.url.path
-    if await url_pattern_check(url, EXCEPT_PATH_REGEX) or url in EXCEPT_PATH_LIST:
-        response = await call_next(request)
+from app.utils.metrics import metrics
+from app.utils.tracing import tracing
+
+metrics.describe("http_requests_total", "Total HTTP requests by route and status.")
+metrics.describe("http_request_duration_seconds", "HTTP request latency by route.")
+
+
+class AccessControlMiddleware:
+    """
+    요청 로그, 트레이싱, 메트릭, 에러 응답 처리 ASGI 미들웨어
+    예외 경로는 생성시 set, 정규식으로 미리 컴파일
+    메트릭 route 라벨은 매칭된 경로 템플릿 (매칭 실패시 unmatched)
+    내부 경로(/internal)는 internal_networks에서 프록시를 거치지 않고 직접 들어온 요청만 허용 (그 외 403)
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        except_path: typing.Sequence[str] = EXCEPT_PATH_LIST,
+        except_path_regex: str = EXCEPT_PATH_REGEX,
+        internal_networks: typing.Sequence[str] = ("127.0.0.0/8", "::1/128"),
+    ) -> None:
+        self.app = app
+        self.except_path = frozenset(except_path)
+        self.except_path_regex = re.compile(except_path_regex)
+        self.internal_networks = [ipaddress.ip_network(network) for network in internal_networks]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope, receive)
+        request.state.start = time.time()
+        request.state.inspect = None
+        request.state.user = None
+        request.state.service = None
+        ip = Headers(scope=scope).get("x-forwarded-for")
+        if ip is None:
+            ip = request.client.host if request.client is not None else "localhost"
+        request.state.ip = ip.split(",")[0] if "," in ip else ip
+        url = scope["path"]
+        status = _StatusRecorder(send)
+        start = time.perf_counter()
+        try:
+            with sql_profiler.track(f"{request.method} {url}") as sql_stats:
+                request.state.sql_stats = sql_stats
+                if url in self.except_path or self.except_path_regex.match(url):
+                    await self._call_exempt(request, url, status)
+                else:
+                    await self._call_traced(request, url, ip, status)
+        finally:
+            route = scope.get("route")
+            labels = dict(method=request.method, route=getattr(route, "path", "unmatched"))
+            metrics.observe("http_request_duration_seconds", labels, time.perf_counter() - start)
+            metrics.inc("http_requests_total", dict(labels, status=str(status.status_code or 500)))
+
+    async def _call_exempt(self, request: Request, url: str, status: "_StatusRecorder"):
+        await self.app(request.scope, request.receive, status.send)
         if url != "/":
-            await api_logger(request=request, response=response)
-        return response
-
-    tracer = trace.get_tracer(__name__)
-    with tracer.start_as_current_span(f"{request.method} {url}") as span:
-        span.set_attribute("http.method", request.method)
-        span.set_attribute("http.url", str(request.url))
-        span.set_attribute("environment", environ.get("API_ENV"))
-        span.set_attribute("client.ip", ip)
+            await api_logger(request=request, status_code=status.status_code)
+
+    async def _call_traced(self, request: Request, url: str, ip: str, status: "_StatusRecorder"):
+        with tracing.start_span(f"{request.method} {url}", request.headers) as span:
+            if span.is_recording():
+                span.set_attribute("http.method", request.method)
+                span.set_attribute("http.url", str(request.url))
+                span.set_attribute("environment", env)
+                span.set_attribute("client.ip", ip)
+            try:
+                if url.startswith(INTERNAL_PATH_PREFIX) and not self.is_internal(request):
+                    raise ForbiddenEx()
+                await self.app(request.scope, request.receive, status.send)
+                span.set_attribute("http.status_code", status.status_code)
+                tracing.set_ok(span)
+                set_sql_attributes(span, request.state.sql_stats)
+                await api_logger(request=request, status_code=status.status_code)
+            except Exception as e:
+                if status.started:
+                    raise
+                exc_type, exc_value, exc_traceback = sys.exc_info()
+
+                # traceback의 최상단 프레임 가져오기
+                while exc_traceback.tb_next:
+                    exc_traceback = exc_traceback.tb_next
+                frame = exc_traceback.tb_frame
+
+                # frame을 request.state에 저장
+                request.state.inspect = frame
+                error = await exception_handler(e)
+                error_dict = dict(msg=error.msg, data=error.data, code=error.code)
+                response = JSONResponse(status_code=error.status_code, content=error_dict, headers=error.headers)
+
+                span.set_attribute("http.status_code", response.status_code)
+                if 400 <= error.status_code < 500:
+                    span.set_attribute("error.severity", "WARNING")
+                else:
+                    span.set_attribute("error.severity", "ERROR")
+                    tracing.set_error(span, "Server error")
+                span.record_exception(e)
+                set_sql_attributes(span, request.state.sql_stats)
+
+                await api_logger(request=request, error=error)
+                await response(request.scope, request.receive, status.send)
+
+    def is_internal(self, request: Request) -> bool:
+        """
+        내부망에서 직접 들어온 요청 여부
+        x-forwarded-for는 클라이언트가 임의로 보낼 수 있으므로 접속한 주소만 확인, 프록시(로드밸런서)를 거친 요청은 거부
+        """
+        if request.client is None or "x-forwarded-for" in request.headers:
+            return False
         try:
-            response = await call_next(request)
-            span.set_attribute("http.status_code", response.status_code)
-            span.set_status(Status(StatusCode.OK))
-            await api_logger(request=request, response=response)
-        except Exception as e:
-            exc_type, exc_value, exc_traceback = sys.exc_info()
-    
-            # traceback의 최상단 프레임 가져오기
-            while exc_traceback.tb_next:
-                exc_traceback = exc_traceback.tb_next
-            frame = exc_traceback.tb_frame
-    
-            # frame을 request.state에 저장
-            request.state.inspect = frame
-            error = await exception_handler(e)
-            error_dict = dict(msg=error.msg, data=error.data, code=error.code)
-            response = JSONResponse(status_code=error.status_code, content=error_dict)
-
-            span.set_attribute("http.status_code", response.status_code)
-            if 400 <= error.status_code < 500:
-                span.set_attribute("error.severity", "WARNING")
-            else:
-                span.set_attribute("error.severity", "ERROR")
-                span.set_status(Status(StatusCode.ERROR, description="Server error"))
-            span.record_exception(e)
-
-            await api_logger(request=request, error=error)
-    return response
-
-
-async def url_pattern_check(path, pattern):
-    result = re.match(pattern, path)
-    if result:
-        return True
-    return False
+            address = ipaddress.ip_address(request.client.host)
+        except ValueError:
+            return False
+        return any(address in network for network in self.internal_networks)
+
+
+class _StatusRecorder:
+    """
+    응답 상태 코드 기록용 send 래퍼
+    """
+
+    def __init__(self, send: Send):
+        self._send = send
+        self.started = False
+        self.status_code = None
+
+    async def send(self, message: Message):
+        if message["type"] == "http.response.start":
+            self.started = True
+            self.status_code = message["status"]
+        await self._send(message)
+
+
+def set_sql_attributes(span, sql_stats):
+    span.set_attribute("db.query_count", sql_stats.count)
+    span.set_attribute("db.time_ms", round(sql_stats.total_time * 1000, 3))
+    span.set_attribute("db.repeated_statements", len(sql_stats.repeated()))
 
 
 async def exception_handler(error: Exception):
@@ -28,7 +28,10 @@ class TrustedHostMiddleware:
         self.allowed_hosts = list(allowed_hosts)
         self.allow_any = "*" in allowed_hosts
         self.www_redirect = www_redirect
-        self.except_path = list(except_path)
+        # 요청마다 패턴을 순회하지 않도록 일치 host, 와일드카드 suffix, 예외 경로를 set으로 준비
+        self.exact_hosts = frozenset(pattern for pattern in allowed_hosts if not pattern.startswith("*"))
+        self.wildcard_suffixes = frozenset(pattern[1:] for pattern in allowed_hosts if pattern.startswith("*."))
+        self.except_path = frozenset(except_path) if allowed_hosts else frozenset()
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         if self.allow_any or scope["type"] not in ("http", "websocket",):  # pragma: no cover
@@ -37,23 +40,10 @@ class TrustedHostMiddleware:
 
         headers = Headers(scope=scope)
         host = headers.get("host", "").split(":")[0]
-        is_valid_host = False
-        found_www_redirect = False
-        for pattern in self.allowed_hosts:
-            if (
-                host == pattern
-                or (pattern.startswith("*") and host.endswith(pattern[1:]))
-                or URL(scope=scope).path in self.except_path
-            ):
-                is_valid_host = True
-                break
-            elif "www." + host == pattern:
-                found_www_redirect = True
-
-        if is_valid_host:
+        if self.is_valid_host(host) or scope.get("root_path", "") + scope["path"] in self.except_path:
             await self.app(scope, receive, send)
         else:
-            if found_www_redirect and self.www_redirect:
+            if self.www_redirect and "www." + host in self.exact_hosts:
                 url = URL(scope=scope)
                 redirect_url = url.replace(netloc="www." + url.netloc)
                 response = RedirectResponse(url=str(redirect_url))  # type: Response
@@ -61,3 +51,15 @@ class TrustedHostMiddleware:
                 response = PlainTextResponse("Invalid host header", status_code=400)
 
             await response(scope, receive, send)
+
+    def is_valid_host(self, host: str) -> bool:
+        if host in self.exact_hosts:
+            return True
+        if self.wildcard_suffixes:
+            # a.b.example.com -> .b.example.com, .example.com, .com 순서로 확인
+            index = host.find(".")
+            while index != -1:
+                if host[index:] in self.wildcard_suffixes:
+                    return True
+                index = host.find(".", index + 1)
+        return False
@@ -17,3 +17,12 @@ class NewCompanyRequest(FromAttrModel):
     """
     company_name: Dict[str, str] = Field(title="회사명 정보")
     tags: List[TagName] = Field(title="태그 정보 리스트")
+
+
+class CompanyTagOperation(FromAttrModel):
+    """
+    회사 태그 일괄 변경 항목
+    """
+    company_name: str = Field(title="회사명")
+    add_tags: List[TagName] = Field(default=[], title="추가할 태그 정보 리스트")
+    remove_tags: List[str] = Field(default=[], title="삭제할 태그명 리스트")
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 
 from pydantic import Field
 from app.models.api.v1.common import FromAttrModel
@@ -52,4 +52,34 @@ class CompanyItemListResponse(FromAttrModel):
     """
     회사명 리스트
     """
-    data: List[CompanyItemResponse] = Field(title="회사명 리스트")
\ No newline at end of file
+    data: List[CompanyItemResponse] = Field(title="회사명 리스트")
+
+
+class CompanyImportResponse(FromAttrModel):
+    """
+    회사 일괄 등록 결과
+    """
+    imported: int = Field(title="등록된 회사 수")
+    failed: int = Field(title="실패한 회사 수")
+    duplicated: int = Field(title="이미 등록되어 건너뛴 회사 수")
+    elapsed_sec: float = Field(title="소요 시간(초)")
+    per_sec: float = Field(title="초당 등록 수")
+
+
+class CompanyTagOperationResponse(FromAttrModel):
+    """
+    회사 태그 일괄 변경 항목별 결과
+    """
+    company_name: str = Field(title="회사명")
+    added: int = Field(default=0, title="추가된 태그 수")
+    removed: int = Field(default=0, title="삭제된 태그 수")
+    code: Optional[str] = Field(default=None, title="실패시 에러 코드")
+
+
+class CompanyTagBatchResponse(FromAttrModel):
+    """
+    회사 태그 일괄 변경 결과
+    """
+    succeeded: int = Field(title="성공한 항목 수")
+    failed: int = Field(title="실패한 항목 수")
+    data: List[CompanyTagOperationResponse] = Field(title="항목별 결과")
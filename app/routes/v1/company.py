@@ -1,6 +1,7 @@
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, status, Depends, Form, UploadFile, File, Request, Body, Query, Header, Path
+from fastapi import APIRouter, status, Depends, Form, UploadFile, File, Request, Body, Query, Header, Path, \
+    Response
 
 from sqlalchemy.orm import Session
 from app.database.conn_sqlalchemy import db
@@ -8,8 +9,10 @@ from app.models.api.v1.company.request import NewCompanyRequest, TagName
 from app.models.api.v1.company.response import AutoCompleteCompanyListResponse, CompanyDetailDataResponse, \
     CompanyResponse, CompanyItemListResponse
 from app.services.api.v1.company import get_autocomplete_company_name, get_company_detail, create_company, \
-    search_company_by_tag_name, add_tags_to_company, delete_company_tag
+    search_company_by_tag_name, add_tags_to_company, delete_company_tag, company_detail_etag, tag_search_etag
 
+from app.utils.etag import etag_headers, etag_matches, not_modified
+from app.utils.json_response import fast_json
 from app.utils.parse_utils import generate_error_responses
 
 router = APIRouter(prefix='')
@@ -18,45 +21,63 @@ router = APIRouter(prefix='')
 @router.get(
     path="/search",
     response_model=AutoCompleteCompanyListResponse,
-    responses=generate_error_responses("ERR50001"),
+    responses=generate_error_responses("ERR50001", "ERR50301"),
     status_code=status.HTTP_200_OK
 )
 def api_get_autocomplete_company(
     query: str = Query(..., min_length=1),
+    limit: int = Query(default=10, ge=1, le=100),
+    offset: int = Query(default=0, ge=0),
+    ranked: bool = Query(default=False, description="일치 > 접두어 > 부분 일치, 짧은 회사명 순 정렬"),
     x_wanted_language: str = Header(default="ko"),
-    session: Session = Depends(db.get_writer_db)
+    session: Session = Depends(db.get_reader_db)
 ) -> AutoCompleteCompanyListResponse:
     """
     회사명 자동완성
     """
-    return get_autocomplete_company_name(query=query, language_code=x_wanted_language, session=session)
+    return fast_json.response(get_autocomplete_company_name(
+        query=query,
+        language_code=x_wanted_language,
+        session=session,
+        limit=limit,
+        offset=offset,
+        ranked=ranked
+    ))
 
 
 @router.get(
     path="/companies/{company_name}",
     response_model=CompanyDetailDataResponse,
-    responses=generate_error_responses("ERR50001", "ERR40401"),
+    responses=generate_error_responses("ERR50001", "ERR50301", "ERR40401"),
     status_code=status.HTTP_200_OK
 )
 def api_get_company_detail(
     company_name: str,
+    response: Response,
     x_wanted_language: str = Header(default="ko"),
-    session: Session = Depends(db.get_writer_db)
+    if_none_match: Optional[str] = Header(default=None),
+    session: Session = Depends(db.get_reader_db)
 ) -> CompanyDetailDataResponse:
     """
     회사 이름으로 회사 검색
+    If-None-Match가 ETag와 같으면 본문 없이 304 응답
     """
+    etag = company_detail_etag(company_name=company_name, language_code=x_wanted_language, session=session)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    response.headers.update(etag_headers(etag))
     return get_company_detail(
         company_name=company_name,
         language_code=x_wanted_language,
-        session=session
+        session=session,
+        version=etag
     )
 
 
 @router.post(
     "/companies",
     response_model=CompanyResponse,
-    responses=generate_error_responses("ERR50001", "ERR40001"),
+    responses=generate_error_responses("ERR50001", "ERR50301", "ERR40001"),
     status_code=status.HTTP_200_OK
 )
 def api_create_company(
@@ -77,28 +98,37 @@ def api_create_company(
 @router.get(
     "/tags",
     response_model=CompanyItemListResponse,
-    responses=generate_error_responses("ERR50001", "ERR40401"),
+    responses=generate_error_responses("ERR50001", "ERR50301", "ERR40401"),
     status_code=status.HTTP_200_OK
 )
 def api_search_company_by_tag_name(
+    response: Response,
     query: str = Query(..., min_length=1),
     x_wanted_language: str = Header(default="ko"),
-    session: Session = Depends(db.get_writer_db)
+    if_none_match: Optional[str] = Header(default=None),
+    session: Session = Depends(db.get_reader_db)
 ):
     """
     태그명으로 회사 검색
+    If-None-Match가 ETag와 같으면 본문 없이 304 응답
     """
-    return search_company_by_tag_name(
+    etag = tag_search_etag(query=query, language_code=x_wanted_language, session=session)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    headers = etag_headers(etag)
+    response.headers.update(headers)
+    return fast_json.response(search_company_by_tag_name(
         query=query,
         language_code=x_wanted_language,
-        session=session
-    )
+        session=session,
+        version=etag
+    ), headers=headers)
 
 
 @router.put(
     "/companies/{company_name}/tags",
     response_model=CompanyResponse,
-    responses=generate_error_responses("ERR50001", "ERR40401", "ERR40001"),
+    responses=generate_error_responses("ERR50001", "ERR50301", "ERR40401", "ERR40001"),
     status_code=status.HTTP_200_OK
 )
 def api_add_tags_to_company(
@@ -121,7 +151,7 @@ def api_add_tags_to_company(
 @router.delete(
     "/companies/{company_name}/tags/{tag_name}",
     response_model=CompanyResponse,
-    responses=generate_error_responses("ERR50001", "ERR40401"),
+    responses=generate_error_responses("ERR50001", "ERR50301", "ERR40401"),
     status_code=status.HTTP_200_OK
 )
 def api_delete_company_tag(
@@ -0,0 +1,172 @@
+from typing import List, Optional
+
+from fastapi import APIRouter, status, Depends, Query, Header, Path, Response
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database.conn_sqlalchemy import db
+from app.models.api.v1.company.request import NewCompanyRequest, TagName
+from app.models.api.v1.company.response import AutoCompleteCompanyListResponse, CompanyDetailDataResponse, \
+    CompanyResponse, CompanyItemListResponse
+from app.services.api.v1.company import get_autocomplete_company_name_async, get_company_detail_async, \
+    create_company_async, search_company_by_tag_name_async, add_tags_to_company_async, delete_company_tag_async, \
+    company_detail_etag_async, tag_search_etag_async
+
+from app.utils.etag import etag_headers, etag_matches, not_modified
+from app.utils.json_response import fast_json
+from app.utils.parse_utils import generate_error_responses
+
+# DB_ASYNC 설정시 company.router 대신 사용
+router = APIRouter(prefix='')
+
+
+@router.get(
+    path="/search",
+    response_model=AutoCompleteCompanyListResponse,
+    responses=generate_error_responses("ERR50001", "ERR50301"),
+    status_code=status.HTTP_200_OK
+)
+async def api_get_autocomplete_company(
+    query: str = Query(..., min_length=1),
+    limit: int = Query(default=10, ge=1, le=100),
+    offset: int = Query(default=0, ge=0),
+    ranked: bool = Query(default=False, description="일치 > 접두어 > 부분 일치, 짧은 회사명 순 정렬"),
+    x_wanted_language: str = Header(default="ko"),
+    session: AsyncSession = Depends(db.get_async_reader_db)
+) -> AutoCompleteCompanyListResponse:
+    """
+    회사명 자동완성
+    """
+    return fast_json.response(await get_autocomplete_company_name_async(
+        query=query,
+        language_code=x_wanted_language,
+        session=session,
+        limit=limit,
+        offset=offset,
+        ranked=ranked
+    ))
+
+
+@router.get(
+    path="/companies/{company_name}",
+    response_model=CompanyDetailDataResponse,
+    responses=generate_error_responses("ERR50001", "ERR50301", "ERR40401"),
+    status_code=status.HTTP_200_OK
+)
+async def api_get_company_detail(
+    company_name: str,
+    response: Response,
+    x_wanted_language: str = Header(default="ko"),
+    if_none_match: Optional[str] = Header(default=None),
+    session: AsyncSession = Depends(db.get_async_reader_db)
+) -> CompanyDetailDataResponse:
+    """
+    회사 이름으로 회사 검색
+    If-None-Match가 ETag와 같으면 본문 없이 304 응답
+    """
+    etag = await company_detail_etag_async(company_name=company_name, language_code=x_wanted_language, session=session)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    response.headers.update(etag_headers(etag))
+    return await get_company_detail_async(
+        company_name=company_name,
+        language_code=x_wanted_language,
+        session=session,
+        version=etag
+    )
+
+
+@router.post(
+    "/companies",
+    response_model=CompanyResponse,
+    responses=generate_error_responses("ERR50001", "ERR50301", "ERR40001"),
+    status_code=status.HTTP_200_OK
+)
+async def api_create_company(
+    body: NewCompanyRequest,
+    x_wanted_language: str = Header(default="ko"),
+    session: AsyncSession = Depends(db.get_async_writer_db)
+) -> CompanyResponse:
+    """
+    새로운 회사 추가
+    """
+    return await create_company_async(
+        body=body,
+        language_code=x_wanted_language,
+        session=session
+    )
+
+
+@router.get(
+    "/tags",
+    response_model=CompanyItemListResponse,
+    responses=generate_error_responses("ERR50001", "ERR50301", "ERR40401"),
+    status_code=status.HTTP_200_OK
+)
+async def api_search_company_by_tag_name(
+    response: Response,
+    query: str = Query(..., min_length=1),
+    x_wanted_language: str = Header(default="ko"),
+    if_none_match: Optional[str] = Header(default=None),
+    session: AsyncSession = Depends(db.get_async_reader_db)
+):
+    """
+    태그명으로 회사 검색
+    If-None-Match가 ETag와 같으면 본문 없이 304 응답
+    """
+    etag = await tag_search_etag_async(query=query, language_code=x_wanted_language, session=session)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    headers = etag_headers(etag)
+    response.headers.update(headers)
+    return fast_json.response(await search_company_by_tag_name_async(
+        query=query,
+        language_code=x_wanted_language,
+        session=session,
+        version=etag
+    ), headers=headers)
+
+
+@router.put(
+    "/companies/{company_name}/tags",
+    response_model=CompanyResponse,
+    responses=generate_error_responses("ERR50001", "ERR50301", "ERR40401", "ERR40001"),
+    status_code=status.HTTP_200_OK
+)
+async def api_add_tags_to_company(
+    company_name: str = Path(...),
+    tags: List[TagName] = [],
+    x_wanted_language: str = Header(default="ko"),
+    session: AsyncSession = Depends(db.get_async_writer_db)
+) -> CompanyResponse:
+    """
+    회사 태그 정보 추가
+    """
+    return await add_tags_to_company_async(
+        company_name=company_name,
+        tags=tags,
+        language_code=x_wanted_language,
+        session=session
+    )
+
+
+@router.delete(
+    "/companies/{company_name}/tags/{tag_name}",
+    response_model=CompanyResponse,
+    responses=generate_error_responses("ERR50001", "ERR50301", "ERR40401"),
+    status_code=status.HTTP_200_OK
+)
+async def api_delete_company_tag(
+    company_name: str = Path(...),
+    tag_name: str = Path(...),
+    x_wanted_language: str = Header(default="ko"),
+    session: AsyncSession = Depends(db.get_async_writer_db)
+) -> CompanyResponse:
+    """
+    회사 태그 정보 삭제
+    """
+    return await delete_company_tag_async(
+        company_name=company_name,
+        tag_name=tag_name,
+        language_code=x_wanted_language,
+        session=session
+    )
@@ -0,0 +1,42 @@
+from fastapi import APIRouter, status, Depends, Query, Request
+from starlette.concurrency import run_in_threadpool
+
+from sqlalchemy.orm import Session
+from app.database.conn_sqlalchemy import db
+from app.models.api.v1.company.response import CompanyImportResponse
+from app.services.api.v1.company_import import import_companies, read_csv, read_jsonl, stream_lines
+
+from app.utils.parse_utils import generate_error_responses
+
+router = APIRouter(prefix='')
+
+
+@router.post(
+    "/companies/import",
+    response_model=CompanyImportResponse,
+    responses=generate_error_responses("ERR50001", "ERR50301"),
+    status_code=status.HTTP_200_OK,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/x-ndjson": {"schema": {"type": "string", "format": "binary"}},
+                "text/csv": {"schema": {"type": "string", "format": "binary"}},
+            },
+        }
+    },
+)
+async def api_import_companies(
+    request: Request,
+    batch_size: int = Query(default=1000, ge=1, le=10000),
+    session: Session = Depends(db.get_writer_db)
+) -> CompanyImportResponse:
+    """
+    회사 일괄 등록
+    요청 본문(JSONL, Content-Type이 text/csv이면 CSV)을 받는 대로 한줄씩 읽어서 batch_size 단위로 등록
+    multipart 업로드와 달리 본문을 임시 파일에 저장하지 않음
+    """
+    reader = read_csv if request.headers.get("content-type", "").startswith("text/csv") else read_jsonl
+    return await run_in_threadpool(
+        import_companies, reader(stream_lines(request.stream())), session, batch_size=batch_size
+    )
@@ -0,0 +1,31 @@
+from typing import List
+
+from fastapi import APIRouter, status, Depends, Body, Query
+
+from sqlalchemy.orm import Session
+from app.database.conn_sqlalchemy import db
+from app.models.api.v1.company.request import CompanyTagOperation
+from app.models.api.v1.company.response import CompanyTagBatchResponse
+from app.services.api.v1.company_tag_batch import batch_update_company_tags
+
+from app.utils.parse_utils import generate_error_responses
+
+router = APIRouter(prefix='')
+
+
+@router.post(
+    "/companies/tags/batch",
+    response_model=CompanyTagBatchResponse,
+    responses=generate_error_responses("ERR50001", "ERR50301"),
+    status_code=status.HTTP_200_OK
+)
+def api_batch_update_company_tags(
+    operations: List[CompanyTagOperation] = Body(...),
+    batch_size: int = Query(default=1000, ge=1, le=10000),
+    session: Session = Depends(db.get_writer_db)
+) -> CompanyTagBatchResponse:
+    """
+    회사 태그 일괄 추가, 삭제
+    항목별 결과는 입력 순서대로 반환
+    """
+    return batch_update_company_tags(operations, session, batch_size=batch_size)
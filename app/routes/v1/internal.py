@@ -0,0 +1,46 @@
+from typing import Any, Dict
+
+from fastapi import APIRouter, status
+from fastapi.responses import PlainTextResponse
+
+from app.database.conn_sqlalchemy import db
+from app.utils.cache import cache
+from app.utils.metrics import metrics
+
+router = APIRouter(prefix='/internal')
+
+
+@router.get(
+    path="/cache",
+    status_code=status.HTTP_200_OK
+)
+def api_get_cache_stats() -> Dict[str, Any]:
+    """
+    캐시 적중률 조회
+    """
+    return cache.stats()
+
+
+@router.get(
+    path="/db-pool",
+    status_code=status.HTTP_200_OK
+)
+def api_get_db_pool_stats() -> Dict[str, Any]:
+    """
+    워커별 DB 커넥션 풀 상태 조회
+    """
+    return db.pool_stats()
+
+
+@router.get(
+    path="/metrics",
+    status_code=status.HTTP_200_OK,
+    response_class=PlainTextResponse,
+)
+def api_get_metrics() -> PlainTextResponse:
+    """
+    Prometheus 메트릭 조회
+    요청 수, 응답 시간 histogram, 커넥션 풀, 캐시, 스레드풀 상태
+    다중 워커 모드는 워커별 파일을 읽고 쓰므로 sync 핸들러(스레드풀)로 실행
+    """
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
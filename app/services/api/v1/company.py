@@ -1,97 +1,415 @@
-from typing import List
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
-from sqlalchemy import select, distinct, delete
-from sqlalchemy.orm import Session
+from sqlalchemy import select, delete, func, case, insert, and_, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, aliased
 from app.database.schema.company import CompanyTranslation, CompanyTag, TagGroupTranslation, Company, TagGroup
 from app.errors.exceptions import NotFoundEx, BadRequestEx
+from app.services.autocomplete import autocomplete_index
+from app.utils.cache import cache, cache_key
+from app.utils.etag import make_etag
+from app.utils.singleflight import single_flight
 from app.models.api.v1.company.request import NewCompanyRequest, TagName
-from app.models.api.v1.company.response import AutoCompleteCompanyListResponse, AutoCompleteCompanyResponse, \
-    CompanyDetailDataResponse, CompanyDetailResponse, CompanyResponse, CompanyItemResponse, CompanyItemListResponse
+from app.models.api.v1.company.response import AutoCompleteCompanyListResponse, CompanyDetailDataResponse, \
+    CompanyDetailResponse, CompanyResponse, CompanyItemListResponse
+
+# 회사명 추가시 무효화
+COMPANY_NAMES_CACHE_TAG = "company_names"
+# 회사-태그 연결 변경시 무효화
+TAG_SEARCH_CACHE_TAG = "tag_search"
+# 태그 출력 순서 (태그 그룹 id는 태그명의 숫자)
+TAG_ORDER = (TagGroup.id,)
+
+
+def company_cache_tag(company_id: int) -> str:
+    return f"company:{company_id}"
+
+
+def tag_group_cache_tag(tag_group_id: int) -> str:
+    return f"tag_group:{tag_group_id}"
+
+
+def tag_name_cache_tag(tag_name: str) -> str:
+    return f"tag_name:{tag_name}"
+
+
+def tag_name_cache_tags(tags: Dict[int, Dict[str, str]]) -> Set[str]:
+    """
+    등록 요청된 태그명의 캐시 태그 (태그 번역 추가시 태그명 → 태그 그룹 id 캐시 무효화)
+    """
+    return {tag_name_cache_tag(name) for names in tags.values() for name in names.values()}
+
+
+def flight_key(session, *parts) -> tuple:
+    """
+    요청 병합 키 (엔드포인트, 파라미터, 언어, 세션이 조회하는 엔진)
+    writer로 고정된 read-your-writes 요청이 지연된 replica 조회 결과를 공유받지 않도록 엔진 포함
+    """
+    return (*parts, session.get_bind())
+
+
+def base_tag_name(names: Dict[str, str]) -> str:
+    """
+    태그 그룹 id 기준 태그명 (ko 우선)
+    """
+    return names.get("ko") or next(iter(names.values()), "")
+
+
+def parse_tag_group_id(tag: TagName) -> int:
+    """
+    태그명(ko 우선)의 숫자로 태그 그룹 id 생성
+    숫자가 없으면 400에러 발생
+    """
+    digits = "".join(filter(str.isdigit, base_tag_name(tag.tag_name)))
+    if not digits:
+        raise BadRequestEx(code="ERR40001")
+    return int(digits)
+
+
+def collect_tags(tags: List[TagName]) -> Dict[int, Dict[str, str]]:
+    """
+    태그 그룹 id별 언어, 태그명으로 정리
+    같은 태그 그룹, 언어는 처음 입력된 태그명 사용
+    """
+    collected: Dict[int, Dict[str, str]] = {}
+    for tag in tags:
+        names = collected.setdefault(parse_tag_group_id(tag), {})
+        for lang, name in tag.tag_name.items():
+            names.setdefault(lang, name)
+    return collected
+
+
+def insert_missing(session: Session, model, rows: List[dict]):
+    """
+    여러 행을 한번에 INSERT
+    MySQL은 ON DUPLICATE KEY UPDATE로 이미 있는 행(동시 요청이 먼저 넣은 행 포함)은 그대로 둠
+    """
+    if not rows:
+        return
+    dialect = session.get_bind().dialect.name
+    if dialect == "mysql":
+        stmt = mysql_insert(model).values(rows)
+        session.execute(stmt.on_duplicate_key_update(id=model.id))
+    elif dialect == "sqlite":
+        session.execute(insert(model).prefix_with("OR IGNORE"), rows)
+    else:
+        session.execute(insert(model), rows)
+
+
+def upsert_tags(tags: Dict[int, Dict[str, str]], session: Session):
+    """
+    태그 그룹, 태그 번역 일괄 등록
+    이미 있는 행은 IN 조회로 확인 후 없는 행만 INSERT
+    이미 있는 번역은 변경하지 않음
+    """
+    if not tags:
+        return
+    existing = set(session.execute(select(TagGroup.id).where(TagGroup.id.in_(tags))).scalars())
+    insert_missing(session, TagGroup, [
+        dict(id=tag_id) for tag_id in tags if tag_id not in existing
+    ])
+
+    stored = set(session.execute(
+        select(TagGroupTranslation.tag_group_id, TagGroupTranslation.language_code)
+        .where(TagGroupTranslation.tag_group_id.in_(tags))
+    ).tuples())
+    insert_missing(session, TagGroupTranslation, [
+        dict(tag_group_id=tag_id, language_code=lang, name=name)
+        for tag_id, names in tags.items()
+        for lang, name in names.items() if (tag_id, lang) not in stored
+    ])
+
+
+def pick_company_name(names: Dict[str, str], language_code: str) -> str:
+    """
+    요청 언어의 회사명, 없으면 처음 등록된 언어의 회사명
+    """
+    return names.get(language_code) or next(iter(names.values()))
+
+
+def find_company(company_name: str, session: Session) -> Tuple[int, Dict[str, str]]:
+    """
+    회사명(언어 무관)으로 회사 id, 언어별 회사명 조회
+    데이터가 없으면 404에러 발생
+    """
+    matched = aliased(CompanyTranslation)
+    rows = session.execute(
+        select(CompanyTranslation.company_id, CompanyTranslation.language_code, CompanyTranslation.name)
+        .where(
+            CompanyTranslation.company_id == select(matched.company_id)
+            .where(matched.name == company_name)
+            .limit(1)
+            .scalar_subquery()
+        )
+        .order_by(CompanyTranslation.id)
+    ).all()
+    if not rows:
+        raise NotFoundEx(code="ERR40401")
+
+    names: Dict[str, str] = {}
+    for _, lang, name in rows:
+        names.setdefault(lang, name)
+    return rows[0][0], names
+
+
+def company_tags(company_id: int, language_code: str, session: Session) -> Dict[int, Optional[str]]:
+    """
+    회사에 연결된 태그 그룹 id별 요청 언어 태그명 조회
+    TAG_ORDER 순서로 반환
+    쓰기 요청은 commit 전에 조회하여 세션에서 변경한 행으로 응답 생성
+    """
+    rows = session.execute(
+        select(CompanyTag.tag_group_id, TagGroupTranslation.name)
+        .join(TagGroup, TagGroup.id == CompanyTag.tag_group_id)
+        .outerjoin(
+            TagGroupTranslation,
+            and_(
+                TagGroupTranslation.tag_group_id == CompanyTag.tag_group_id,
+                TagGroupTranslation.language_code == language_code
+            )
+        )
+        .where(CompanyTag.company_id == company_id)
+        .order_by(*TAG_ORDER)
+    )
+    return {tag_id: name for tag_id, name in rows}
+
+
+def tag_names(tags: Dict[int, Optional[str]]) -> List[str]:
+    """
+    요청 언어 태그명 목록 (태그명이 없는 태그는 제외)
+    """
+    return [name for name in tags.values() if name is not None]
+
+
+def bump_versions(session: Session, company_ids: Iterable[int] = (), tag_group_ids: Iterable[int] = ()):
+    """
+    회사, 태그 그룹 버전 증가 (ETag 변경)
+    회사는 태그 연결 변경시, 태그 그룹은 연결된 회사, 태그명 변경시 증가
+    """
+    company_ids, tag_group_ids = list(company_ids), list(tag_group_ids)
+    if company_ids:
+        session.execute(
+            update(Company).where(Company.id.in_(company_ids)).values(version=Company.version + 1)
+        )
+    if tag_group_ids:
+        session.execute(
+            update(TagGroup).where(TagGroup.id.in_(tag_group_ids)).values(version=TagGroup.version + 1)
+        )
+
+
+def find_company_by_name(company_name: str, language_code: str, session: Session) -> Tuple[int, str]:
+    """
+    요청 언어의 회사명으로 (회사 id, 저장된 회사명) 조회
+    회사명은 변경되지 않으므로 캐시하고 회사 추가시 무효화
+    데이터가 없으면 404에러 발생
+    """
+    key = cache_key("company_id", company_name, language_code)
+    cached = cache.get(key)
+    if cached is not None:
+        return cached[0], cached[1]
+
+    generation = cache.generation()
+    row = session.execute(
+        select(CompanyTranslation.company_id, CompanyTranslation.name)
+        .where(CompanyTranslation.name == company_name)
+        .where(CompanyTranslation.language_code == language_code)
+    ).first()
+    if row is None:
+        raise NotFoundEx(code="ERR40401")
+    cache.set(key, [row[0], row[1]], tags=[COMPANY_NAMES_CACHE_TAG], generation=generation)
+    return row[0], row[1]
+
+
+def find_tag_group_ids(tag_name: str, session: Session) -> List[int]:
+    """
+    태그명(언어 무관)의 태그 그룹 id 조회
+    캐시하고 태그명이 등록되는 태그 번역 추가시 무효화 (태그 번역은 변경, 삭제되지 않음)
+    """
+    key = cache_key("tag_group_ids", tag_name)
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+
+    generation = cache.generation()
+    tag_group_ids = sorted(set(session.execute(
+        select(TagGroupTranslation.tag_group_id).where(TagGroupTranslation.name == tag_name)
+    ).scalars()))
+    cache.set(key, tag_group_ids, tags=[tag_name_cache_tag(tag_name)], generation=generation)
+    return tag_group_ids
+
+
+def company_detail_etag(company_name: str, language_code: str, session: Session) -> str:
+    """
+    회사 상세 ETag
+    회사 버전, 연결된 태그 그룹 버전 합으로 생성 (번역 테이블 조회 없음)
+    태그 연결이 같으면 태그 그룹 버전 합은 태그명 변경시에만 증가
+    데이터가 없으면 404에러 발생
+    같은 회사, 언어의 동시 조회는 한번만 실행
+    """
+    return single_flight.do(
+        flight_key(session, "company_detail_etag", company_name, language_code),
+        lambda: _company_detail_etag(company_name=company_name, language_code=language_code, session=session)
+    )
+
+
+def _company_detail_etag(company_name: str, language_code: str, session: Session) -> str:
+    company_id, _ = find_company_by_name(company_name, language_code, session)
+    version, tag_versions = session.execute(
+        select(Company.version, func.coalesce(func.sum(TagGroup.version), 0))
+        .select_from(Company)
+        .outerjoin(CompanyTag, CompanyTag.company_id == Company.id)
+        .outerjoin(TagGroup, TagGroup.id == CompanyTag.tag_group_id)
+        .where(Company.id == company_id)
+        .group_by(Company.version)
+    ).one()
+    return make_etag("company_detail", company_id, language_code, version, int(tag_versions))
+
+
+def tag_search_etag(query: str, language_code: str, session: Session) -> str:
+    """
+    태그 검색 ETag
+    태그명에 해당하는 태그 그룹 버전으로 생성 (태그 그룹 id는 캐시, 번역 테이블 조회 없음)
+    같은 태그명, 언어의 동시 조회는 한번만 실행
+    """
+    return single_flight.do(
+        flight_key(session, "tag_search_etag", query, language_code),
+        lambda: _tag_search_etag(query=query, language_code=language_code, session=session)
+    )
+
+
+def _tag_search_etag(query: str, language_code: str, session: Session) -> str:
+    tag_group_ids = find_tag_group_ids(query, session)
+    versions = []
+    if tag_group_ids:
+        versions = session.execute(
+            select(TagGroup.id, TagGroup.version).where(TagGroup.id.in_(tag_group_ids)).order_by(TagGroup.id)
+        ).all()
+    return make_etag("tag_search", query, language_code, [list(row) for row in versions])
+
+
+def autocomplete_response(names: Iterable[str]) -> AutoCompleteCompanyListResponse:
+    """
+    회사명 목록으로 자동완성 응답 생성
+    항목별 모델 생성 대신 목록 전체를 한번에 검증 (pydantic-core에서 처리, model_construct보다 빠름)
+    """
+    return AutoCompleteCompanyListResponse.model_validate(
+        dict(data=[dict(company_name=name) for name in names])
+    )
+
+
+def company_item_list_response(names: Iterable[str]) -> CompanyItemListResponse:
+    """
+    회사명 목록으로 회사 검색 응답 생성 (목록 전체를 한번에 검증)
+    """
+    return CompanyItemListResponse.model_validate(
+        dict(data=[dict(company_name=name) for name in names])
+    )
 
 
 def get_autocomplete_company_name(
     query: str,
     language_code: str,
-    session: Session
+    session: Session,
+    limit: int = 10,
+    offset: int = 0,
+    ranked: bool = False
 ) -> AutoCompleteCompanyListResponse:
     """
     회사명 자동완성
     회사명의 일부만 들어가도 검색
     header의 x-wanted-language 언어값에 따라 해당 언어로 출력
+    ranked인 경우 일치 > 접두어 > 부분 일치, 짧은 회사명 순으로 정렬
+    n-gram 색인을 사용할 수 없는 경우 DB에서 검색
     """
+    autocomplete_index.refresh(session)
+    names = autocomplete_index.search(query, language_code, limit=limit, offset=offset, ranked=ranked)
+    if names is not None:
+        return autocomplete_response(names)
+
+    key = cache_key("autocomplete", query, language_code, limit, offset, ranked)
+    cached = cache.get(key)
+    if cached is not None:
+        return AutoCompleteCompanyListResponse.model_validate(cached)
+
+    generation = cache.generation()
     stmt = (
         select(
             CompanyTranslation.name.label("company_name"),
         ).where(
             CompanyTranslation.name.ilike(f"%{query}%"),
             CompanyTranslation.language_code == language_code
-        )
+        ).limit(limit).offset(offset)
     )
+    if ranked:
+        name = func.lower(CompanyTranslation.name)
+        needle = func.lower(query)
+        stmt = stmt.order_by(
+            case(
+                (name == needle, 0),
+                (name.like(needle.concat("%")), 1),
+                else_=2
+            ),
+            func.char_length(CompanyTranslation.name)
+        )
+    stmt = stmt.order_by(CompanyTranslation.id)
     results = session.execute(stmt).all()
 
-    return AutoCompleteCompanyListResponse(
-        data=[
-            AutoCompleteCompanyResponse.from_orm(
-                result
-            ) for result in results
-        ]
-    )
+    result = autocomplete_response(result.company_name for result in results)
+    cache.set(key, result.model_dump(), tags=[COMPANY_NAMES_CACHE_TAG], generation=generation)
+    return result
 
 
 def get_company_detail(
     company_name: str,
     language_code: str,
-    session: Session
+    session: Session,
+    version: str = ""
 ) -> CompanyDetailDataResponse:
     """
     회사 이름으로 회사 검색
     header의 x-wanted-language 언어값에 따라 해당 언어로 출력
     데이터가 없으면 404에러 발생
+    조회 결과는 캐시하고 회사, 태그 변경시 무효화
+    version(ETag)을 캐시 키에 포함하여 다른 워커의 변경 후에도 ETag와 다른 본문을 응답하지 않음
+    같은 회사, 언어의 동시 조회는 한번만 실행하고 결과 공유
     """
-    stmt = (
-        select(
-            CompanyTranslation
-        ).where(
-            CompanyTranslation.name == company_name
-        ).where(
-            CompanyTranslation.language_code == language_code
+    return single_flight.do(
+        flight_key(session, "company_detail", company_name, language_code, version),
+        lambda: _get_company_detail(
+            company_name=company_name, language_code=language_code, session=session, version=version
         )
     )
-    company_translation = session.execute(stmt).scalar_one_or_none()
 
-    if not company_translation:
-        raise NotFoundEx(code="ERR40401")
 
-    stmt_tags = (
-        select(
-            CompanyTag.tag_group_id
-        ).where(
-            CompanyTag.company_id == company_translation.company_id
-        )
-    )
-    tag_ids = session.execute(stmt_tags).scalars().all()
-
-    if tag_ids:
-        stmt_tag_names = (
-            select(
-                TagGroupTranslation
-            ).where(
-                TagGroupTranslation.tag_group_id.in_(tag_ids)
-            ).where(
-                TagGroupTranslation.language_code == language_code
-            )
-        )
-        tag_translations = session.execute(stmt_tag_names).scalars().all()
-        tags = [t.name for t in tag_translations]
-    else:
-        tags = []
+def _get_company_detail(
+    company_name: str,
+    language_code: str,
+    session: Session,
+    version: str = ""
+) -> CompanyDetailDataResponse:
+    key = cache_key("company_detail", company_name, language_code, version)
+    cached = cache.get(key)
+    if cached is not None:
+        return CompanyDetailDataResponse.model_validate(cached)
+
+    generation = cache.generation()
+    company_id, name = find_company_by_name(company_name, language_code, session)
+    tags = company_tags(company_id, language_code, session)
 
-    return CompanyDetailDataResponse(
+    result = CompanyDetailDataResponse(
         data=CompanyDetailResponse(
-            company_name=company_translation.name,
-            tags=tags
+            company_name=name,
+            tags=tag_names(tags)
         )
     )
+    cache.set(
+        key,
+        result.model_dump(),
+        tags=[company_cache_tag(company_id), *map(tag_group_cache_tag, tags)],
+        generation=generation
+    )
+    return result
 
 
 def create_company(
@@ -103,82 +421,49 @@ def create_company(
     새로운 회사 추가
     새로운 언어(tw)도 같이 추가 될 수 있음
     저장 완료후 header의 x-wanted-language 언어값에 따라 해당 언어로 출력
+    x-wanted-language 언어의 회사명이 없으면 처음 입력된 언어로 출력
     """
     new_company = Company()
     session.add(new_company)
     session.flush()
 
-    for lang, name in body.company_name.items():
-        session.add(
-            CompanyTranslation(
-                company_id=new_company.id,
-                language_code=lang,
-                name=name
-            )
-        )
-
-    for tag in body.tags:
-        base_name = tag.tag_name.get("ko") or next(iter(tag.tag_name.values()))
-        try:
-            tag_id = int("".join(filter(str.isdigit, base_name)))
-        except:
-            raise BadRequestEx(code="ERR40001")
-
-        tag_group = session.get(TagGroup, tag_id)
-        if not tag_group:
-            tag_group = TagGroup(id=tag_id)
-            session.add(tag_group)
-            session.flush()
-
-        for lang, tag_name in tag.tag_name.items():
-            exists = session.scalar(
-                select(TagGroupTranslation)
-                .where(TagGroupTranslation.tag_group_id == tag_id)
-                .where(TagGroupTranslation.language_code == lang)
-            )
-            if not exists:
-                session.add(TagGroupTranslation(
-                    tag_group_id=tag_id,
-                    language_code=lang,
-                    name=tag_name
-                ))
-
-        session.add(CompanyTag(company_id=new_company.id, tag_group_id=tag_id))
+    company_translations = [
+        CompanyTranslation(
+            company_id=new_company.id,
+            language_code=lang,
+            name=name
+        ) for lang, name in body.company_name.items()
+    ]
+    session.add_all(company_translations)
+
+    tags = collect_tags(body.tags)
+    upsert_tags(tags, session)
+    tag_ids = list(tags)
+    insert_missing(session, CompanyTag, [
+        dict(company_id=new_company.id, tag_group_id=tag_id) for tag_id in tag_ids
+    ])
+    bump_versions(session, tag_group_ids=tag_ids)
+    linked_tags = company_tags(new_company.id, language_code, session)
 
     session.commit()
-
-    name_translation = session.scalar(
-        select(
-            CompanyTranslation.name
-        ).where(
-            CompanyTranslation.company_id == new_company.id
-        ).where(
-            CompanyTranslation.language_code == language_code
-        )
+    for t in company_translations:
+        autocomplete_index.add(t.id, t.language_code, t.name)
+    cache.invalidate_tags(
+        COMPANY_NAMES_CACHE_TAG, TAG_SEARCH_CACHE_TAG, *map(tag_group_cache_tag, tag_ids), *tag_name_cache_tags(tags)
     )
 
-    tag_names = session.scalars(
-        select(
-            TagGroupTranslation.name
-        ).join(
-            CompanyTag,
-            TagGroupTranslation.tag_group_id == CompanyTag.tag_group_id
-        ).where(
-            CompanyTag.company_id == new_company.id
-        ).where(
-            TagGroupTranslation.language_code == language_code
-        )
-    ).all()
+    # 저장한 값으로 응답 생성 (commit 후 재조회 없음)
     return CompanyResponse(
-        company_name=name_translation,
-        tags=tag_names
+        company_name=pick_company_name(body.company_name, language_code),
+        tags=tag_names(linked_tags)
     )
 
 
 def search_company_by_tag_name(
     query: str,
     language_code: str,
-    session: Session
+    session: Session,
+    version: str = ""
 ) -> CompanyItemListResponse:
     """
     태그명으로 회사 검색
@@ -187,47 +472,56 @@ def search_company_by_tag_name(
     일본어 태그로 검색을 해도 language가 ko이면 한국 회사명이 노출
     ko언어가 없을경우 노출가능한 언어로 출력
     동일한 회사는 한번만 노출
+    version(ETag)을 캐시 키에 포함하여 다른 워커의 변경 후에도 ETag와 다른 본문을 응답하지 않음
+    같은 태그명, 언어의 동시 조회는 한번만 실행하고 결과 공유
     """
-    tag_translation_stmt = (
-        select(TagGroupTranslation.tag_group_id)
-        .where(TagGroupTranslation.name == query)
+    return single_flight.do(
+        flight_key(session, "tag_search", query, language_code, version),
+        lambda: _search_company_by_tag_name(query=query, language_code=language_code, session=session, version=version)
     )
-    tag_group_ids = session.execute(tag_translation_stmt).scalars().all()
-    if not tag_group_ids:
-        return CompanyItemListResponse(data=[])
 
+
+def _search_company_by_tag_name(
+    query: str,
+    language_code: str,
+    session: Session,
+    version: str = ""
+) -> CompanyItemListResponse:
+    key = cache_key("tag_search", query, language_code, version)
+    cached = cache.get(key)
+    if cached is not None:
+        return CompanyItemListResponse.model_validate(cached)
+
+    generation = cache.generation()
     company_ids_stmt = (
-        select(distinct(CompanyTag.company_id))
-        .where(CompanyTag.tag_group_id.in_(tag_group_ids))
+        select(CompanyTag.company_id)
+        .join(TagGroupTranslation, TagGroupTranslation.tag_group_id == CompanyTag.tag_group_id)
+        .where(TagGroupTranslation.name == query)
     )
-    company_ids = session.execute(company_ids_stmt).scalars().all()
-    if not company_ids:
-        return CompanyItemListResponse(data=[])
-
-    results = []
-    for company_id in company_ids:
-        company_name = session.scalar(
-            select(CompanyTranslation.name)
-            .where(CompanyTranslation.company_id == company_id)
-            .where(CompanyTranslation.language_code == language_code)
+    # 회사별 전체 언어의 회사명을 한번에 조회 후 언어 fallback 처리
+    translations_stmt = (
+        select(
+            CompanyTranslation.company_id,
+            CompanyTranslation.language_code,
+            CompanyTranslation.name
+        ).where(
+            CompanyTranslation.company_id.in_(company_ids_stmt)
+        ).order_by(
+            CompanyTranslation.company_id,
+            CompanyTranslation.id
         )
-        if not company_name:
-            company_name = session.scalar(
-                select(CompanyTranslation.name)
-                .where(CompanyTranslation.company_id == company_id)
-                .limit(1)
-            )
-        if company_name:
-            results.append(
-                CompanyItemResponse(
-                    company_name=company_name
-                )
-            )
-
-    return CompanyItemListResponse(
-        data=results
     )
 
+    company_names = {}
+    for company_id, lang, name in session.execute(translations_stmt):
+        current = company_names.get(company_id)
+        if current is None or (lang == language_code and current[0] != language_code):
+            company_names[company_id] = (lang, name)
+
+    result = company_item_list_response(name for _, name in company_names.values())
+    cache.set(key, result.model_dump(), tags=[TAG_SEARCH_CACHE_TAG], generation=generation)
+    return result
+
 
 def add_tags_to_company(
     company_name: str,
@@ -239,70 +533,29 @@ def add_tags_to_company(
     회사 태그 정보 추가
     저장 완료후 header의 x-wanted-language 언어값에 따라 해당 언어로 출력
     """
-    company_translation = session.scalar(
-        select(CompanyTranslation)
-        .where(CompanyTranslation.name == company_name)
-    )
-    if not company_translation:
-        raise NotFoundEx(code="ERR40401")
-    company_id = company_translation.company_id
-
-    for tag in tags:
-        base_name = tag.tag_name.get("ko") or next(iter(tag.tag_name.values()))
-        try:
-            tag_id = int("".join(filter(str.isdigit, base_name)))
-        except:
-            raise BadRequestEx(code="ERR40001")
-
-        tag_group = session.get(TagGroup, tag_id)
-        if not tag_group:
-            tag_group = TagGroup(id=tag_id)
-            session.add(tag_group)
-            session.flush()
-
-        for lang, name in tag.tag_name.items():
-            exists = session.scalar(
-                select(TagGroupTranslation)
-                .where(TagGroupTranslation.tag_group_id == tag_id)
-                .where(TagGroupTranslation.language_code == lang)
-            )
-            if not exists:
-                session.add(TagGroupTranslation(
-                    tag_group_id=tag_id,
-                    language_code=lang,
-                    name=name
-                ))
-
-        existing_link = session.scalar(
-            select(CompanyTag)
-            .where(CompanyTag.company_id == company_id)
-            .where(CompanyTag.tag_group_id == tag_id)
-        )
-        if not existing_link:
-            session.add(CompanyTag(company_id=company_id, tag_group_id=tag_id))
+    company_id, company_names = find_company(company_name, session)
+
+    new_tags = collect_tags(tags)
+    upsert_tags(new_tags, session)
+    tag_ids = list(new_tags)
+    # 이미 연결된 태그는 그대로 둠
+    insert_missing(session, CompanyTag, [
+        dict(company_id=company_id, tag_group_id=tag_id) for tag_id in tag_ids
+    ])
+    bump_versions(session, company_ids=[company_id], tag_group_ids=tag_ids)
+    linked_tags = company_tags(company_id, language_code, session)
 
     session.commit()
-
-    name = session.scalar(
-        select(CompanyTranslation.name)
-        .where(CompanyTranslation.company_id == company_id)
-        .where(CompanyTranslation.language_code == language_code)
-    ) or session.scalar(
-        select(CompanyTranslation.name)
-        .where(CompanyTranslation.company_id == company_id)
-        .limit(1)
+    cache.invalidate_tags(
+        TAG_SEARCH_CACHE_TAG,
+        company_cache_tag(company_id),
+        *map(tag_group_cache_tag, tag_ids),
+        *tag_name_cache_tags(new_tags)
     )
 
-    tag_names = session.scalars(
-        select(TagGroupTranslation.name)
-        .join(CompanyTag, TagGroupTranslation.tag_group_id == CompanyTag.tag_group_id)
-        .where(CompanyTag.company_id == company_id)
-        .where(TagGroupTranslation.language_code == language_code)
-    ).all()
-
     return CompanyResponse(
-        company_name=name,
-        tags=sorted(tag_names, key=lambda x: int("".join(filter(str.isdigit, x))))
+        company_name=pick_company_name(company_names, language_code),
+        tags=tag_names(linked_tags)
     )
 
 
@@ -316,13 +569,7 @@ def delete_company_tag(
     회사 태그 정보 삭제
     저장 완료후 header의 x-wanted-language 언어값에 따라 해당 언어로 출력
     """
-    company_translation = session.scalar(
-        select(CompanyTranslation)
-        .where(CompanyTranslation.name == company_name)
-    )
-    if not company_translation:
-        raise NotFoundEx(code="ERR40401")
-    company_id = company_translation.company_id
+    company_id, company_names = find_company(company_name, session)
 
     tag_group_id = session.scalar(
         select(TagGroupTranslation.tag_group_id)
@@ -336,26 +583,135 @@ def delete_company_tag(
         .where(CompanyTag.company_id == company_id)
         .where(CompanyTag.tag_group_id == tag_group_id)
     )
+    bump_versions(session, company_ids=[company_id], tag_group_ids=[tag_group_id])
+    linked_tags = company_tags(company_id, language_code, session)
     session.commit()
+    cache.invalidate_tags(TAG_SEARCH_CACHE_TAG, company_cache_tag(company_id))
 
-    name = session.scalar(
-        select(CompanyTranslation.name)
-        .where(CompanyTranslation.company_id == company_id)
-        .where(CompanyTranslation.language_code == language_code)
-    ) or session.scalar(
-        select(CompanyTranslation.name)
-        .where(CompanyTranslation.company_id == company_id)
-        .limit(1)
+    return CompanyResponse(
+        company_name=pick_company_name(company_names, language_code),
+        tags=tag_names(linked_tags)
     )
 
-    tag_names = session.scalars(
-        select(TagGroupTranslation.name)
-        .join(CompanyTag, TagGroupTranslation.tag_group_id == CompanyTag.tag_group_id)
-        .where(CompanyTag.company_id == company_id)
-        .where(TagGroupTranslation.language_code == language_code)
-    ).all()
 
-    return CompanyResponse(
-        company_name=name,
-        tags=sorted(tag_names, key=lambda x: int("".join(filter(str.isdigit, x))))
+async def _run_async(session: AsyncSession, fn, **kwargs):
+    """
+    동기 서비스 함수를 AsyncSession에서 실행
+    DB I/O는 asyncio 드라이버로 처리되어 이벤트 루프를 막지 않음
+    """
+    return await session.run_sync(lambda sync_session: fn(session=sync_session, **kwargs))
+
+
+async def get_autocomplete_company_name_async(
+    query: str,
+    language_code: str,
+    session: AsyncSession,
+    limit: int = 10,
+    offset: int = 0,
+    ranked: bool = False
+) -> AutoCompleteCompanyListResponse:
+    """
+    회사명 자동완성 (비동기)
+    """
+    return await _run_async(
+        session,
+        get_autocomplete_company_name,
+        query=query,
+        language_code=language_code,
+        limit=limit,
+        offset=offset,
+        ranked=ranked
+    )
+
+
+async def get_company_detail_async(
+    company_name: str,
+    language_code: str,
+    session: AsyncSession,
+    version: str = ""
+) -> CompanyDetailDataResponse:
+    """
+    회사 이름으로 회사 검색 (비동기)
+    """
+    return await single_flight.do_async(
+        flight_key(session, "company_detail", company_name, language_code, version),
+        lambda: _run_async(
+            session, _get_company_detail, company_name=company_name, language_code=language_code, version=version
+        )
+    )
+
+
+async def company_detail_etag_async(company_name: str, language_code: str, session: AsyncSession) -> str:
+    """
+    회사 상세 ETag (비동기)
+    """
+    return await single_flight.do_async(
+        flight_key(session, "company_detail_etag", company_name, language_code),
+        lambda: _run_async(session, _company_detail_etag, company_name=company_name, language_code=language_code)
+    )
+
+
+async def create_company_async(
+    body: NewCompanyRequest,
+    language_code: str,
+    session: AsyncSession
+) -> CompanyResponse:
+    """
+    새로운 회사 추가 (비동기)
+    """
+    return await _run_async(session, create_company, body=body, language_code=language_code)
+
+
+async def search_company_by_tag_name_async(
+    query: str,
+    language_code: str,
+    session: AsyncSession,
+    version: str = ""
+) -> CompanyItemListResponse:
+    """
+    태그명으로 회사 검색 (비동기)
+    """
+    return await single_flight.do_async(
+        flight_key(session, "tag_search", query, language_code, version),
+        lambda: _run_async(
+            session, _search_company_by_tag_name, query=query, language_code=language_code, version=version
+        )
+    )
+
+
+async def tag_search_etag_async(query: str, language_code: str, session: AsyncSession) -> str:
+    """
+    태그 검색 ETag (비동기)
+    """
+    return await single_flight.do_async(
+        flight_key(session, "tag_search_etag", query, language_code),
+        lambda: _run_async(session, _tag_search_etag, query=query, language_code=language_code)
+    )
+
+
+async def add_tags_to_company_async(
+    company_name: str,
+    tags: List[TagName],
+    language_code: str,
+    session: AsyncSession
+) -> CompanyResponse:
+    """
+    회사 태그 정보 추가 (비동기)
+    """
+    return await _run_async(
+        session, add_tags_to_company, company_name=company_name, tags=tags, language_code=language_code
+    )
+
+
+async def delete_company_tag_async(
+    company_name: str,
+    tag_name: str,
+    language_code: str,
+    session: AsyncSession
+) -> CompanyResponse:
+    """
+    회사 태그 정보 삭제 (비동기)
+    """
+    return await _run_async(
+        session, delete_company_tag, company_name=company_name, tag_name=tag_name, language_code=language_code
     )
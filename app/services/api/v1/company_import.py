@@ -0,0 +1,266 @@
+import argparse
+import codecs
+import csv
+import itertools
+import json
+import logging
+import time
+from datetime import datetime
+from typing import AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import anyio.from_thread
+from pydantic import ValidationError
+from sqlalchemy import select, insert
+from sqlalchemy.orm import Session
+
+from app.database.schema.company import CompanyTranslation, CompanyTag, Company
+from app.errors.exceptions import APIException
+from app.models.api.v1.company.request import NewCompanyRequest, TagName
+from app.models.api.v1.company.response import CompanyImportResponse
+from app.services.api.v1.company import bump_versions, parse_tag_group_id, tag_group_cache_tag, \
+    tag_name_cache_tags, upsert_tags, COMPANY_NAMES_CACHE_TAG, TAG_SEARCH_CACHE_TAG
+from app.services.autocomplete import autocomplete_index
+from app.utils.cache import cache
+
+# CSV 태그 구분자
+CSV_TAG_SEPARATOR = "|"
+
+
+def read_jsonl(lines: Iterable[str]) -> Iterator[Optional[NewCompanyRequest]]:
+    """
+    JSONL 한 줄을 NewCompanyRequest 하나로 변환
+    변환할 수 없는 줄은 None 반환
+    """
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield NewCompanyRequest.model_validate_json(line)
+        except ValidationError as e:
+            logging.warning("Invalid company record: %s", e)
+            yield None
+
+
+def read_csv(lines: Iterable[str]) -> Iterator[Optional[NewCompanyRequest]]:
+    """
+    CSV 한 행을 NewCompanyRequest 하나로 변환
+    컬럼: company_{언어}, tag_{언어}
+    태그는 '|'로 구분하고 언어별로 같은 순서로 입력
+    예) company_ko,company_en,tag_ko,tag_en
+        원티드랩,Wantedlab,태그_4|태그_20,tag_4|tag_20
+    """
+    for row in csv.DictReader(lines):
+        company_name = {}
+        tag_names: Dict[str, List[str]] = {}
+        for column, value in row.items():
+            if not column or not value:
+                continue
+            kind, _, lang = column.partition("_")
+            if kind == "company":
+                company_name[lang] = value
+            elif kind == "tag":
+                tag_names[lang] = value.split(CSV_TAG_SEPARATOR)
+
+        tags = [
+            TagName(tag_name={lang: names[i] for lang, names in tag_names.items() if i < len(names) and names[i]})
+            for i in range(max(map(len, tag_names.values()), default=0))
+        ]
+        try:
+            yield NewCompanyRequest(company_name=company_name, tags=[tag for tag in tags if tag.tag_name])
+        except ValidationError as e:
+            logging.warning("Invalid company record: %s", e)
+            yield None
+
+
+def stream_lines(chunks: AsyncIterator[bytes]) -> Iterator[str]:
+    """
+    요청 본문 async 스트림을 UTF-8 줄 단위로 변환
+    스레드풀(run_in_threadpool)에서 호출하며 다음 조각은 이벤트 루프에서 읽음
+    본문 전체를 메모리나 임시 파일에 저장하지 않음
+    """
+    async def next_chunk() -> Optional[bytes]:
+        try:
+            return await chunks.__anext__()
+        except StopAsyncIteration:
+            return None
+
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    while (data := anyio.from_thread.run(next_chunk)) is not None:
+        buffer += decoder.decode(data)
+        lines = buffer.split("\n")
+        buffer = lines.pop()
+        for line in lines:
+            yield line + "\n"
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield buffer
+
+
+def chunked(records: Iterable, size: int) -> Iterator[List]:
+    """
+    size 단위로 묶어서 반환
+    """
+    iterator = iter(records)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+def _log_progress(imported: int, failed: int, elapsed: float):
+    logging.info(
+        "Imported %s companies, %s failed (%.1f/s)", imported, failed, imported / elapsed if elapsed else 0.0
+    )
+
+
+def import_companies(
+    records: Iterable[Optional[NewCompanyRequest]],
+    session: Session,
+    batch_size: int = 1000,
+    progress: Callable[[int, int, float], None] = _log_progress
+) -> CompanyImportResponse:
+    """
+    회사 일괄 등록
+    batch_size 단위로 여러 행 INSERT 후 commit
+    태그명에 숫자가 없는 등 등록할 수 없는 회사는 건너뜀
+    같은 언어의 회사명이 이미 등록된 회사는 중복으로 건너뜀 (같은 파일을 다시 등록해도 안전)
+    캐시는 묶음 commit 마다 무효화 (이후 묶음이 실패해도 먼저 등록된 회사는 조회에 반영)
+    """
+    start = time.perf_counter()
+    imported = failed = duplicated = 0
+
+    try:
+        for chunk in chunked(records, batch_size):
+            valid = []
+            for record in chunk:
+                if record is None or not record.company_name:
+                    failed += 1
+                    continue
+                try:
+                    valid.append((record, [parse_tag_group_id(tag) for tag in record.tags]))
+                except APIException:
+                    failed += 1
+
+            new_records = _exclude_registered(valid, session)
+            duplicated += len(valid) - len(new_records)
+            if new_records:
+                tags = _insert_chunk(new_records, session)
+                session.commit()
+                cache.invalidate_tags(
+                    COMPANY_NAMES_CACHE_TAG,
+                    TAG_SEARCH_CACHE_TAG,
+                    *map(tag_group_cache_tag, tags),
+                    *tag_name_cache_tags(tags)
+                )
+                imported += len(new_records)
+            if progress:
+                progress(imported, failed, time.perf_counter() - start)
+    except Exception:
+        # 실패한 묶음만 rollback (이전 묶음은 commit 됨)
+        session.rollback()
+        raise
+    finally:
+        if imported:
+            autocomplete_index.refresh(session, force=True)
+
+    elapsed = time.perf_counter() - start
+    return CompanyImportResponse(
+        imported=imported,
+        failed=failed,
+        duplicated=duplicated,
+        elapsed_sec=round(elapsed, 3),
+        per_sec=round(imported / elapsed, 1) if elapsed else 0.0,
+    )
+
+
+def _exclude_registered(
+    records: List[Tuple[NewCompanyRequest, List[int]]],
+    session: Session
+) -> List[Tuple[NewCompanyRequest, List[int]]]:
+    """
+    이미 등록된 회사명, 묶음 안에서 앞에 나온 회사명과 겹치는 회사 제외
+    회사명은 한번의 IN 조회로 확인
+    """
+    if not records:
+        return []
+    names = {name for record, _ in records for name in record.company_name.values()}
+    registered = set(session.execute(
+        select(CompanyTranslation.language_code, CompanyTranslation.name)
+        .where(CompanyTranslation.name.in_(names))
+    ).all())
+
+    new_records = []
+    for record, record_tag_ids in records:
+        company_names = set(record.company_name.items())
+        if company_names & registered:
+            continue
+        registered |= company_names
+        new_records.append((record, record_tag_ids))
+    return new_records
+
+
+def _insert_chunk(records: List[Tuple[NewCompanyRequest, List[int]]], session: Session) -> Dict[int, Dict[str, str]]:
+    """
+    회사 묶음 INSERT
+    회사 id는 autoincrement로 할당 (회사 행만 행 단위 INSERT, 테이블 잠금 없이 동시 등록 가능)
+    회사명, 태그, 회사-태그 연결은 여러 행 INSERT
+    :return: 사용된 태그 그룹 id별 태그명
+    """
+    now = datetime.utcnow()
+    companies = [Company(created_at=now, updated_at=now) for _ in records]
+    session.add_all(companies)
+    session.flush()
+
+    company_translations = []
+    company_tags = []
+    tags: Dict[int, Dict[str, str]] = {}
+    for company, (record, record_tag_ids) in zip(companies, records):
+        company_translations.extend(
+            dict(company_id=company.id, language_code=lang, name=name)
+            for lang, name in record.company_name.items()
+        )
+        company_tags.extend(
+            dict(company_id=company.id, tag_group_id=tag_id)
+            for tag_id in dict.fromkeys(record_tag_ids)
+        )
+        for tag, tag_id in zip(record.tags, record_tag_ids):
+            names = tags.setdefault(tag_id, {})
+            for lang, name in tag.tag_name.items():
+                names.setdefault(lang, name)
+
+    upsert_tags(tags, session)
+    session.execute(insert(CompanyTranslation), company_translations)
+    if company_tags:
+        session.execute(insert(CompanyTag), company_tags)
+    bump_versions(session, tag_group_ids=tags)
+    return tags
+
+
+def main():
+    parser = argparse.ArgumentParser(description="회사 일괄 등록")
+    parser.add_argument("path", help="JSONL 또는 CSV 파일 경로")
+    parser.add_argument("--format", choices=["jsonl", "csv"], help="파일 형식 (기본값: 확장자)")
+    parser.add_argument("--batch-size", type=int, default=1000, help="commit 단위")
+    args = parser.parse_args()
+
+    from dataclasses import asdict
+    from fastapi import FastAPI
+    from app.common.config import conf
+    from app.database.conn_sqlalchemy import db
+
+    logging.basicConfig(level=logging.INFO)
+    db.init_app(FastAPI(), **asdict(conf()))
+    file_format = args.format or ("csv" if args.path.endswith(".csv") else "jsonl")
+    reader = read_csv if file_format == "csv" else read_jsonl
+
+    session = db.get_background_writer_db()
+    try:
+        with open(args.path, encoding="utf-8", newline="") as f:
+            result = import_companies(reader(f), session, batch_size=args.batch_size)
+    finally:
+        session.close()
+    print(json.dumps(result.model_dump(), ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
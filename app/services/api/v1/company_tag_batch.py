@@ -0,0 +1,159 @@
+import logging
+from typing import Dict, Iterable, List, Set, Tuple
+
+from sqlalchemy import select, delete, tuple_
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.database.schema.company import CompanyTranslation, CompanyTag, TagGroupTranslation
+from app.errors.exceptions import APIException, NotFoundEx
+from app.models.api.v1.company.request import CompanyTagOperation
+from app.models.api.v1.company.response import CompanyTagBatchResponse, CompanyTagOperationResponse
+from app.services.api.v1.company import bump_versions, collect_tags, company_cache_tag, insert_missing, \
+    tag_group_cache_tag, tag_name_cache_tags, upsert_tags, TAG_SEARCH_CACHE_TAG
+from app.services.api.v1.company_import import chunked
+from app.utils.cache import cache
+
+
+def batch_update_company_tags(
+    operations: Iterable[CompanyTagOperation],
+    session: Session,
+    batch_size: int = 1000
+) -> CompanyTagBatchResponse:
+    """
+    여러 회사의 태그 일괄 추가, 삭제
+    batch_size 단위로 회사명, 태그명을 한번에 조회하고 변경 후 commit
+    항목별로 추가 후 삭제 순서로 적용하며 같은 연결을 여러 항목에서 변경하면 입력 순서대로 반영
+    회사명, 삭제할 태그명이 없거나 태그명에 숫자가 없는 항목은 변경하지 않고 에러 코드 반환
+    묶음 처리 중 DB 에러가 나면 해당 묶음은 rollback 하고 묶음의 모든 항목에 ERR50001 반환 후 다음 묶음 진행
+    에러 코드가 없는 항목만 저장됨
+    """
+    results: List[CompanyTagOperationResponse] = []
+    for chunk in chunked(operations, batch_size):
+        try:
+            results.extend(_apply_chunk(chunk, session))
+        except SQLAlchemyError:
+            logging.exception("Company tag batch chunk failed (%s operations rolled back).", len(chunk))
+            session.rollback()
+            results.extend(
+                CompanyTagOperationResponse(company_name=op.company_name, code="ERR50001") for op in chunk
+            )
+    failed = sum(1 for result in results if result.code)
+    return CompanyTagBatchResponse(succeeded=len(results) - failed, failed=failed, data=results)
+
+
+def _apply_chunk(operations: List[CompanyTagOperation], session: Session) -> List[CompanyTagOperationResponse]:
+    company_ids = _resolve_company_ids({op.company_name for op in operations}, session)
+    remove_tag_ids = _resolve_tag_group_ids({name for op in operations for name in op.remove_tags}, session)
+
+    results = [CompanyTagOperationResponse(company_name=op.company_name) for op in operations]
+    planned: List[Tuple[int, CompanyTagOperationResponse, List[int], List[int]]] = []
+    tags: Dict[int, Dict[str, str]] = {}
+    for op, result in zip(operations, results):
+        try:
+            company_id = company_ids.get(op.company_name)
+            if company_id is None or any(name not in remove_tag_ids for name in op.remove_tags):
+                raise NotFoundEx(code="ERR40401")
+            op_tags = collect_tags(op.add_tags)
+        except APIException as e:
+            result.code = e.code
+            continue
+        for tag_id, names in op_tags.items():
+            merged = tags.setdefault(tag_id, {})
+            for lang, name in names.items():
+                merged.setdefault(lang, name)
+        planned.append((company_id, result, list(op_tags), [remove_tag_ids[name] for name in op.remove_tags]))
+
+    if not planned:
+        return results
+
+    upsert_tags(tags, session)
+    pairs = {
+        (company_id, tag_id)
+        for company_id, _, add_ids, remove_ids in planned for tag_id in (*add_ids, *remove_ids)
+    }
+    existing = _existing_links(pairs, session)
+
+    # 항목 순서대로 연결 상태를 바꾸고 최종 상태와 기존 상태의 차이만 반영
+    linked = {pair: pair in existing for pair in pairs}
+    for company_id, result, add_ids, remove_ids in planned:
+        for tag_id in add_ids:
+            if not linked[(company_id, tag_id)]:
+                linked[(company_id, tag_id)] = True
+                result.added += 1
+        for tag_id in remove_ids:
+            if linked[(company_id, tag_id)]:
+                linked[(company_id, tag_id)] = False
+                result.removed += 1
+
+    inserts = [pair for pair, is_linked in linked.items() if is_linked and pair not in existing]
+    deletes = [pair for pair, is_linked in linked.items() if not is_linked and pair in existing]
+    insert_missing(session, CompanyTag, [
+        dict(company_id=company_id, tag_group_id=tag_id) for company_id, tag_id in inserts
+    ])
+    if deletes:
+        session.execute(
+            delete(CompanyTag).where(tuple_(CompanyTag.company_id, CompanyTag.tag_group_id).in_(deletes))
+        )
+    changed = inserts + deletes
+    # 추가한 태그는 태그명이 새로 등록되었을 수 있으므로 연결 변경이 없어도 버전 증가
+    bump_versions(
+        session,
+        company_ids={company_id for company_id, _ in changed},
+        tag_group_ids=set(tags) | {tag_id for _, tag_id in changed}
+    )
+    session.commit()
+
+    if changed:
+        cache.invalidate_tags(
+            TAG_SEARCH_CACHE_TAG,
+            *{company_cache_tag(company_id) for company_id, _ in changed},
+            *{tag_group_cache_tag(tag_id) for _, tag_id in inserts}
+        )
+    # 연결 변경이 없어도 태그명은 새로 등록되었을 수 있음
+    cache.invalidate_tags(*tag_name_cache_tags(tags))
+    return results
+
+
+def _resolve_company_ids(names: Set[str], session: Session) -> Dict[str, int]:
+    """
+    회사명(언어 무관)별 회사 id
+    """
+    if not names:
+        return {}
+    company_ids: Dict[str, int] = {}
+    for name, company_id in session.execute(
+        select(CompanyTranslation.name, CompanyTranslation.company_id)
+        .where(CompanyTranslation.name.in_(names))
+        .order_by(CompanyTranslation.id)
+    ):
+        company_ids.setdefault(name, company_id)
+    return company_ids
+
+
+def _resolve_tag_group_ids(names: Set[str], session: Session) -> Dict[str, int]:
+    """
+    태그명(언어 무관)별 태그 그룹 id
+    """
+    if not names:
+        return {}
+    tag_group_ids: Dict[str, int] = {}
+    for name, tag_group_id in session.execute(
+        select(TagGroupTranslation.name, TagGroupTranslation.tag_group_id)
+        .where(TagGroupTranslation.name.in_(names))
+        .order_by(TagGroupTranslation.id)
+    ):
+        tag_group_ids.setdefault(name, tag_group_id)
+    return tag_group_ids
+
+
+def _existing_links(pairs: Set[Tuple[int, int]], session: Session) -> Set[Tuple[int, int]]:
+    """
+    (회사 id, 태그 그룹 id) 중 이미 연결된 것
+    """
+    if not pairs:
+        return set()
+    return set(session.execute(
+        select(CompanyTag.company_id, CompanyTag.tag_group_id)
+        .where(tuple_(CompanyTag.company_id, CompanyTag.tag_group_id).in_(pairs))
+    ).tuples())
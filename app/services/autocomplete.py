@@ -0,0 +1,235 @@
+import asyncio
+import heapq
+import logging
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import anyio.to_thread
+from fastapi import FastAPI
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.database.schema.company import CompanyTranslation
+
+# ilike 와일드카드가 포함된 검색어는 DB 경로로 처리
+_LIKE_SPECIAL_CHARS = ("%", "_", "\\")
+# 색인 생성시 마지막 id 이전에 비어있는 id (생성 시점에 commit 되지 않은 행) 최대 추적 개수
+_MAX_GAPS = 100
+# 비어있는 id를 다시 조회하는 시간 (rollback 된 id는 이후 제외, 더 늦게 commit 된 행은 주기적 재생성에서 반영)
+_GAP_TIMEOUT_SEC = 600
+
+
+class NgramIndex:
+    """
+    회사명 n-gram 역색인
+    언어별로 회사명의 n-gram posting list를 메모리에 유지
+    부분 문자열 검색을 posting list 교집합으로 처리
+    색인은 워커 시작 후 백그라운드에서 생성하고 완료 전에는 DB 경로로 처리
+    """
+
+    def __init__(self, ngram_sizes: Tuple[int, ...] = (1, 2, 3), refresh_sec: int = 10, rebuild_sec: int = 3600):
+        self.ngram_sizes = tuple(sorted(ngram_sizes))
+        self.refresh_sec = refresh_sec
+        self.rebuild_sec = rebuild_sec
+        self.ready = False
+        self._lock = threading.RLock()
+        self._docs: Dict[str, Dict[int, Tuple[str, str]]] = {}
+        self._postings: Dict[str, Dict[str, Set[int]]] = {}
+        self._last_id = 0
+        self._gaps: Dict[int, float] = {}
+        self._refreshed_at = 0.0
+
+    def init_app(self, app: FastAPI, session_factory, **kwargs):
+        """
+        앱 시작시 백그라운드 색인 생성 (시작을 막지 않음), rebuild_sec 간격으로 재생성
+        :param app: FastAPI 인스턴스
+        :param session_factory: 세션 생성 함수
+        :param kwargs:
+        :return:
+        """
+        self.refresh_sec = kwargs.get("AUTOCOMPLETE_REFRESH_SEC", self.refresh_sec)
+        self.rebuild_sec = kwargs.get("AUTOCOMPLETE_REBUILD_SEC", self.rebuild_sec)
+        if not kwargs.get("AUTOCOMPLETE_INDEX", True):
+            return
+
+        @app.on_event("startup")
+        async def start_autocomplete_index():
+            app.state.autocomplete_build = asyncio.create_task(self._build_forever(session_factory))
+
+        @app.on_event("shutdown")
+        async def stop_autocomplete_index():
+            app.state.autocomplete_build.cancel()
+
+    async def _build_forever(self, session_factory):
+        while True:
+            try:
+                started = time.perf_counter()
+                await anyio.to_thread.run_sync(self._load_with, session_factory)
+                logging.info("Autocomplete index built in %.1fms.", (time.perf_counter() - started) * 1000)
+            except Exception:
+                logging.exception("Autocomplete index build failed.")
+            await asyncio.sleep(self.rebuild_sec)
+
+    def _load_with(self, session_factory):
+        session = session_factory()
+        try:
+            self.load(session)
+        finally:
+            session.close()
+
+    def load(self, session: Session):
+        """
+        company_translation 전체로 색인 재생성
+        """
+        rows = session.execute(
+            select(
+                CompanyTranslation.id,
+                CompanyTranslation.language_code,
+                CompanyTranslation.name
+            ).order_by(CompanyTranslation.id)
+        ).all()
+        self.build(rows)
+
+    def build(self, rows: Iterable[Tuple[int, str, str]]):
+        """
+        (translation_id, language_code, name) 목록으로 색인 생성
+        """
+        docs: Dict[str, Dict[int, Tuple[str, str]]] = {}
+        postings: Dict[str, Dict[str, Set[int]]] = {}
+        seen = set()
+        for doc_id, language_code, name in rows:
+            self._index(docs, postings, doc_id, language_code, name)
+            seen.add(doc_id)
+
+        with self._lock:
+            self._docs = docs
+            self._postings = postings
+            self._last_id = 0
+            self._gaps = {}
+            self._track_gaps(seen, time.monotonic(), max_new=_MAX_GAPS)
+            self._refreshed_at = time.monotonic()
+            self.ready = True
+
+    def add(self, doc_id: int, language_code: str, name: str):
+        """
+        신규 회사명 색인 추가
+        마지막 id는 refresh에서만 갱신 (다른 워커의 행 누락 방지)
+        """
+        with self._lock:
+            self._index(self._docs, self._postings, doc_id, language_code, name)
+
+    def refresh(self, session: Session, force: bool = False):
+        """
+        다른 워커에서 추가된 회사명 반영
+        company_translation은 추가만 되므로 가장 오래된 비어있던 id(low-water mark) 이후의 행만 조회
+        id 순서와 다르게 commit 된 행은 비어있던 id부터 다시 조회해서 누락 방지 (이미 색인된 행은 제외)
+        """
+        if not self.ready:
+            return
+        if not force and time.monotonic() - self._refreshed_at < self.refresh_sec:
+            return
+        self._refreshed_at = time.monotonic()
+        with self._lock:
+            low_water = min(self._gaps, default=self._last_id + 1)
+        rows = session.execute(
+            select(
+                CompanyTranslation.id,
+                CompanyTranslation.language_code,
+                CompanyTranslation.name
+            ).where(CompanyTranslation.id >= low_water).order_by(CompanyTranslation.id)
+        ).all()
+        with self._lock:
+            for doc_id, language_code, name in rows:
+                if doc_id not in self._docs.get(language_code, ()):
+                    self._index(self._docs, self._postings, doc_id, language_code, name)
+            self._track_gaps({row[0] for row in rows}, time.monotonic())
+
+    def search(
+        self,
+        query: str,
+        language_code: str,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        ranked: bool = False
+    ) -> Optional[List[str]]:
+        """
+        회사명 부분 문자열 검색
+        결과는 translation id 순서로 반환
+        ranked인 경우 일치 > 접두어 > 부분 일치, 짧은 이름 순으로 반환
+        색인을 사용할 수 없는 경우 None 반환
+        """
+        if not self.ready or any(c in query for c in _LIKE_SPECIAL_CHARS):
+            return None
+
+        needle = query.lower()
+        sizes = [n for n in self.ngram_sizes if n <= len(needle)]
+        if not sizes:
+            # 가장 작은 n-gram 보다 짧은 검색어는 DB 경로로 처리 (전체 목록 확인 방지)
+            return None
+
+        n = sizes[-1]
+        with self._lock:
+            docs = self._docs.get(language_code)
+            if not docs:
+                return []
+            postings = self._postings[language_code]
+            lists = []
+            for gram in {needle[i:i + n] for i in range(len(needle) - n + 1)}:
+                posting = postings.get(gram)
+                if not posting:
+                    return []
+                lists.append(posting)
+            lists.sort(key=len)
+            candidates = set(lists[0])
+            for posting in lists[1:]:
+                candidates &= posting
+                if not candidates:
+                    return []
+
+        # 후보 확인, 정렬은 lock 밖에서 처리 (문서는 변경되지 않는 tuple)
+        if len(needle) > n:
+            matched = [doc_id for doc_id in candidates if needle in docs[doc_id][1]]
+        else:
+            matched = list(candidates)
+        if ranked:
+            def sort_key(doc_id):
+                lowered = docs[doc_id][1]
+                rank = 0 if lowered == needle else 1 if lowered.startswith(needle) else 2
+                return rank, len(lowered), doc_id
+        else:
+            sort_key = None
+
+        if limit is None:
+            matched.sort(key=sort_key)
+        else:
+            matched = heapq.nsmallest(offset + limit, matched, key=sort_key)
+        return [docs[doc_id][0] for doc_id in matched[offset:]]
+
+    def _track_gaps(self, seen: Set[int], now: float, max_new: Optional[int] = None):
+        """
+        조회된 id는 비어있는 id에서 제외하고 새로 비어있는 id 추가
+        max_new가 있으면 마지막 id 바로 앞 max_new 개까지만 추가 (전체 색인 생성시 오래전 rollback 된 id 제외)
+        _GAP_TIMEOUT_SEC 지난 id는 제외
+        """
+        for doc_id in seen:
+            self._gaps.pop(doc_id, None)
+        last_id = max(seen, default=self._last_id)
+        if last_id > self._last_id:
+            first_id = self._last_id if max_new is None else max(self._last_id, last_id - max_new)
+            for doc_id in range(first_id + 1, last_id):
+                if doc_id not in seen:
+                    self._gaps.setdefault(doc_id, now)
+            self._last_id = last_id
+        self._gaps = {doc_id: since for doc_id, since in self._gaps.items() if now - since < _GAP_TIMEOUT_SEC}
+
+    def _index(self, docs, postings, doc_id: int, language_code: str, name: str):
+        lowered = name.lower()
+        docs.setdefault(language_code, {})[doc_id] = (name, lowered)
+        lang_postings = postings.setdefault(language_code, {})
+        for n in self.ngram_sizes:
+            for i in range(len(lowered) - n + 1):
+                lang_postings.setdefault(lowered[i:i + n], set()).add(doc_id)
+
+
+autocomplete_index = NgramIndex()
@@ -0,0 +1,94 @@
+import argparse
+import asyncio
+import logging
+import os
+import re
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Dict, List, Tuple
+
+from fastapi import FastAPI
+
+_IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)$")
+
+
+class BootTimer:
+    """
+    앱 생성 단계별 소요 시간 기록
+    """
+
+    def __init__(self):
+        self.phases: Dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
+
+    def report(self) -> str:
+        total = sum(self.phases.values())
+        parts = ", ".join(f"{name}={sec * 1000:.1f}ms" for name, sec in self.phases.items())
+        return f"{total * 1000:.1f}ms ({parts})"
+
+
+def time_startup_hooks(app: FastAPI):
+    """
+    startup 훅별 소요 시간을 워커마다 기록
+    gunicorn --preload 실행시 create_app은 master에서 한번만 실행되고 재시작된 워커는 startup 훅만 실행
+    create_app 마지막에 호출 (이후 등록된 훅은 기록되지 않음)
+    """
+    handlers = list(app.router.on_startup)
+
+    async def timed_startup():
+        timer = BootTimer()
+        for handler in handlers:
+            with timer.phase(handler.__name__):
+                if asyncio.iscoroutinefunction(handler):
+                    await handler()
+                else:
+                    handler()
+        app.state.startup_phases = timer.phases
+        logging.info("Worker %d started in %s", os.getpid(), timer.report())
+
+    app.router.on_startup = [timed_startup]
+
+
+def import_breakdown(module: str = "app.main", top: int = 15) -> List[Tuple[str, float]]:
+    """
+    module import 시간을 최상위 패키지별로 집계
+    python -X importtime 결과에서 각 패키지가 처음 import 될 때의 self 시간을 합산
+    :return: (패키지, ms) 목록, 오래 걸린 순
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    totals: Dict[str, float] = defaultdict(float)
+    for line in result.stderr.splitlines():
+        matched = _IMPORT_TIME_LINE.match(line)
+        if matched:
+            self_us, _, _, name = matched.groups()
+            totals[name.split(".")[0]] += int(self_us) / 1000
+    return sorted(totals.items(), key=lambda item: item[1], reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="import 시간 패키지별 집계")
+    parser.add_argument("module", nargs="?", default="app.main")
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    breakdown = import_breakdown(args.module, args.top)
+    for name, ms in breakdown:
+        print(f"{ms:10.1f}ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,448 @@
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from functools import partial
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+import anyio.to_thread
+import msgpack
+from fastapi import FastAPI
+from sqlalchemy.util.concurrency import await_only, in_greenlet
+
+# 태그별 마지막 무효화 세대를 기억하는 최대 태그 수
+_MAX_INVALIDATED_TAGS = 4096
+
+# Redis 항목 조회 (KEYS: 항목 키, ARGV[1]: 태그 버전 키 prefix)
+# 항목은 hash (v: 값, t:<태그>: 저장 시점 태그 버전), 태그 버전이 모두 같은 항목의 값만 반환
+_REDIS_GET_SCRIPT = """
+local result = {}
+for i, key in ipairs(KEYS) do
+    local entry = redis.call('HGETALL', key)
+    local value = false
+    for j = 1, #entry, 2 do
+        if entry[j] == 'v' then
+            value = entry[j + 1]
+        elseif (redis.call('GET', ARGV[1] .. string.sub(entry[j], 3)) or '0') ~= entry[j + 1] then
+            value = false
+            break
+        end
+    end
+    result[i] = value
+end
+return result
+"""
+
+# Redis 항목 저장 (KEYS[1]: 항목 키, KEYS[2]: 세대 키, KEYS[3..]: 태그 버전 키)
+# ARGV[1]: 조회 전 세대 (없으면 ''), ARGV[2]: ttl, ARGV[3]: 태그 버전 키 ttl, ARGV[4]: 값, ARGV[5..]: 태그
+# 세대가 바뀌었으면 저장하지 않음, 참조하는 태그 버전 키는 항목보다 먼저 만료되지 않도록 ttl 연장
+_REDIS_SET_SCRIPT = """
+if ARGV[1] ~= '' and (redis.call('GET', KEYS[2]) or '0') ~= ARGV[1] then
+    return 0
+end
+local fields = {'v', ARGV[4]}
+for i = 3, #KEYS do
+    local version = redis.call('GET', KEYS[i])
+    if version then
+        redis.call('EXPIRE', KEYS[i], ARGV[3])
+    end
+    table.insert(fields, 't:' .. ARGV[i + 2])
+    table.insert(fields, version or '0')
+end
+redis.call('DEL', KEYS[1])
+redis.call('HSET', KEYS[1], unpack(fields))
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+return 1
+"""
+
+
+def cache_key(*parts) -> str:
+    """
+    캐시 키 생성
+    :param parts: 키 구성 요소
+    :return: 문자열 키
+    """
+    return json.dumps(parts, ensure_ascii=False, separators=(",", ":"))
+
+
+class CacheBackend:
+    """
+    캐시 백엔드 인터페이스
+    값은 dict, list 등 직렬화 가능한 데이터만 저장
+    generation은 DB 조회 전에 받아두고 set에 전달 (조회 도중 무효화된 값은 저장하지 않음)
+    """
+
+    def get(self, key: str) -> Optional[Any]:
+        raise NotImplementedError
+
+    def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        return [self.get(key) for key in keys]
+
+    def generation(self) -> Optional[int]:
+        return None
+
+    def set(self, key: str, value: Any, tags: Iterable[str] = (), generation: Optional[int] = None):
+        raise NotImplementedError
+
+    def invalidate_tags(self, *tags: str):
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+    def stats(self) -> Dict[str, Any]:
+        raise NotImplementedError
+
+
+class NullCache(CacheBackend):
+    """
+    캐시 미사용
+    """
+
+    def get(self, key: str) -> Optional[Any]:
+        return None
+
+    def set(self, key: str, value: Any, tags: Iterable[str] = (), generation: Optional[int] = None):
+        pass
+
+    def invalidate_tags(self, *tags: str):
+        pass
+
+    def clear(self):
+        pass
+
+    def stats(self) -> Dict[str, Any]:
+        return dict(backend="null")
+
+
+class LRUCache(CacheBackend):
+    """
+    프로세스 메모리 LRU 캐시
+    최대 개수를 넘으면 가장 오래 사용하지 않은 항목부터 삭제
+    ttl(초)이 지난 항목은 조회시 삭제
+    무효화마다 세대를 증가시키고 태그별 마지막 무효화 세대를 기록
+    set에 전달된 세대 이후 무효화된 태그가 있으면 저장하지 않음
+    워커(프로세스)별 캐시이므로 다중 워커 환경은 redis 백엔드 사용
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+        self._tag_keys: Dict[str, Set[str]] = {}
+        self._generation = 0
+        self._invalidated: "OrderedDict[str, int]" = OrderedDict()
+        # 기록에서 삭제된 태그 중 가장 최근 무효화 세대
+        self._forgotten = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+            expires_at, value, _ = item
+            if expires_at < time.monotonic():
+                self._remove(key)
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def generation(self) -> int:
+        return self._generation
+
+    def set(self, key: str, value: Any, tags: Iterable[str] = (), generation: Optional[int] = None):
+        tags = tuple(tags)
+        with self._lock:
+            if generation is not None and self._invalidated_since(tags, generation):
+                return
+            if key in self._data:
+                self._remove(key)
+            self._data[key] = (time.monotonic() + self.ttl, value, tags)
+            for tag in tags:
+                self._tag_keys.setdefault(tag, set()).add(key)
+            while len(self._data) > self.maxsize:
+                self._remove(next(iter(self._data)))
+                self.evictions += 1
+
+    def invalidate_tags(self, *tags: str):
+        with self._lock:
+            self._generation += 1
+            for tag in tags:
+                for key in self._tag_keys.pop(tag, ()):
+                    self._remove(key)
+                self._invalidated[tag] = self._generation
+                self._invalidated.move_to_end(tag)
+            while len(self._invalidated) > _MAX_INVALIDATED_TAGS:
+                _, self._forgotten = self._invalidated.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._forgotten = self._generation
+            self._invalidated.clear()
+            self._data.clear()
+            self._tag_keys.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return dict(
+            backend="lru",
+            size=len(self._data),
+            maxsize=self.maxsize,
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            hit_ratio=round(self.hits / total, 4) if total else 0.0,
+        )
+
+    def _invalidated_since(self, tags: Iterable[str], generation: int) -> bool:
+        if self._forgotten > generation:
+            return True
+        return any(self._invalidated.get(tag, 0) > generation for tag in tags)
+
+    def _remove(self, key: str):
+        item = self._data.pop(key, None)
+        if item is None:
+            return
+        for tag in item[2]:
+            keys = self._tag_keys.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tag_keys[tag]
+
+
+class RedisCache(CacheBackend):
+    """
+    워커 간 공유 Redis 캐시
+    값은 msgpack으로 직렬화하고 저장 시점의 태그 버전을 함께 hash로 저장
+    태그 무효화는 버전 키, 세대 키 증가로 처리하여 조회시 버전이 다르면 miss
+    set에 전달된 세대 이후 무효화가 있었으면 저장하지 않음 (DB 조회 전 태그 버전으로 저장)
+    조회(get_many 포함), 저장은 Lua 스크립트로 한번에 처리 (태그 버전 키 추가 왕복 없음, 단일 Redis 기준)
+    태그 버전 키는 version_ttl 후 만료 (항목 저장시 연장하므로 참조하는 항목보다 먼저 만료되지 않음)
+    AsyncSession.run_sync 안에서 호출되면 Redis I/O는 스레드풀에서 실행 (이벤트 루프 차단 방지)
+    Redis 장애시 retry_sec 동안 캐시 없이 동작
+    """
+
+    def __init__(
+        self,
+        client,
+        ttl: int = 60,
+        prefix: str = "choco:",
+        retry_sec: float = 30,
+        version_ttl: int = None
+    ):
+        self.client = client
+        self.ttl = ttl
+        self.version_ttl = version_ttl or ttl * 10
+        self.prefix = prefix
+        self.retry_sec = retry_sec
+        self._down_until = 0.0
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self._get_script = client.register_script(_REDIS_GET_SCRIPT)
+        self._set_script = client.register_script(_REDIS_SET_SCRIPT)
+
+    @classmethod
+    def from_url(cls, url: str, socket_timeout: float = 0.05, **kwargs) -> "RedisCache":
+        import redis
+        client = redis.Redis.from_url(url, socket_timeout=socket_timeout, socket_connect_timeout=socket_timeout)
+        return cls(client, **kwargs)
+
+    def get(self, key: str) -> Optional[Any]:
+        return self.get_many([key])[0]
+
+    def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        if not keys:
+            return []
+        if not self._available():
+            self.misses += len(keys)
+            return [None] * len(keys)
+        try:
+            raws = self._run(self._get_script, list(map(self._entry_key, keys)), [f"{self.prefix}ver:"])
+        except Exception as e:
+            self._mark_down(e)
+            self.misses += len(keys)
+            return [None] * len(keys)
+
+        values = [msgpack.unpackb(raw, raw=False) if raw else None for raw in raws]
+        hits = sum(raw is not None for raw in raws)
+        self.hits += hits
+        self.misses += len(keys) - hits
+        return values
+
+    def generation(self) -> Optional[int]:
+        if not self._available():
+            return None
+        try:
+            return int(self._run(self.client.get, self._generation_key()) or 0)
+        except Exception as e:
+            self._mark_down(e)
+            return None
+
+    def set(self, key: str, value: Any, tags: Iterable[str] = (), generation: Optional[int] = None):
+        if not self._available():
+            return
+        try:
+            self._run(self._set, key, value, sorted(set(tags)), generation)
+        except Exception as e:
+            self._mark_down(e)
+
+    def invalidate_tags(self, *tags: str):
+        if not self._available():
+            return
+        try:
+            self._run(self._invalidate, tags)
+        except Exception as e:
+            self._mark_down(e)
+
+    def clear(self):
+        try:
+            keys = list(self.client.scan_iter(match=self.prefix + "*"))
+            if keys:
+                self.client.delete(*keys)
+        except Exception as e:
+            self._mark_down(e)
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return dict(
+            backend="redis",
+            available=self._available(),
+            hits=self.hits,
+            misses=self.misses,
+            errors=self.errors,
+            hit_ratio=round(self.hits / total, 4) if total else 0.0,
+        )
+
+    def _set(self, key: str, value: Any, tags: List[str], generation: Optional[int]):
+        self._set_script(
+            [self._entry_key(key), self._generation_key(), *map(self._version_key, tags)],
+            [
+                "" if generation is None else generation,
+                self.ttl,
+                self.version_ttl,
+                msgpack.packb(value, use_bin_type=True),
+                *tags
+            ]
+        )
+
+    def _invalidate(self, tags: Iterable[str]):
+        pipe = self.client.pipeline(transaction=True)
+        for tag in tags:
+            pipe.incr(self._version_key(tag))
+            pipe.expire(self._version_key(tag), self.version_ttl)
+        pipe.incr(self._generation_key())
+        pipe.execute()
+
+    def _entry_key(self, key: str) -> str:
+        # 이전 형식(문자열) 항목과 겹치지 않도록 hash 항목은 별도 prefix 사용
+        return f"{self.prefix}e:{key}"
+
+    def _version_key(self, tag: str) -> str:
+        return f"{self.prefix}ver:{tag}"
+
+    def _generation_key(self) -> str:
+        return f"{self.prefix}gen"
+
+    @staticmethod
+    def _run(fn, *args):
+        """
+        AsyncSession.run_sync 안(이벤트 루프 스레드)이면 스레드풀에서 실행 후 결과 대기
+        """
+        if in_greenlet():
+            return await_only(anyio.to_thread.run_sync(partial(fn, *args)))
+        return fn(*args)
+
+    def _available(self) -> bool:
+        return time.monotonic() >= self._down_until
+
+    def _mark_down(self, error: Exception):
+        self.errors += 1
+        self._down_until = time.monotonic() + self.retry_sec
+        logging.warning("Redis cache unavailable for %ss: %s", self.retry_sec, error)
+
+
+class Cache:
+    """
+    서비스 결과 캐시
+    init_app에서 설정에 따라 백엔드 선택
+    """
+
+    def __init__(self, app: FastAPI = None, **kwargs):
+        self.backend: CacheBackend = NullCache()
+        if app is not None:
+            self.init_app(app=app, **kwargs)
+
+    def init_app(self, app: FastAPI, **kwargs):
+        """
+        캐시 초기화 함수
+        :param app: FastAPI 인스턴스
+        :param kwargs:
+        :return:
+        """
+        if not kwargs.get("CACHE_ENABLED", True):
+            self.backend = NullCache()
+            return
+        if kwargs.get("CACHE_BACKEND") == "redis":
+            self.backend = RedisCache.from_url(
+                f"redis://{kwargs.get('REDIS_HOST', 'localhost')}:{kwargs.get('REDIS_PORT', 6379)}/0",
+                socket_timeout=kwargs.get("CACHE_REDIS_TIMEOUT", 0.05),
+                ttl=kwargs.get("CACHE_TTL", 60),
+                retry_sec=kwargs.get("CACHE_REDIS_RETRY_SEC", 30),
+            )
+            return
+        self.backend = LRUCache(
+            maxsize=kwargs.get("CACHE_MAXSIZE", 1024),
+            ttl=kwargs.get("CACHE_TTL", 60),
+        )
+
+    def get(self, key: str) -> Optional[Any]:
+        return self.backend.get(key)
+
+    def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """
+        여러 키 한번에 조회 (Redis는 한번의 왕복)
+        """
+        return self.backend.get_many(keys)
+
+    def generation(self) -> Optional[int]:
+        """
+        DB 조회 전 무효화 세대 (set에 전달)
+        """
+        return self.backend.generation()
+
+    def set(self, key: str, value: Any, tags: Iterable[str] = (), generation: Optional[int] = None):
+        self.backend.set(key, value, tags, generation)
+
+    def invalidate_tags(self, *tags: str):
+        if tags:
+            self.backend.invalidate_tags(*tags)
+
+    def clear(self):
+        self.backend.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return self.backend.stats()
+
+    def metric_gauges(self):
+        """
+        캐시 적중률 메트릭 (gauge collector)
+        """
+        stats = self.stats()
+        labels = dict(backend=stats["backend"])
+        for key in ("hits", "misses", "hit_ratio"):
+            if key in stats:
+                yield f"cache_{key}", labels, stats[key]
+
+
+cache = Cache()
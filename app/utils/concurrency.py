@@ -0,0 +1,151 @@
+import time
+from contextlib import asynccontextmanager
+from typing import Dict
+
+import sqlalchemy.exc
+from fastapi import FastAPI
+from starlette.requests import Request
+
+from app.errors.exceptions import ServiceUnavailableEx
+from app.utils.metrics import metrics
+
+metrics.describe("concurrency_rejected_total", "Requests rejected by the per-route concurrency limit.")
+
+
+class AIMDLimit:
+    """
+    지연 시간 기반 AIMD 동시 실행 한도
+    느린 응답(latency_sec 초과), 커넥션 풀 timeout, DB 에러는 한도를 backoff 비율로 감소
+    감소는 한 구간에 한번만 적용 (마지막 감소 이전에 시작된 요청의 느린 응답은 무시)
+    정상 응답은 한도의 절반 이상 사용 중일 때만 1 / 한도 만큼 증가 (한도만큼 처리하면 약 1 증가)
+    """
+
+    def __init__(
+        self,
+        initial: int = 20,
+        min_limit: int = 2,
+        max_limit: int = 200,
+        latency_sec: float = 1.0,
+        backoff: float = 0.9,
+    ):
+        self.limit = float(initial)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_sec = latency_sec
+        self.backoff = backoff
+        self.in_flight = 0
+        self.rejected = 0
+        self._last_decrease = float("-inf")
+
+    def try_acquire(self) -> bool:
+        if self.in_flight >= int(self.limit):
+            self.rejected += 1
+            return False
+        self.in_flight += 1
+        return True
+
+    def release(self, latency: float, dropped: bool = False, now: float = None):
+        """
+        :param latency: 처리 시간 (초)
+        :param dropped: 커넥션 풀 timeout, DB 에러 여부
+        :param now: 완료 시각 (time.monotonic 기준)
+        """
+        in_flight = self.in_flight
+        self.in_flight -= 1
+        if dropped or latency > self.latency_sec:
+            now = time.monotonic() if now is None else now
+            if now - latency >= self._last_decrease:
+                self.limit = max(self.min_limit, self.limit * self.backoff)
+                self._last_decrease = now
+        elif in_flight * 2 >= self.limit:
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+
+
+class ConcurrencyLimiter:
+    """
+    라우트별 동시 실행 한도 (async yield 의존성)
+    한도를 넘으면 DB 커넥션을 기다리지 않고 바로 503, Retry-After 응답
+    일괄 처리 라우트는 bulk 의존성으로 별도 지연 기준(bulk_latency_sec) 사용
+    상태는 이벤트 루프에서만 변경 (sync 핸들러도 의존성은 이벤트 루프에서 실행)
+    """
+
+    def __init__(self, app: FastAPI = None, **kwargs):
+        self.enabled = True
+        self.options = dict()
+        self.bulk_latency_sec = 60.0
+        self.retry_after = 1
+        self._limits: Dict[str, AIMDLimit] = {}
+        if app is not None:
+            self.init_app(app=app, **kwargs)
+
+    def init_app(self, app: FastAPI, **kwargs):
+        """
+        동시 실행 한도 초기화 함수
+        :param app: FastAPI 인스턴스
+        :param kwargs:
+        :return:
+        """
+        self.enabled = kwargs.get("CONCURRENCY_LIMIT_ENABLED", True)
+        self.options = dict(
+            initial=kwargs.get("CONCURRENCY_LIMIT_INITIAL", 20),
+            min_limit=kwargs.get("CONCURRENCY_LIMIT_MIN", 2),
+            max_limit=kwargs.get("CONCURRENCY_LIMIT_MAX", 200),
+            latency_sec=kwargs.get("CONCURRENCY_LIMIT_LATENCY_SEC", 1.0),
+            backoff=kwargs.get("CONCURRENCY_LIMIT_BACKOFF", 0.9),
+        )
+        self.bulk_latency_sec = kwargs.get("CONCURRENCY_LIMIT_BULK_LATENCY_SEC", 60.0)
+        self.retry_after = kwargs.get("CONCURRENCY_RETRY_AFTER_SEC", 1)
+        self._limits = {}
+
+    def limit_for(self, route: str, bulk: bool = False) -> AIMDLimit:
+        limit = self._limits.get(route)
+        if limit is None:
+            options = dict(self.options, latency_sec=self.bulk_latency_sec) if bulk else self.options
+            limit = self._limits[route] = AIMDLimit(**options)
+        return limit
+
+    async def __call__(self, request: Request):
+        async with self._limit(request, bulk=False):
+            yield
+
+    async def bulk(self, request: Request):
+        """
+        일괄 처리 라우트용 의존성
+        처리 시간이 요청 본문 크기에 비례하므로 bulk_latency_sec 초과시에만 느린 응답으로 판단
+        """
+        async with self._limit(request, bulk=True):
+            yield
+
+    @asynccontextmanager
+    async def _limit(self, request: Request, bulk: bool):
+        if not self.enabled:
+            yield
+            return
+        route = f"{request.method} {request.scope['route'].path}"
+        limit = self.limit_for(route, bulk)
+        if not limit.try_acquire():
+            metrics.inc("concurrency_rejected_total", dict(route=route))
+            raise ServiceUnavailableEx(retry_after=self.retry_after)
+
+        start = time.monotonic()
+        dropped = False
+        try:
+            yield
+        except (sqlalchemy.exc.TimeoutError, sqlalchemy.exc.OperationalError):
+            dropped = True
+            raise
+        finally:
+            now = time.monotonic()
+            limit.release(now - start, dropped, now)
+
+    def metric_gauges(self):
+        """
+        라우트별 한도, 실행 중 요청 수 (gauge collector)
+        """
+        for route, limit in self._limits.items():
+            labels = dict(route=route)
+            yield "concurrency_limit", labels, round(limit.limit, 3)
+            yield "concurrency_in_flight", labels, limit.in_flight
+
+
+concurrency_limiter = ConcurrencyLimiter()
@@ -0,0 +1,41 @@
+import hashlib
+from typing import Dict, Optional
+
+from starlette.responses import Response
+
+from app.utils.cache import cache_key
+
+# 응답 언어가 x-wanted-language 헤더에 따라 달라짐 (CDN 캐시 키)
+VARY = "x-wanted-language"
+
+
+def make_etag(*parts) -> str:
+    """
+    구성 요소로 strong ETag 생성
+    """
+    digest = hashlib.blake2b(cache_key(*parts).encode(), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    If-None-Match 헤더에 etag가 있는지 확인 (weak 비교, W/ 접두어 무시)
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag for candidate in if_none_match.split(",")
+    )
+
+
+def etag_headers(etag: str) -> Dict[str, str]:
+    return {"ETag": etag, "Vary": VARY}
+
+
+def not_modified(etag: str) -> Response:
+    """
+    본문 없는 304 응답
+    """
+    return Response(status_code=304, headers=etag_headers(etag))
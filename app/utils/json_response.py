@@ -0,0 +1,49 @@
+from typing import Any, Mapping, Union
+
+import pydantic_core
+from fastapi import FastAPI
+from starlette.responses import JSONResponse
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    pydantic_core로 직렬화하는 JSONResponse
+    응답 모델을 dict 변환, 재검증 없이 바로 JSON으로 출력
+    출력 바이트는 JSONResponse와 동일 (공백 없음, ensure_ascii=False)
+    """
+
+    def render(self, content: Any) -> bytes:
+        return pydantic_core.to_json(content)
+
+
+class FastJSON:
+    """
+    목록 응답 빠른 직렬화 (FAST_JSON_RESPONSE 설정시)
+    사용하지 않으면 FastAPI response_model 검증, 직렬화 그대로 사용
+    """
+
+    def __init__(self, app: FastAPI = None, **kwargs):
+        self.enabled = False
+        if app is not None:
+            self.init_app(app=app, **kwargs)
+
+    def init_app(self, app: FastAPI, **kwargs):
+        """
+        빠른 직렬화 초기화 함수
+        :param app: FastAPI 인스턴스
+        :param kwargs:
+        :return:
+        """
+        self.enabled = kwargs.get("FAST_JSON_RESPONSE", False)
+
+    def response(self, content: Any, headers: Mapping[str, str] = None) -> Union[FastJSONResponse, Any]:
+        """
+        사용시 FastJSONResponse, 아니면 content 그대로 반환
+        :param headers: FastJSONResponse에 추가할 헤더 (미사용시 라우터의 Response 파라미터로 설정)
+        """
+        if self.enabled:
+            return FastJSONResponse(content, headers=headers)
+        return content
+
+
+fast_json = FastJSON()
@@ -1,17 +1,134 @@
 import json
 import logging
-from datetime import timedelta, datetime
+import queue
+import random
+from datetime import timedelta, datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
 from time import time
+from fastapi import FastAPI
 from fastapi.requests import Request
 from fastapi.logger import logger
 
 logger.setLevel(logging.INFO)
 
+KST = timezone(timedelta(hours=9), "KST")
+TIME_FORMAT = "%Y/%m/%d %H:%M:%S"
 
-async def api_logger(request: Request, response=None, error=None):
-    time_format = "%Y/%m/%d %H:%M:%S"
+
+class _NonBlockingQueueHandler(QueueHandler):
+    """
+    요청 처리 중에는 레코드를 큐에 넣기만 함
+    큐가 가득 차면 기다리지 않고 버림
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 직렬화는 listener 스레드에서 처리
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _AccessLogEmitter(logging.Handler):
+    """
+    listener 스레드에서 접근 로그를 JSON으로 직렬화 후 fastapi 로거로 출력
+    """
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            log_dict = record.msg
+            sql_stats = log_dict.get("sql")
+            if sql_stats is not None:
+                log_dict["sql"] = sql_stats.as_dict()
+            log_dict["datetimeUTC"] = datetime.fromtimestamp(record.created, timezone.utc).strftime(TIME_FORMAT)
+            log_dict["datetimeKST"] = datetime.fromtimestamp(record.created, KST).strftime(TIME_FORMAT)
+            record.msg = json.dumps(log_dict)
+            record.args = None
+            logger.handle(record)
+        except Exception:
+            self.handleError(record)
+
+
+class AccessLog:
+    """
+    접근 로그 파이프라인
+    요청 경로에서는 로그 레코드를 큐에 넣고 QueueListener 스레드가 직렬화, 출력
+    2xx 응답은 LOG_SAMPLE_RATE_2XX 비율만 기록, 에러는 항상 기록
+    """
+
+    def __init__(self, app: FastAPI = None, **kwargs):
+        self.sample_rate_2xx = 1.0
+        self._queue: queue.Queue = queue.Queue(maxsize=10000)
+        self._handler = _NonBlockingQueueHandler(self._queue)
+        self._logger = logging.getLogger("app.access")
+        self._logger.setLevel(logging.INFO)
+        self._logger.propagate = False
+        self._logger.addHandler(self._handler)
+        self._listener = None
+        if app is not None:
+            self.init_app(app=app, **kwargs)
+
+    def init_app(self, app: FastAPI, **kwargs):
+        """
+        접근 로그 초기화 함수
+        listener 스레드는 워커 프로세스에서 시작 (gunicorn --preload 대응)
+        :param app: FastAPI 인스턴스
+        :param kwargs:
+        :return:
+        """
+        self.sample_rate_2xx = kwargs.get("LOG_SAMPLE_RATE_2XX", 1.0)
+        self._queue.maxsize = kwargs.get("LOG_QUEUE_SIZE", 10000)
+
+        @app.on_event("startup")
+        def start_access_log():
+            self.start()
+
+        @app.on_event("shutdown")
+        def stop_access_log():
+            self.stop()
+
+    def start(self):
+        if self._listener is None:
+            self._listener = QueueListener(self._queue, _AccessLogEmitter())
+            self._listener.start()
+
+    def stop(self):
+        """
+        큐에 남은 로그를 모두 출력 후 종료
+        """
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+
+    @property
+    def dropped(self) -> int:
+        return self._handler.dropped
+
+    def log(self, level: int, log_dict: dict):
+        self._logger.log(level, log_dict)
+
+    def sampled(self, status_code: int) -> bool:
+        if 200 <= status_code < 300 and self.sample_rate_2xx < 1.0:
+            return random.random() < self.sample_rate_2xx
+        return True
+
+
+access_log = AccessLog()
+
+
+async def api_logger(request: Request, status_code: int = None, error=None):
     t = time() - request.state.start
-    status_code = error.status_code if error else response.status_code
+    if error:
+        status_code = error.status_code
+    elif not access_log.sampled(status_code):
+        return
     error_log = None
     if error:
         if request.state.inspect:
@@ -35,16 +152,15 @@ async def api_logger(request: Request, response=None, error=None):
     )
 
     log_dict = dict(
-        url=str(request.url.hostname) + str(request.url.path),
-        method=str(request.method),
+        url=request.headers.get("host", "").split(":")[0] + request.scope["path"],
+        method=request.method,
         statusCode=status_code,
         errorDetail=error_log,
         client=user_log,
         processedTime=str(round(t * 1000, 5)) + "ms",
-        datetimeUTC=datetime.now().strftime(time_format),
-        datetimeKST=(datetime.now() + timedelta(hours=9)).strftime(time_format),
+        sql=getattr(request.state, "sql_stats", None),
     )
     if error and error.status_code >= 500:
-        logger.error(json.dumps(log_dict))
+        access_log.log(logging.ERROR, log_dict)
     else:
-        logger.info(json.dumps(log_dict))
+        access_log.log(logging.INFO, log_dict)
@@ -0,0 +1,282 @@
+import asyncio
+import bisect
+import glob
+import json
+import logging
+import os
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import anyio.to_thread
+from fastapi import FastAPI
+
+from app.common.consts import METRICS_MULTIPROC_DIR
+
+# 요청 처리 시간 histogram 구간 (초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 10.0)
+# 종료된 워커의 counter, histogram 누적 파일
+_ARCHIVE_FILE = "archive.json"
+
+Labels = Tuple[Tuple[str, str], ...]
+GaugeCollector = Callable[[], Iterable[Tuple[str, Dict[str, str], float]]]
+
+
+def _labels(labels: Dict[str, str]) -> Labels:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _format_labels(labels: Labels, extra: Iterable[Tuple[str, str]] = ()) -> str:
+    items = [*labels, *extra]
+    if not items:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in items) + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Metrics:
+    """
+    Prometheus text 형식 메트릭 레지스트리
+    counter, histogram은 요청 경로에서 갱신하고 gauge는 조회 시점에 collector로 수집
+    METRICS_MULTIPROC_DIR가 있으면 워커별 스냅샷 파일을 합산 (gunicorn 다중 워커)
+    """
+
+    def __init__(self, app: FastAPI = None, **kwargs):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[Labels, float]] = {}
+        self._histograms: Dict[str, Dict[Labels, List[float]]] = {}
+        self._buckets: Dict[str, Tuple[float, ...]] = {}
+        self._help: Dict[str, str] = {}
+        self._collectors: List[GaugeCollector] = []
+        self.multiproc_dir: Optional[str] = None
+        self.flush_sec = 5
+        if app is not None:
+            self.init_app(app=app, **kwargs)
+
+    def init_app(self, app: FastAPI, **kwargs):
+        """
+        메트릭 초기화 함수
+        다중 워커 모드는 워커마다 flush_sec 간격으로 스냅샷 파일 저장
+        :param app: FastAPI 인스턴스
+        :param kwargs:
+        :return:
+        """
+        self.multiproc_dir = kwargs.get("METRICS_MULTIPROC_DIR", METRICS_MULTIPROC_DIR)
+        self.flush_sec = kwargs.get("METRICS_FLUSH_SEC", self.flush_sec)
+        if not self.multiproc_dir:
+            return
+
+        @app.on_event("startup")
+        async def start_metrics_flush():
+            os.makedirs(self.multiproc_dir, exist_ok=True)
+            app.state.metrics_flush = asyncio.create_task(self._flush_forever())
+
+        @app.on_event("shutdown")
+        async def stop_metrics_flush():
+            app.state.metrics_flush.cancel()
+            self.flush()
+
+    def describe(self, name: str, help_text: str, buckets: Tuple[float, ...] = None):
+        self._help[name] = help_text
+        if buckets is not None:
+            self._buckets[name] = tuple(buckets)
+
+    def inc(self, name: str, labels: Dict[str, str], value: float = 1):
+        key = _labels(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def observe(self, name: str, labels: Dict[str, str], value: float):
+        buckets = self._buckets.get(name, LATENCY_BUCKETS)
+        key = _labels(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            counts = series.get(key)
+            if counts is None:
+                # 구간별 개수 + (+Inf 개수, 합계)
+                counts = series[key] = [0.0] * (len(buckets) + 2)
+            counts[bisect.bisect_left(buckets, value)] += 1
+            counts[-1] += value
+
+    def register_gauges(self, collector: GaugeCollector):
+        """
+        조회 시점에 (이름, 라벨, 값) 목록을 반환하는 gauge collector 등록
+        """
+        self._collectors.append(collector)
+
+    def snapshot(self) -> dict:
+        gauges = []
+        for collector in self._collectors:
+            try:
+                gauges.extend((name, _labels(labels), value) for name, labels, value in collector())
+            except Exception:
+                logging.exception("Metrics collector failed.")
+        with self._lock:
+            return dict(
+                counters={name: [[list(k), v] for k, v in series.items()] for name, series in self._counters.items()},
+                histograms={
+                    name: [[list(k), list(v)] for k, v in series.items()] for name, series in self._histograms.items()
+                },
+                gauges=[[name, list(labels), value] for name, labels, value in gauges],
+            )
+
+    def flush(self):
+        """
+        현재 워커 스냅샷 파일 저장 (다중 워커 모드)
+        """
+        if not self.multiproc_dir:
+            return
+        path = os.path.join(self.multiproc_dir, f"{os.getpid()}.json")
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.snapshot(), f)
+        os.replace(tmp_path, path)
+
+    async def _flush_forever(self):
+        while True:
+            try:
+                self.flush()
+            except Exception:
+                logging.exception("Metrics flush failed.")
+            await asyncio.sleep(self.flush_sec)
+
+    def render(self) -> str:
+        """
+        Prometheus text 형식 출력
+        다중 워커 모드는 현재 워커를 저장 후 모든 워커 파일 합산
+        gauge는 워커별 값으로 pid 라벨 추가
+        """
+        if not self.multiproc_dir:
+            return self._render([(None, self.snapshot())])
+        self.flush()
+        snapshots = []
+        for path in sorted(glob.glob(os.path.join(self.multiproc_dir, "*.json"))):
+            try:
+                with open(path) as f:
+                    snapshots.append((os.path.basename(path)[:-5], json.load(f)))
+            except (OSError, ValueError):
+                continue
+        return self._render(snapshots)
+
+    def _render(self, snapshots: List[Tuple[Optional[str], dict]]) -> str:
+        counters: Dict[str, Dict[Labels, float]] = {}
+        histograms: Dict[str, Dict[Labels, List[float]]] = {}
+        gauges: Dict[str, List[Tuple[Labels, float]]] = {}
+        for pid, snapshot in snapshots:
+            _merge(counters, histograms, snapshot)
+            for name, labels, value in snapshot.get("gauges", []):
+                labels = tuple(map(tuple, labels))
+                if pid is not None:
+                    labels = labels + (("pid", pid),)
+                gauges.setdefault(name, []).append((labels, value))
+
+        lines = []
+        for name, series in sorted(counters.items()):
+            lines.extend(self._header(name, "counter"))
+            lines.extend(f"{name}{_format_labels(k)} {_format_value(v)}" for k, v in sorted(series.items()))
+        for name, series in sorted(histograms.items()):
+            buckets = self._buckets.get(name, LATENCY_BUCKETS)
+            lines.extend(self._header(name, "histogram"))
+            for k, counts in sorted(series.items()):
+                cumulative = 0
+                for bound, count in zip((*buckets, "+Inf"), counts):
+                    cumulative += count
+                    le = bound if bound == "+Inf" else repr(float(bound))
+                    lines.append(f"{name}_bucket{_format_labels(k, [('le', le)])} {_format_value(cumulative)}")
+                lines.append(f"{name}_count{_format_labels(k)} {_format_value(cumulative)}")
+                lines.append(f"{name}_sum{_format_labels(k)} {_format_value(counts[-1])}")
+        for name, series in sorted(gauges.items()):
+            lines.extend(self._header(name, "gauge"))
+            lines.extend(f"{name}{_format_labels(k)} {_format_value(v)}" for k, v in series)
+        return "\n".join(lines) + "\n"
+
+    def _header(self, name: str, metric_type: str) -> List[str]:
+        lines = [f"# HELP {name} {self._help[name]}"] if name in self._help else []
+        return lines + [f"# TYPE {name} {metric_type}"]
+
+
+def _merge(counters: dict, histograms: dict, snapshot: dict):
+    for name, series in snapshot.get("counters", {}).items():
+        merged = counters.setdefault(name, {})
+        for labels, value in series:
+            key = tuple(map(tuple, labels))
+            merged[key] = merged.get(key, 0) + value
+    for name, series in snapshot.get("histograms", {}).items():
+        merged = histograms.setdefault(name, {})
+        for labels, values in series:
+            key = tuple(map(tuple, labels))
+            if key in merged:
+                merged[key] = [a + b for a, b in zip(merged[key], values)]
+            else:
+                merged[key] = list(values)
+
+
+def threadpool_gauges():
+    """
+    sync 엔드포인트 스레드풀 사용량, 대기 작업 수 (gauge collector)
+    이벤트 루프 밖에서 호출되면 수집하지 않음
+    """
+    try:
+        limiter = anyio.to_thread.current_default_thread_limiter()
+    except RuntimeError:
+        return []
+    stats = limiter.statistics()
+    return [
+        ("threadpool_size", {}, stats.total_tokens),
+        ("threadpool_busy", {}, stats.borrowed_tokens),
+        ("threadpool_queue_depth", {}, stats.tasks_waiting),
+    ]
+
+
+def mark_process_dead(pid: int, multiproc_dir: str = METRICS_MULTIPROC_DIR):
+    """
+    종료된 워커의 counter, histogram은 누적 파일에 합치고 워커 파일 삭제 (gauge는 제외)
+    gunicorn child_exit 훅에서 호출
+    """
+    if not multiproc_dir:
+        return
+    path = os.path.join(multiproc_dir, f"{pid}.json")
+    try:
+        with open(path) as f:
+            snapshot = json.load(f)
+    except (OSError, ValueError):
+        return
+
+    archive_path = os.path.join(multiproc_dir, _ARCHIVE_FILE)
+    counters, histograms = {}, {}
+    try:
+        with open(archive_path) as f:
+            _merge(counters, histograms, json.load(f))
+    except (OSError, ValueError):
+        pass
+    _merge(counters, histograms, snapshot)
+
+    tmp_path = archive_path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(dict(
+            counters={name: [[list(k), v] for k, v in series.items()] for name, series in counters.items()},
+            histograms={name: [[list(k), v] for k, v in series.items()] for name, series in histograms.items()},
+        ), f)
+    os.replace(tmp_path, archive_path)
+    os.remove(path)
+
+
+def clear_multiproc_dir(multiproc_dir: str = METRICS_MULTIPROC_DIR):
+    """
+    서버 시작시 이전 실행의 메트릭 파일 삭제
+    """
+    if not multiproc_dir:
+        return
+    os.makedirs(multiproc_dir, exist_ok=True)
+    for path in glob.glob(os.path.join(multiproc_dir, "*.json")):
+        os.remove(path)
+
+
+metrics = Metrics()
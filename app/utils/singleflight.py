@@ -0,0 +1,109 @@
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+from fastapi import FastAPI
+
+from app.utils.metrics import metrics
+
+T = TypeVar("T")
+
+metrics.describe("singleflight_shared_total", "Requests that shared an in-flight computation.")
+metrics.describe("singleflight_timeout_total", "Requests that stopped waiting for a slow in-flight computation.")
+
+
+class _Call:
+    """
+    진행 중인 동기 호출 결과
+    """
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    같은 키로 동시에 들어온 조회는 한번만 실행하고 결과 공유
+    키는 (엔드포인트, 파라미터, 언어, 엔진) 튜플
+    do는 스레드풀에서 실행되는 sync 핸들러용, do_async는 async 핸들러용
+    예외도 같이 기다린 요청에 그대로 전달
+    먼저 들어온 요청이 timeout_sec 안에 끝나지 않으면 기다리던 요청은 직접 실행
+    """
+
+    def __init__(self, app: FastAPI = None, **kwargs):
+        self.enabled = True
+        self.timeout_sec = 5.0
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._tasks: Dict[Hashable, asyncio.Future] = {}
+        if app is not None:
+            self.init_app(app=app, **kwargs)
+
+    def init_app(self, app: FastAPI, **kwargs):
+        """
+        요청 병합 초기화 함수
+        :param app: FastAPI 인스턴스
+        :param kwargs:
+        :return:
+        """
+        self.enabled = kwargs.get("SINGLE_FLIGHT_ENABLED", True)
+        self.timeout_sec = kwargs.get("SINGLE_FLIGHT_TIMEOUT_SEC", self.timeout_sec)
+
+    def do(self, key: Tuple[Hashable, ...], fn: Callable[[], T]) -> T:
+        if not self.enabled:
+            return fn()
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            metrics.inc("singleflight_shared_total", dict(endpoint=key[0]))
+            if not call.done.wait(self.timeout_sec):
+                metrics.inc("singleflight_timeout_total", dict(endpoint=key[0]))
+                return fn()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    async def do_async(self, key: Tuple[Hashable, ...], fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        먼저 들어온 요청의 task를 나머지 요청이 같이 기다림
+        먼저 들어온 요청이 취소되면 기다리던 요청은 직접 실행
+        """
+        if not self.enabled:
+            return await fn()
+        loop = asyncio.get_running_loop()
+        task = self._tasks.get(key)
+        if task is None or task.get_loop() is not loop:
+            task = self._tasks[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda done: self._tasks.pop(key, None) if self._tasks.get(key) is done else None)
+            return await task
+
+        metrics.inc("singleflight_shared_total", dict(endpoint=key[0]))
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), self.timeout_sec)
+        except asyncio.TimeoutError:
+            metrics.inc("singleflight_timeout_total", dict(endpoint=key[0]))
+            return await fn()
+        except asyncio.CancelledError:
+            if task.cancelled() and not asyncio.current_task().cancelling():
+                return await fn()
+            raise
+
+
+single_flight = SingleFlight()
@@ -0,0 +1,125 @@
+from contextlib import nullcontext
+from typing import Mapping
+
+from fastapi import FastAPI
+
+
+class _NoopSpan:
+    """
+    트레이싱 미사용시 span 대체
+    """
+
+    def set_attribute(self, key, value):
+        pass
+
+    def set_status(self, status):
+        pass
+
+    def record_exception(self, exception):
+        pass
+
+    def is_recording(self) -> bool:
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class Tracing:
+    """
+    요청 span 생성
+    opentelemetry는 TRACING_ENABLED인 경우에만 import (워커 기동 시간 단축)
+    샘플링: 상위 span(요청 헤더의 trace context)이 있으면 그 결정을 따르고 없으면 TRACING_SAMPLE_RATE 비율
+    내보내기: 기본은 BatchSpanProcessor (요청 경로에서는 큐에 넣기만 함, 큐가 가득 차면 버림)
+    """
+
+    def __init__(self, app: FastAPI = None, **kwargs):
+        self.enabled = False
+        self.provider = None
+        self.exporter = None
+        self._tracer = None
+        if app is not None:
+            self.init_app(app=app, **kwargs)
+
+    def init_app(self, app: FastAPI, **kwargs):
+        """
+        트레이싱 초기화 함수
+        TRACING_EXPORTER: otlp(OTEL_EXPORTER_OTLP_* 환경 변수 사용), console, memory(테스트용)
+        :param app: FastAPI 인스턴스
+        :param kwargs:
+        :return:
+        """
+        self.enabled = kwargs.get("TRACING_ENABLED", False)
+        if not self.enabled:
+            self.provider = self.exporter = self._tracer = None
+            return
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor, SimpleSpanProcessor
+        from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+
+        self.provider = TracerProvider(
+            sampler=ParentBased(TraceIdRatioBased(kwargs.get("TRACING_SAMPLE_RATE", 1.0))),
+            resource=Resource.create({"service.name": kwargs.get("TRACING_SERVICE_NAME", "choco-api")}),
+        )
+        self.exporter = _create_exporter(kwargs.get("TRACING_EXPORTER", "otlp"))
+        if kwargs.get("TRACING_BATCH_EXPORT", True):
+            max_queue_size = kwargs.get("TRACING_MAX_QUEUE_SIZE", 2048)
+            processor = BatchSpanProcessor(
+                self.exporter,
+                max_queue_size=max_queue_size,
+                max_export_batch_size=min(kwargs.get("TRACING_MAX_EXPORT_BATCH_SIZE", 512), max_queue_size),
+                schedule_delay_millis=kwargs.get("TRACING_SCHEDULE_DELAY_MS", 5000),
+            )
+        else:
+            processor = SimpleSpanProcessor(self.exporter)
+        self.provider.add_span_processor(processor)
+        self._tracer = self.provider.get_tracer("app.middlewares.access_validator")
+
+        @app.on_event("shutdown")
+        def shutdown_tracing():
+            self.shutdown()
+
+    def shutdown(self):
+        """
+        큐에 남은 span 내보낸 후 종료
+        """
+        if self.provider is not None:
+            self.provider.shutdown()
+
+    def start_span(self, name: str, headers: Mapping[str, str] = None):
+        """
+        현재 span으로 시작, 트레이싱 미사용시 아무것도 하지 않는 span 반환
+        :param headers: 요청 헤더, 상위 trace context 추출용
+        """
+        if self._tracer is None:
+            return nullcontext(_NOOP_SPAN)
+        context = None
+        if headers is not None:
+            from opentelemetry import propagate
+            context = propagate.extract(headers)
+        return self._tracer.start_as_current_span(name, context=context)
+
+    def set_ok(self, span):
+        if span.is_recording():
+            from opentelemetry.trace import Status, StatusCode
+            span.set_status(Status(StatusCode.OK))
+
+    def set_error(self, span, description: str):
+        if span.is_recording():
+            from opentelemetry.trace import Status, StatusCode
+            span.set_status(Status(StatusCode.ERROR, description=description))
+
+
+def _create_exporter(name: str):
+    if name == "memory":
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+        return InMemorySpanExporter()
+    if name == "console":
+        from opentelemetry.sdk.trace.export import ConsoleSpanExporter
+        return ConsoleSpanExporter()
+    from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+    return OTLPSpanExporter()
+
+
+tracing = Tracing()
@@ -201,10 +201,21 @@ def pre_exec(server):
     server.log.info("Forked child, re-executing.")
 
 
+def on_starting(server):
+    from app.utils.metrics import clear_multiproc_dir
+    clear_multiproc_dir()
+
+
 def when_ready(server):
     server.log.info("Server is ready. Spawning workers")
 
 
+def child_exit(server, worker):
+    # 종료된 워커 메트릭은 누적 파일로 합산 (gauge 제외)
+    from app.utils.metrics import mark_process_dead
+    mark_process_dead(worker.pid)
+
+
 def worker_int(worker):
     worker.log.info("worker received INT or QUIT signal")
 
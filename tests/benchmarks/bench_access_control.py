@@ -0,0 +1,112 @@
+"""
+access_control 미들웨어 요청당 오버헤드 측정
+python -m tests.benchmarks.bench_access_control [-n 요청수]
+
+- bare: 미들웨어 없음
+- base_http: BaseHTTPMiddleware + 요청마다 정규식, D.datetime() (변경 전 방식)
+- asgi: AccessControlMiddleware
+- traced_sync: 트레이싱 100% 샘플링 + 동기 내보내기 (in-memory exporter)
+- traced_batch: 트레이싱 100% 샘플링 + BatchSpanProcessor
+- traced_10pct: 트레이싱 10% 샘플링 + BatchSpanProcessor
+"""
+import argparse
+import asyncio
+import re
+import time
+
+from fastapi import FastAPI
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.common.consts import EXCEPT_PATH_LIST, EXCEPT_PATH_REGEX
+from app.middlewares.access_validator import AccessControlMiddleware
+from app.utils.date_utils import D
+from app.utils.logger_fastapi import api_logger
+from app.utils.tracing import tracing
+
+TRACING_OPTIONS = {
+    "traced_sync": dict(TRACING_SAMPLE_RATE=1.0, TRACING_BATCH_EXPORT=False),
+    "traced_batch": dict(TRACING_SAMPLE_RATE=1.0),
+    "traced_10pct": dict(TRACING_SAMPLE_RATE=0.1),
+}
+
+
+async def legacy_access_control(request, call_next):
+    request.state.req_time = D.datetime()
+    request.state.start = time.time()
+    request.state.inspect = None
+    request.state.ip = request.client.host if request.client is not None else "localhost"
+    url = request.url.path
+    if re.match(EXCEPT_PATH_REGEX, url) or url in EXCEPT_PATH_LIST:
+        return await call_next(request)
+    response = await call_next(request)
+    await api_logger(request=request, status_code=response.status_code)
+    return response
+
+
+def build_app(kind: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    if kind == "base_http":
+        app.add_middleware(BaseHTTPMiddleware, dispatch=legacy_access_control)
+    elif kind == "asgi" or kind in TRACING_OPTIONS:
+        app.add_middleware(AccessControlMiddleware)
+    tracing.init_app(app, TRACING_ENABLED=kind in TRACING_OPTIONS, TRACING_EXPORTER="memory",
+                     **TRACING_OPTIONS.get(kind, {}))
+    return app
+
+
+async def run(app: FastAPI, requests: int) -> float:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/ping",
+        "raw_path": b"/ping",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"localhost")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("localhost", 80),
+    }
+
+    def receiver():
+        messages = iter([{"type": "http.request", "body": b"", "more_body": False}])
+
+        async def receive():
+            return next(messages, {"type": "http.disconnect"})
+        return receive
+
+    async def send(message):
+        pass
+
+    for _ in range(100):
+        await app(dict(scope), receiver(), send)
+    start = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(scope), receiver(), send)
+    return (time.perf_counter() - start) / requests
+
+
+def main():
+    parser = argparse.ArgumentParser(description="access_control 미들웨어 오버헤드 측정")
+    parser.add_argument("-n", "--requests", type=int, default=5000)
+    args = parser.parse_args()
+
+    kinds = ("bare", "base_http", "asgi", *TRACING_OPTIONS)
+    results = {}
+    for kind in kinds:
+        results[kind] = asyncio.run(run(build_app(kind), args.requests))
+        tracing.shutdown()
+    for kind, sec in results.items():
+        overhead = sec - results["bare"]
+        print(f"{kind:12s} {sec * 1e6:8.1f}us/req  overhead {overhead * 1e6:8.1f}us")
+
+
+if __name__ == "__main__":
+    main()
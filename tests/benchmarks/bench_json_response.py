@@ -0,0 +1,77 @@
+"""
+목록 응답 직렬화 시간 측정
+python -m tests.benchmarks.bench_json_response [-n 요청수] [--items 항목수]
+
+- validated: 항목마다 모델 검증 + response_model 직렬화 (변경 전 방식)
+- validated_once: 목록 전체 한번에 검증 + response_model 직렬화
+- fast: 목록 전체 한번에 검증 + FastJSONResponse
+"""
+import argparse
+import asyncio
+import time
+
+from fastapi import FastAPI
+
+from app.models.api.v1.company.response import AutoCompleteCompanyListResponse, AutoCompleteCompanyResponse
+from app.services.api.v1.company import autocomplete_response
+from app.utils.json_response import FastJSON
+
+
+def build_app(kind: str, names) -> FastAPI:
+    app = FastAPI()
+    fast_json = FastJSON(app, FAST_JSON_RESPONSE=kind == "fast")
+
+    @app.get("/search", response_model=AutoCompleteCompanyListResponse)
+    async def search():
+        if kind == "validated":
+            return AutoCompleteCompanyListResponse(
+                data=[AutoCompleteCompanyResponse(company_name=name) for name in names]
+            )
+        return fast_json.response(autocomplete_response(names))
+    return app
+
+
+async def run(app: FastAPI, requests: int) -> float:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/search",
+        "raw_path": b"/search",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"localhost")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("localhost", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    for _ in range(100):
+        await app(dict(scope), receive, send)
+    start = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(scope), receive, send)
+    return (time.perf_counter() - start) / requests
+
+
+def main():
+    parser = argparse.ArgumentParser(description="목록 응답 직렬화 시간 측정")
+    parser.add_argument("-n", "--requests", type=int, default=2000)
+    parser.add_argument("--items", type=int, default=100)
+    args = parser.parse_args()
+
+    names = [f"회사{i}" for i in range(args.items)]
+    for kind in ("validated", "validated_once", "fast"):
+        sec = asyncio.run(run(build_app(kind, names), args.requests))
+        print(f"{kind:15s} {sec * 1e6:8.1f}us/req")
+
+
+if __name__ == "__main__":
+    main()
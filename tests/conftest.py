@@ -1,13 +1,36 @@
 import pytest
 import json
 
+from sqlalchemy import BigInteger, create_engine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 from starlette.testclient import TestClient
 
+from app.database.conn_sqlalchemy import Base
 from app.main import create_app
 
 
+@compiles(BigInteger, "sqlite")
+def _sqlite_bigint(type_, compiler, **kw):
+    # SQLite는 INTEGER PRIMARY KEY만 자동 증가
+    return "INTEGER"
+
+
 @pytest.fixture
 def api():
     return TestClient(create_app())
 
 
+@pytest.fixture
+def sqlite_session():
+    """
+    전체 테이블이 생성된 메모리 SQLite 세션 (스레드 간 공유)
+    """
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
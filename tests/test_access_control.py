@@ -0,0 +1,85 @@
+from fastapi import FastAPI
+from starlette.requests import Request
+from starlette.testclient import TestClient
+
+from app.errors.exceptions import NotFoundEx
+from app.middlewares.access_validator import AccessControlMiddleware
+
+
+def _client():
+    app = FastAPI()
+
+    @app.get("/ok")
+    def ok():
+        return {"ok": True}
+
+    @app.get("/not-found")
+    def not_found():
+        raise NotFoundEx(code="ERR40401")
+
+    @app.get("/error")
+    def error():
+        raise ValueError("boom")
+
+    app.add_middleware(AccessControlMiddleware)
+    return TestClient(app, raise_server_exceptions=False)
+
+
+def test_access_control_passes_response():
+    """
+    정상 응답은 그대로 전달되어야 합니다.
+    """
+    resp = _client().get("/ok")
+
+    assert resp.status_code == 200
+    assert resp.json() == {"ok": True}
+
+
+def test_access_control_maps_errors():
+    """
+    APIException은 에러 코드로, 그 외 예외는 500 에러로 응답해야 합니다.
+    """
+    client = _client()
+
+    resp = client.get("/not-found")
+    assert resp.status_code == 404
+    assert resp.json() == {"msg": "Data Not Found Error", "data": None, "code": "ERR40401"}
+
+    resp = client.get("/error")
+    assert resp.status_code == 500
+    assert resp.json()["code"] == "ERR50001"
+
+
+def test_access_control_except_path():
+    """
+    예외 경로도 응답은 그대로 전달되어야 합니다.
+    """
+    resp = _client().get("/docs")
+
+    assert resp.status_code == 200
+
+
+def test_access_control_internal_path():
+    """
+    내부 경로는 허용 대역에서 프록시 없이 들어온 요청만 허용하고 그 외에는 403으로 응답해야 합니다.
+    """
+    app = FastAPI()
+
+    @app.get("/internal/metrics")
+    def internal_metrics():
+        return {"ok": True}
+
+    app.add_middleware(AccessControlMiddleware)
+    resp = TestClient(app).get("/internal/metrics")
+    assert resp.status_code == 403
+    assert resp.json()["code"] == "ERR40301"
+
+    middleware = AccessControlMiddleware(app, internal_networks=["10.0.0.0/8"])
+
+    def request(host, headers=()):
+        return Request(dict(type="http", client=(host, 5000), headers=[(k.encode(), v.encode()) for k, v in headers]))
+
+    assert middleware.is_internal(request("10.1.2.3"))
+    assert not middleware.is_internal(request("10.1.2.3", [("x-forwarded-for", "10.0.0.1")]))
+    assert not middleware.is_internal(request("203.0.113.7"))
+    assert not middleware.is_internal(request("testclient"))
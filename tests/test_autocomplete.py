@@ -0,0 +1,142 @@
+import threading
+import time
+
+from fastapi import FastAPI
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from starlette.testclient import TestClient
+
+from app.database.conn_sqlalchemy import Base
+from app.database.schema.company import Company, CompanyTranslation
+from app.services.autocomplete import _MAX_GAPS, NgramIndex
+
+
+def _index(*names):
+    index = NgramIndex()
+    index.build((doc_id, "ko", name) for doc_id, name in enumerate(names, start=1))
+    return index
+
+
+def test_ngram_index_search():
+    """
+    부분 문자열이 포함된 회사명을 translation id 순서로 반환해야 합니다.
+    """
+    index = _index("주식회사 링크드코리아", "스피링크", "아이씨그룹", "Wantedlab")
+    index.add(5, "en", "LinkedKorea")
+
+    assert index.search("링크", "ko") == ["주식회사 링크드코리아", "스피링크"]
+    assert index.search("WANTED", "ko") == ["Wantedlab"]
+    assert index.search("링크", "en") == []
+    assert index.search("linked", "en") == ["LinkedKorea"]
+    assert index.search("없는회사", "ko") == []
+    assert index.search("링크", "ko", limit=1, offset=1) == ["스피링크"]
+
+
+def test_ngram_index_short_query():
+    """
+    한 글자 검색어도 색인으로 검색하고 빈 검색어, 와일드카드는 DB 경로로 넘겨야 합니다.
+    """
+    index = _index("스피링크", "아이씨그룹", "링크")
+
+    assert index.search("링", "ko") == ["스피링크", "링크"]
+    assert index.search("", "ko") is None
+    assert index.search("링%", "ko") is None
+    assert NgramIndex().search("링크", "ko") is None
+
+
+def test_ngram_index_ranked():
+    """
+    ranked인 경우 일치 > 접두어 > 부분 일치, 짧은 이름 순으로 반환해야 합니다.
+    """
+    index = _index("주식회사 링크", "링크드코리아", "링크", "스피링크", "링크랩")
+
+    assert index.search("링크", "ko", ranked=True) == ["링크", "링크랩", "링크드코리아", "스피링크", "주식회사 링크"]
+    assert index.search("링크", "ko", limit=2, ranked=True) == ["링크", "링크랩"]
+
+
+def test_ngram_index_refresh_out_of_order_commit():
+    """
+    id 순서와 다르게 commit 된 회사명도 refresh에서 반영되어야 합니다.
+    """
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add(Company(id=1))
+    session.add(CompanyTranslation(id=1, company_id=1, language_code="ko", name="원티드랩"))
+    session.commit()
+
+    index = NgramIndex()
+    index.load(session)
+    assert index.search("랩", "ko") == ["원티드랩"]
+
+    # id 3이 먼저 commit 되고 id 2는 이후에 commit
+    session.add(CompanyTranslation(id=3, company_id=1, language_code="ko", name="스피랩"))
+    session.commit()
+    index.refresh(session, force=True)
+    assert index.search("랩", "ko") == ["원티드랩", "스피랩"]
+
+    session.add(CompanyTranslation(id=2, company_id=1, language_code="ko", name="링크랩"))
+    session.commit()
+    index.refresh(session, force=True)
+    assert index.search("랩", "ko") == ["원티드랩", "링크랩", "스피랩"]
+    session.close()
+
+
+def test_ngram_index_refresh_large_gap():
+    """
+    마지막 id 이전에 _MAX_GAPS 개보다 많은 행이 늦게 commit 되어도 refresh에서 모두 반영되어야 합니다.
+    """
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add(Company(id=1))
+    session.add(CompanyTranslation(id=1, company_id=1, language_code="ko", name="원티드랩"))
+    session.commit()
+
+    index = NgramIndex()
+    index.load(session)
+
+    late_ids = range(2, _MAX_GAPS * 3 + 2)
+    session.add(CompanyTranslation(id=late_ids[-1] + 1, company_id=1, language_code="ko", name="스피랩"))
+    session.commit()
+    index.refresh(session, force=True)
+
+    session.add_all(CompanyTranslation(id=i, company_id=1, language_code="ko", name=f"랩{i}") for i in late_ids)
+    session.commit()
+    index.refresh(session, force=True)
+    assert len(index.search("랩", "ko")) == len(late_ids) + 2
+    assert index.search("랩2", "ko", limit=1) == ["랩2"]
+    session.close()
+
+
+def test_ngram_index_builds_in_background():
+    """
+    앱 시작은 색인 생성을 기다리지 않고, 생성 전에는 DB 경로(None)로 처리해야 합니다.
+    """
+    started, release = threading.Event(), threading.Event()
+    rows = [(1, "ko", "원티드랩")]
+
+    class _Session:
+        def execute(self, statement):
+            started.set()
+            release.wait(5)
+            return self
+
+        def all(self):
+            return rows
+
+        def close(self):
+            pass
+
+    index = NgramIndex()
+    app = FastAPI()
+    index.init_app(app, _Session)
+    with TestClient(app):
+        assert started.wait(5)
+        assert index.search("랩", "ko") is None
+        release.set()
+        for _ in range(100):
+            if index.ready:
+                break
+            time.sleep(0.01)
+        assert index.search("랩", "ko") == ["원티드랩"]
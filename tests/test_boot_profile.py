@@ -0,0 +1,25 @@
+from fastapi import FastAPI
+from starlette.testclient import TestClient
+
+from app.utils.boot_profile import time_startup_hooks
+
+
+def test_time_startup_hooks():
+    """
+    sync, async startup 훅을 순서대로 실행하고 훅별 소요 시간을 기록해야 합니다.
+    """
+    app = FastAPI()
+    called = []
+
+    @app.on_event("startup")
+    def start_sync():
+        called.append("sync")
+
+    @app.on_event("startup")
+    async def start_async():
+        called.append("async")
+
+    time_startup_hooks(app)
+    with TestClient(app):
+        assert called == ["sync", "async"]
+        assert list(app.state.startup_phases) == ["start_sync", "start_async"]
@@ -0,0 +1,176 @@
+import asyncio
+import threading
+import time
+
+import fakeredis
+from sqlalchemy.util.concurrency import greenlet_spawn
+
+from app.utils.cache import LRUCache, RedisCache, cache_key
+
+
+def _redis(server=None):
+    """
+    테스트용 Redis (fakeredis, Lua 스크립트 실행 가능)
+    """
+    return fakeredis.FakeRedis(server=server or fakeredis.FakeServer())
+
+
+def test_lru_cache_eviction():
+    """
+    최대 개수를 넘으면 가장 오래 사용하지 않은 항목부터 삭제되어야 합니다.
+    """
+    lru = LRUCache(maxsize=2, ttl=60)
+    lru.set("a", 1)
+    lru.set("b", 2)
+    assert lru.get("a") == 1
+    lru.set("c", 3)
+
+    assert lru.get("b") is None
+    assert lru.get("a") == 1
+    assert lru.get("c") == 3
+    assert lru.stats()["evictions"] == 1
+
+
+def test_lru_cache_ttl():
+    """
+    ttl이 지난 항목은 조회되지 않아야 합니다.
+    """
+    lru = LRUCache(maxsize=2, ttl=0.01)
+    lru.set("a", 1)
+    time.sleep(0.02)
+
+    assert lru.get("a") is None
+    assert lru.stats()["size"] == 0
+
+
+def test_lru_cache_invalidate_tags():
+    """
+    태그로 무효화하면 해당 태그가 달린 항목만 삭제되어야 합니다.
+    """
+    lru = LRUCache(maxsize=10, ttl=60)
+    lru.set(cache_key("company_detail", "아이씨그룹", "ko"), {"data": 1}, tags=["company:1", "tag_group:14"])
+    lru.set(cache_key("company_detail", "스피링크", "ko"), {"data": 2}, tags=["company:2"])
+    lru.invalidate_tags("tag_group:14")
+
+    assert lru.get(cache_key("company_detail", "아이씨그룹", "ko")) is None
+    assert lru.get(cache_key("company_detail", "스피링크", "ko")) == {"data": 2}
+    assert lru.stats()["hits"] == 1
+    assert lru.stats()["misses"] == 1
+
+
+def test_lru_cache_set_after_invalidate():
+    """
+    조회 도중 태그가 무효화되면 조회 전 세대로 저장한 값은 버려져야 합니다.
+    """
+    lru = LRUCache(maxsize=10, ttl=60)
+    generation = lru.generation()
+    # 조회 도중 다른 요청이 태그를 변경하고 무효화
+    lru.invalidate_tags("company:1")
+    lru.set("a", {"tags": ["태그_1"]}, tags=["company:1"], generation=generation)
+    lru.set("b", {"tags": []}, tags=["company:2"], generation=generation)
+
+    assert lru.get("a") is None
+    assert lru.get("b") == {"tags": []}
+
+    lru.set("a", {"tags": ["태그_1", "태그_4"]}, tags=["company:1"], generation=lru.generation())
+    assert lru.get("a") == {"tags": ["태그_1", "태그_4"]}
+
+
+def test_redis_cache_version_invalidation():
+    """
+    태그 버전이 증가하면 이전에 저장된 항목은 조회되지 않아야 합니다.
+    """
+    rc = RedisCache(_redis())
+    rc.set("a", {"company_name": "아이씨그룹", "tags": ["태그_1"]}, tags=["company:1"])
+    rc.set("b", {"company_name": "스피링크", "tags": []}, tags=["company:2"])
+
+    assert rc.get("a") == {"company_name": "아이씨그룹", "tags": ["태그_1"]}
+    assert rc.get("c") is None
+
+    rc.invalidate_tags("company:1")
+    assert rc.get("a") is None
+    assert rc.get("b") == {"company_name": "스피링크", "tags": []}
+
+
+def test_redis_cache_get_many():
+    """
+    여러 키를 한번에 조회하고 무효화된 항목, 없는 항목은 None이어야 합니다.
+    """
+    client = _redis()
+    rc = RedisCache(client)
+    rc.set("a", {"tags": ["태그_1"]}, tags=["company:1", "tag_group:1"])
+    rc.set("b", [1, 2], tags=["company:2"])
+    rc.set("c", "스피링크")
+    rc.invalidate_tags("company:2")
+    rc.get("a")
+
+    calls = []
+    evalsha = client.evalsha
+    client.evalsha = lambda *args: calls.append(args) or evalsha(*args)
+    assert rc.get_many(["a", "b", "c", "d"]) == [{"tags": ["태그_1"]}, None, "스피링크", None]
+    assert len(calls) == 1
+    assert (rc.stats()["hits"], rc.stats()["misses"]) == (3, 2)
+
+
+def test_redis_cache_version_key_ttl():
+    """
+    태그 버전 키는 만료 시간이 있고, 항목 저장시 항목보다 먼저 만료되지 않게 연장되어야 합니다.
+    """
+    client = _redis()
+    rc = RedisCache(client, ttl=60, version_ttl=600)
+    rc.invalidate_tags("company:1")
+    assert 0 < client.ttl("choco:ver:company:1") <= 600
+
+    client.expire("choco:ver:company:1", 10)
+    rc.set("a", 1, tags=["company:1"])
+    assert client.ttl("choco:ver:company:1") > 60
+    assert rc.get("a") == 1
+
+
+def test_redis_cache_set_after_invalidate():
+    """
+    조회 도중 무효화가 있었으면 조회 전 세대로 저장한 값은 버려져야 합니다.
+    """
+    rc = RedisCache(_redis())
+    generation = rc.generation()
+    rc.invalidate_tags("company:1")
+    rc.set("a", {"tags": ["태그_1"]}, tags=["company:1"], generation=generation)
+    assert rc.get("a") is None
+
+    rc.set("a", {"tags": ["태그_1", "태그_4"]}, tags=["company:1"], generation=rc.generation())
+    assert rc.get("a") == {"tags": ["태그_1", "태그_4"]}
+
+
+def test_redis_cache_run_sync_offload():
+    """
+    AsyncSession.run_sync 안에서 호출되면 Redis I/O는 이벤트 루프 스레드 밖에서 실행되어야 합니다.
+    """
+    client = _redis()
+    rc = RedisCache(client)
+    rc.set("a", 1)
+    threads = []
+    evalsha = client.evalsha
+    client.evalsha = lambda *args: threads.append(threading.get_ident()) or evalsha(*args)
+
+    async def main():
+        return await greenlet_spawn(rc.get, "a"), threading.get_ident()
+
+    value, loop_thread = asyncio.run(main())
+    assert value == 1
+    assert threads and loop_thread not in threads
+
+
+def test_redis_cache_unavailable():
+    """
+    Redis에 연결할 수 없으면 예외 없이 miss로 처리되어야 합니다.
+    """
+    server = fakeredis.FakeServer()
+    rc = RedisCache(_redis(server), retry_sec=60)
+    rc.set("a", 1)
+    server.connected = False
+
+    assert rc.get("a") is None
+    rc.set("b", 2)
+    rc.invalidate_tags("company:1")
+    assert rc.stats()["available"] is False
+    assert rc.stats()["errors"] == 1
@@ -1,5 +1,8 @@
 import json
 
+from app.database.profiler import sql_profiler
+from app.utils.cache import cache
+
 
 def test_company_name_autocomplete(api):
     """
@@ -17,6 +20,20 @@ def test_company_name_autocomplete(api):
     ]
 
 
+def test_company_name_autocomplete_ranked(api):
+    """
+    1-1. 회사명 자동완성 정렬, 개수 제한
+    ranked 옵션은 일치 > 접두어 > 부분 일치, 짧은 회사명 순으로 정렬되어야 합니다.
+    """
+    resp = api.get("/search?query=링크&ranked=true&limit=1", headers=[("x-wanted-language", "ko")])
+    searched_companies = resp.json()["data"]
+
+    assert resp.status_code == 200
+    assert searched_companies == [
+        {"company_name": "스피링크"},
+    ]
+
+
 def test_company_search(api):
     """
     2. 회사 이름으로 회사 검색
@@ -46,6 +63,19 @@ def test_company_search(api):
     assert resp.status_code == 404
 
 
+def test_company_search_query_budget(api):
+    """
+    2-1. 회사 이름으로 회사 검색 쿼리 수
+    태그 수와 관계없이 3번 이하의 쿼리로 조회해야 합니다.
+    """
+    cache.clear()
+    with sql_profiler.assert_max_queries(3):
+        resp = api.get("/companies/스피링크", headers=[("x-wanted-language", "ko")])
+
+    assert resp.status_code == 200
+    assert resp.json()["data"]["company_name"] == "스피링크"
+
+
 def test_new_company(api):
     """
     3.  새로운 회사 추가
@@ -119,6 +149,22 @@ def test_search_tag_name(api):
     ]
 
 
+def test_search_tag_name_query_count(api):
+    """
+    4-1.  태그명으로 회사 검색 쿼리 수
+    연결된 회사 수와 관계없이 한번의 쿼리로 회사명을 조회해야 합니다.
+    """
+    cache.clear()
+    with sql_profiler.capture() as stats:
+        resp = api.get("/tags?query=タグ_22", headers=[("x-wanted-language", "ko")])
+
+    assert resp.status_code == 200
+    assert len(resp.json()["data"]) == 5
+    # 회사명 조회 쿼리 (ETag, 태그 id 조회 쿼리 제외)
+    name_queries = {shape: n for shape, n in stats.shapes.items() if "company_translation" in shape}
+    assert list(name_queries.values()) == [1]
+
+
 def test_new_tag(api):
     """
     5.  회사 태그 정보 추가
@@ -178,4 +224,70 @@ def test_delete_tag(api):
             "tag_8",
             "tag_50",
         ],
-    }
\ No newline at end of file
+    }
+
+
+def test_batch_update_tags(api):
+    """
+    7.  회사 태그 일괄 추가, 삭제
+    여러 회사의 태그를 한번에 변경하고 항목별 결과를 입력 순서대로 반환해야 합니다.
+    """
+    resp = api.post(
+        "/companies/tags/batch",
+        json=[
+            {
+                "company_name": "라인 프레쉬",
+                "add_tags": [{"tag_name": {"ko": "태그_15", "en": "tag_15"}}],
+                "remove_tags": ["tag_50"],
+            },
+            {
+                "company_name": "없는 회사",
+                "remove_tags": ["태그_1"],
+            },
+        ],
+    )
+
+    assert resp.json() == {
+        "succeeded": 1,
+        "failed": 1,
+        "data": [
+            {"company_name": "라인 프레쉬", "added": 1, "removed": 1, "code": None},
+            {"company_name": "없는 회사", "added": 0, "removed": 0, "code": "ERR40401"},
+        ],
+    }
+
+    resp = api.get("/companies/LINE FRESH", headers=[("x-wanted-language", "en")])
+    assert resp.json()["data"]["tags"] == ["tag_1", "tag_4", "tag_8", "tag_15"]
+
+
+def test_company_detail_etag(api):
+    """
+    8.  회사 상세, 태그 검색 조건부 조회
+    If-None-Match가 ETag와 같으면 304, 태그 변경 후에는 새 ETag로 응답해야 합니다.
+    """
+    resp = api.get("/companies/아이씨그룹", headers=[("x-wanted-language", "ko")])
+    etag = resp.headers["etag"]
+
+    with sql_profiler.capture() as stats:
+        resp = api.get("/companies/아이씨그룹", headers=[("x-wanted-language", "ko"), ("if-none-match", etag)])
+    assert resp.status_code == 304
+    assert stats.count == 1
+
+    resp = api.get("/tags?query=태그_4", headers=[("x-wanted-language", "ko")])
+    tag_etag = resp.headers["etag"]
+    resp = api.get("/tags?query=태그_4", headers=[("x-wanted-language", "ko"), ("if-none-match", tag_etag)])
+    assert resp.status_code == 304
+
+    api.put(
+        "/companies/아이씨그룹/tags",
+        json=[{"tag_name": {"ko": "태그_4", "ja": "タグ_4"}}],
+        headers=[("x-wanted-language", "ko")],
+    )
+    resp = api.get("/companies/아이씨그룹", headers=[("x-wanted-language", "ko"), ("if-none-match", etag)])
+    assert resp.status_code == 200
+    assert resp.headers["etag"] != etag
+    assert "태그_4" in resp.json()["data"]["tags"]
+    resp = api.get("/tags?query=태그_4", headers=[("x-wanted-language", "ko"), ("if-none-match", tag_etag)])
+    assert resp.status_code == 200
+    assert resp.headers["etag"] != tag_etag
+    assert {"company_name": "아이씨그룹"} in resp.json()["data"]
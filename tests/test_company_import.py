@@ -0,0 +1,141 @@
+import io
+
+import pytest
+import sqlalchemy.exc
+from fastapi import FastAPI
+from sqlalchemy import func, select
+from starlette.testclient import TestClient
+
+from app.database.conn_sqlalchemy import db
+from app.database.schema.company import Company, CompanyTag, CompanyTranslation
+from app.routes.v1 import company_import
+from app.services.api.v1 import company_import as company_import_service
+from app.services.api.v1.company_import import chunked, import_companies, read_csv, read_jsonl
+from app.services.autocomplete import NgramIndex
+from app.utils.cache import LRUCache, cache, cache_key
+
+
+def test_read_csv():
+    """
+    CSV 한 행은 언어별 회사명과 같은 순서의 태그로 변환되어야 합니다.
+    """
+    lines = io.StringIO(
+        "company_ko,company_en,company_ja,tag_ko,tag_en,tag_ja\n"
+        "원티드랩,Wantedlab,,태그_4|태그_20,tag_4|tag_20,タグ_4|タグ_20\n"
+    )
+    records = list(read_csv(lines))
+
+    assert [record.model_dump() for record in records] == [
+        {
+            "company_name": {"ko": "원티드랩", "en": "Wantedlab"},
+            "tags": [
+                {"tag_name": {"ko": "태그_4", "en": "tag_4", "ja": "タグ_4"}},
+                {"tag_name": {"ko": "태그_20", "en": "tag_20", "ja": "タグ_20"}},
+            ],
+        }
+    ]
+
+
+def test_read_jsonl_invalid_line():
+    """
+    변환할 수 없는 줄은 None으로 반환되어야 합니다.
+    """
+    lines = io.StringIO(
+        '{"company_name": {"ko": "라인 프레쉬"}, "tags": []}\n'
+        "\n"
+        "not json\n"
+    )
+    records = list(read_jsonl(lines))
+
+    assert records[0].company_name == {"ko": "라인 프레쉬"}
+    assert records[1] is None
+    assert len(records) == 2
+
+
+def test_chunked():
+    assert list(chunked(range(5), 2)) == [[0, 1], [2, 3], [4]]
+
+
+def _company_tags(session):
+    return session.execute(
+        select(CompanyTranslation.name, CompanyTag.tag_group_id)
+        .join(CompanyTag, CompanyTag.company_id == CompanyTranslation.company_id)
+        .where(CompanyTranslation.language_code == "ko")
+        .order_by(CompanyTranslation.name, CompanyTag.tag_group_id)
+    ).all()
+
+
+def test_import_companies_duplicate(sqlite_session):
+    """
+    회사, 회사명, 태그가 등록되고 이미 등록된 회사명은 중복으로 건너뛰어야 합니다.
+    같은 파일을 다시 등록해도 회사가 추가되지 않아야 합니다.
+    """
+    lines = [
+        '{"company_name": {"ko": "원티드랩", "en": "Wantedlab"}, "tags": [{"tag_name": {"ko": "태그_4"}}]}\n',
+        '{"company_name": {"ko": "라인 프레쉬"}, "tags": [{"tag_name": {"ko": "태그_4"}}, {"tag_name": {"ko": "태그_8"}}]}\n',
+        '{"company_name": {"en": "Wantedlab"}, "tags": []}\n',
+        '{"company_name": {"ko": "태그 없음"}, "tags": [{"tag_name": {"ko": "태그"}}]}\n',
+    ]
+
+    result = import_companies(read_jsonl(lines), sqlite_session, batch_size=2, progress=None)
+    assert (result.imported, result.failed, result.duplicated) == (2, 1, 1)
+    assert _company_tags(sqlite_session) == [("라인 프레쉬", 4), ("라인 프레쉬", 8), ("원티드랩", 4)]
+    assert sqlite_session.scalar(select(func.count()).select_from(Company)) == 2
+
+    result = import_companies(read_jsonl(lines), sqlite_session, batch_size=2, progress=None)
+    assert (result.imported, result.failed, result.duplicated) == (0, 1, 3)
+    assert sqlite_session.scalar(select(func.count()).select_from(Company)) == 2
+
+
+def test_import_route_streams_body(sqlite_session):
+    """
+    요청 본문은 조각 단위로 읽어서 CSV, JSONL로 등록되어야 합니다.
+    """
+    app = FastAPI()
+    app.include_router(company_import.router)
+    app.dependency_overrides[db.get_writer_db] = lambda: sqlite_session
+    client = TestClient(app)
+
+    body = "company_ko,tag_ko\n원티드랩,태그_4|태그_20\n라인 프레쉬,태그_8\n".encode()
+    # 여러 글자 중간에서 나뉜 조각
+    chunks = [body[i:i + 7] for i in range(0, len(body), 7)]
+    resp = client.post("/companies/import", content=iter(chunks), headers={"content-type": "text/csv"})
+
+    assert resp.status_code == 200
+    assert resp.json()["imported"] == 2
+    assert _company_tags(sqlite_session) == [("라인 프레쉬", 8), ("원티드랩", 4), ("원티드랩", 20)]
+
+
+def test_import_companies_failed_chunk_invalidates(sqlite_session, monkeypatch):
+    """
+    이후 묶음이 실패해도 commit 된 묶음의 캐시는 무효화되고 자동완성 색인에 반영되어야 합니다.
+    """
+    monkeypatch.setattr(cache, "backend", LRUCache())
+    index = NgramIndex()
+    index.load(sqlite_session)
+    monkeypatch.setattr(company_import_service, "autocomplete_index", index)
+    tag_names_key = cache_key("tag_names", "태그_4")
+    cache.set(tag_names_key, [], tags=["tag_name:태그_4"])
+    cache.set(cache_key("company_names"), [], tags=["company_names"])
+
+    insert_chunk = company_import_service._insert_chunk
+    calls = []
+
+    def failing_insert_chunk(records, session):
+        calls.append(records)
+        if len(calls) == 2:
+            raise sqlalchemy.exc.OperationalError("INSERT", {}, Exception("lock wait timeout"))
+        return insert_chunk(records, session)
+
+    monkeypatch.setattr(company_import_service, "_insert_chunk", failing_insert_chunk)
+    lines = [
+        '{"company_name": {"ko": "원티드랩"}, "tags": [{"tag_name": {"ko": "태그_4"}}]}\n',
+        '{"company_name": {"ko": "라인 프레쉬"}, "tags": [{"tag_name": {"ko": "태그_8"}}]}\n',
+    ]
+    with pytest.raises(sqlalchemy.exc.OperationalError):
+        import_companies(read_jsonl(lines), sqlite_session, batch_size=1, progress=None)
+
+    assert _company_tags(sqlite_session) == [("원티드랩", 4)]
+    assert cache.get(tag_names_key) is None
+    assert cache.get(cache_key("company_names")) is None
+    assert index.search("티드", "ko") == ["원티드랩"]
@@ -0,0 +1,43 @@
+import sqlalchemy.exc
+from sqlalchemy import select
+
+from app.database.schema.company import Company, CompanyTag, CompanyTranslation
+from app.models.api.v1.company.request import CompanyTagOperation
+from app.services.api.v1 import company_tag_batch
+from app.services.api.v1.company_tag_batch import batch_update_company_tags
+
+
+def _links(session):
+    return session.execute(
+        select(CompanyTag.company_id, CompanyTag.tag_group_id).order_by(CompanyTag.company_id, CompanyTag.tag_group_id)
+    ).all()
+
+
+def test_batch_failed_chunk_rolled_back(sqlite_session, monkeypatch):
+    """
+    DB 에러가 난 묶음은 rollback 되고 해당 항목은 ERR50001, 나머지 묶음은 저장되어야 합니다.
+    """
+    for company_id, name in enumerate(["원티드랩", "라인 프레쉬", "스피링크"], start=1):
+        sqlite_session.add(Company(id=company_id))
+        sqlite_session.add(CompanyTranslation(company_id=company_id, language_code="ko", name=name))
+    sqlite_session.commit()
+
+    bump_versions = company_tag_batch.bump_versions
+    calls = []
+
+    def failing_bump_versions(session, **kwargs):
+        calls.append(kwargs)
+        if len(calls) == 2:
+            raise sqlalchemy.exc.OperationalError("UPDATE", {}, Exception("lock wait timeout"))
+        bump_versions(session, **kwargs)
+
+    monkeypatch.setattr(company_tag_batch, "bump_versions", failing_bump_versions)
+    operations = [
+        CompanyTagOperation(company_name=name, add_tags=[{"tag_name": {"ko": f"태그_{tag}"}}])
+        for name, tag in [("원티드랩", 4), ("라인 프레쉬", 8), ("스피링크", 15)]
+    ]
+    result = batch_update_company_tags(operations, sqlite_session, batch_size=1)
+
+    assert (result.succeeded, result.failed) == (2, 1)
+    assert [(item.added, item.code) for item in result.data] == [(1, None), (0, "ERR50001"), (1, None)]
+    assert _links(sqlite_session) == [(1, 4), (3, 15)]
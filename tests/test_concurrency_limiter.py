@@ -0,0 +1,97 @@
+from fastapi import Depends, FastAPI
+from starlette.testclient import TestClient
+
+from app.middlewares.access_validator import AccessControlMiddleware
+from app.utils.concurrency import AIMDLimit, ConcurrencyLimiter
+
+
+def test_aimd_limit():
+    """
+    느린 응답은 한도를 줄이고, 한도를 충분히 사용하는 정상 응답은 한도를 늘려야 합니다.
+    """
+    limit = AIMDLimit(initial=10, min_limit=2, max_limit=12, latency_sec=0.5, backoff=0.5)
+
+    assert limit.try_acquire()
+    limit.release(latency=1.0, now=1.0)
+    assert limit.limit == 5
+
+    for now in range(2, 5):
+        assert limit.try_acquire()
+        limit.release(latency=1.0, now=now)
+    assert limit.limit == 2
+
+    assert limit.try_acquire() and limit.try_acquire()
+    assert not limit.try_acquire()
+    assert limit.rejected == 1
+    limit.release(latency=0.01, now=5.0)
+    limit.release(latency=0.01, now=5.0)
+    assert limit.limit == 2.5
+
+    # 한도의 절반 미만으로 사용 중이면 늘리지 않음
+    limit = AIMDLimit(initial=10, latency_sec=0.5)
+    for _ in range(100):
+        assert limit.try_acquire()
+        limit.release(latency=0.01)
+    assert limit.limit == 10
+
+
+def test_aimd_limit_decrease_once_per_window():
+    """
+    동시에 실행된 요청들이 느리게 끝나도 한도는 한번만 감소해야 합니다.
+    """
+    limit = AIMDLimit(initial=10, latency_sec=0.5, backoff=0.5)
+    for _ in range(8):
+        assert limit.try_acquire()
+
+    # 0초에 시작한 요청 8개가 2초에 느리게 완료
+    for _ in range(8):
+        limit.release(latency=2.0, now=2.0)
+    assert limit.limit == 5
+
+    # 감소 이후에 시작한 요청이 느리면 다시 감소
+    assert limit.try_acquire()
+    limit.release(latency=1.0, now=3.5)
+    assert limit.limit == 2.5
+    assert limit.try_acquire()
+    limit.release(latency=1.0, dropped=True, now=4.0)
+    assert limit.limit == 2.5
+
+
+def test_concurrency_limiter_bulk_latency():
+    """
+    일괄 처리 라우트는 별도 지연 기준으로 한도를 만들어야 합니다.
+    """
+    limiter = ConcurrencyLimiter(
+        FastAPI(), CONCURRENCY_LIMIT_LATENCY_SEC=1.0, CONCURRENCY_LIMIT_BULK_LATENCY_SEC=30.0
+    )
+
+    assert limiter.limit_for("GET /companies/{name}").latency_sec == 1.0
+    assert limiter.limit_for("POST /companies/import", bulk=True).latency_sec == 30.0
+
+
+def test_concurrency_limiter_rejects():
+    """
+    한도를 넘은 요청은 503, Retry-After 헤더로 바로 응답해야 합니다.
+    """
+    app = FastAPI()
+    limiter = ConcurrencyLimiter(
+        app, CONCURRENCY_LIMIT_INITIAL=1, CONCURRENCY_LIMIT_MAX=1, CONCURRENCY_RETRY_AFTER_SEC=3
+    )
+
+    @app.get("/companies/{name}", dependencies=[Depends(limiter)])
+    def detail(name: str):
+        return {"name": name}
+
+    app.add_middleware(AccessControlMiddleware)
+    client = TestClient(app)
+
+    assert client.get("/companies/a").status_code == 200
+    limit = limiter.limit_for("GET /companies/{name}")
+    assert limit.in_flight == 0
+
+    limit.try_acquire()
+    resp = client.get("/companies/b")
+    assert resp.status_code == 503
+    assert resp.headers["retry-after"] == "3"
+    assert resp.json()["code"] == "ERR50301"
+    assert dict((name, value) for name, _, value in limiter.metric_gauges())["concurrency_in_flight"] == 1
@@ -0,0 +1,135 @@
+import asyncio
+import time
+
+import pytest
+import sqlalchemy.exc
+from fastapi import FastAPI, Response
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from starlette.requests import Request
+
+from app.database.conn_sqlalchemy import SQLAlchemy, READ_YOUR_WRITES_COOKIE
+from app.database.pool import TimedAsyncAdaptedQueuePool
+
+
+def _init_db(tmp_path, **kwargs):
+    """
+    writer, reader 2개를 로컬 DB 파일로 대체
+    """
+    sa = SQLAlchemy()
+    sa.init_app(
+        FastAPI(),
+        DB_WRITER_URL=f"sqlite:///{tmp_path / 'writer.db'}",
+        DB_READER_URLS=[f"sqlite:///{tmp_path / 'reader_a.db'}", f"sqlite:///{tmp_path / 'reader_b.db'}"],
+        DB_ECHO=False,
+        **kwargs
+    )
+    engines = {"writer": sa.engine, "reader_a": sa.reader_engines[0], "reader_b": sa.reader_engines[1]}
+    for name, engine in engines.items():
+        with engine.begin() as conn:
+            conn.execute(text("CREATE TABLE source (name TEXT)"))
+            conn.execute(text("INSERT INTO source VALUES (:name)"), dict(name=name))
+    return sa
+
+
+def _source(dependency):
+    session = next(dependency)
+    try:
+        return session.execute(text("SELECT name FROM source")).scalar()
+    finally:
+        dependency.close()
+
+
+def _request(cookies: dict = None) -> Request:
+    cookie = "; ".join(f"{k}={v}" for k, v in (cookies or {}).items())
+    return Request({"type": "http", "headers": [(b"cookie", cookie.encode())]})
+
+
+def test_reader_round_robin(tmp_path):
+    """
+    읽기 세션은 reader를 순서대로 사용해야 합니다.
+    """
+    sa = _init_db(tmp_path)
+
+    assert [_source(sa.get_reader_db(_request())) for _ in range(4)] == [
+        "reader_a", "reader_b", "reader_a", "reader_b"
+    ]
+    assert _source(sa.get_writer_db()) == "writer"
+
+
+def test_reader_least_connections(tmp_path):
+    """
+    least_connections는 사용중인 커넥션이 적은 reader를 사용해야 합니다.
+    """
+    sa = _init_db(tmp_path, DB_READER_SELECT="least_connections")
+    busy = sa.reader_engines[0].connect()
+    try:
+        assert _source(sa.get_reader_db(_request())) == "reader_b"
+    finally:
+        busy.close()
+
+
+def test_read_your_writes(tmp_path):
+    """
+    쓰기 후 설정 시간 동안은 writer에서 읽어야 합니다.
+    """
+    sa = _init_db(tmp_path, DB_READ_YOUR_WRITES_SEC=5)
+    response = Response()
+    dependency = sa.get_writer_db(response)
+    session = next(dependency)
+    session.execute(text("INSERT INTO source VALUES ('new')"))
+    session.commit()
+    dependency.close()
+
+    cookie = response.headers["set-cookie"]
+    assert cookie.startswith(READ_YOUR_WRITES_COOKIE)
+    until = cookie.split(";")[0].split("=")[1]
+
+    assert _source(sa.get_reader_db(_request({READ_YOUR_WRITES_COOKIE: until}))) == "writer"
+    assert _source(sa.get_reader_db(_request({READ_YOUR_WRITES_COOKIE: int(time.time()) - 1}))) == "reader_a"
+
+
+def test_pool_warm_up_and_stats(tmp_path):
+    """
+    시작시 만든 커넥션은 풀로 반환되고, 커넥션 대기는 통계에 기록되어야 합니다.
+    """
+    sa = _init_db(tmp_path, DB_POOL_SIZE=1, DB_MAX_OVERFLOW=0, DB_POOL_TIMEOUT=0.1)
+    sa.engine.dispose()
+    sa._warm_up(sa.engine)
+
+    stats = sa.pool_stats()["pools"]["db"]
+    assert stats["checked_in"] == 1
+    assert stats["checked_out"] == 0
+
+    busy = sa.engine.connect()
+    try:
+        with pytest.raises(sqlalchemy.exc.TimeoutError):
+            sa.engine.connect()
+    finally:
+        busy.close()
+
+    stats = sa.pool_stats()["pools"]["db"]
+    assert stats["waits"] == 1
+    assert stats["timeouts"] == 1
+    assert stats["max_wait_time_ms"] >= 100
+
+
+def test_async_pool_warm_up(tmp_path):
+    """
+    DB_ASYNC 엔진도 시작시 커넥션을 만들어 풀로 반환해야 합니다.
+    """
+    sa = _init_db(tmp_path, DB_POOL_WARMUP=2)
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'writer.db'}", poolclass=TimedAsyncAdaptedQueuePool, pool_size=2
+    )
+
+    async def warm_up():
+        await sa._warm_up_async(engine)
+        stats = engine.pool.stats()
+        await engine.dispose()
+        return stats
+
+    stats = asyncio.run(warm_up())
+    assert stats["checked_in"] == 2
+    assert stats["checkouts"] == 2
+    assert stats["waits"] == 0
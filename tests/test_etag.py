@@ -0,0 +1,75 @@
+from sqlalchemy import event
+
+from app.models.api.v1.company.request import NewCompanyRequest, TagName
+from app.services.api.v1.company import (
+    add_tags_to_company, company_detail_etag, create_company, get_company_detail, search_company_by_tag_name,
+    tag_search_etag
+)
+from app.utils.cache import LRUCache, cache
+from app.utils.etag import etag_matches, make_etag
+
+
+def test_etag_matches():
+    """
+    If-None-Match 목록, weak 표기, * 를 처리해야 합니다.
+    """
+    etag = make_etag("company_detail", 1, "ko", 3, 10)
+
+    assert etag == make_etag("company_detail", 1, "ko", 3, 10)
+    assert etag != make_etag("company_detail", 1, "en", 3, 10)
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches('"other"', etag)
+
+
+def test_etag_body_after_write_without_invalidation(sqlite_session, monkeypatch):
+    """
+    다른 워커의 변경으로 캐시 무효화를 받지 못해도 새 ETag로는 변경된 본문을 응답해야 합니다.
+    """
+    monkeypatch.setattr(cache, "backend", LRUCache())
+    create_company(
+        NewCompanyRequest(company_name={"ko": "원티드랩"}, tags=[TagName(tag_name={"ko": "태그_1"})]),
+        "ko", sqlite_session
+    )
+    create_company(
+        NewCompanyRequest(company_name={"ko": "스피링크"}, tags=[TagName(tag_name={"ko": "태그_4"})]),
+        "ko", sqlite_session
+    )
+    etag = company_detail_etag("원티드랩", "ko", sqlite_session)
+    tag_etag = tag_search_etag("태그_4", "ko", sqlite_session)
+    assert get_company_detail("원티드랩", "ko", sqlite_session, version=etag).data.tags == ["태그_1"]
+    result = search_company_by_tag_name("태그_4", "ko", sqlite_session, version=tag_etag)
+    assert [item.company_name for item in result.data] == ["스피링크"]
+
+    # 다른 워커에서 변경된 경우 (이 워커의 캐시는 무효화 되지 않음)
+    monkeypatch.setattr(cache, "invalidate_tags", lambda *tags: None)
+    add_tags_to_company("원티드랩", [TagName(tag_name={"ko": "태그_4"})], "ko", sqlite_session)
+
+    new_etag = company_detail_etag("원티드랩", "ko", sqlite_session)
+    assert new_etag != etag
+    assert get_company_detail("원티드랩", "ko", sqlite_session, version=new_etag).data.tags == ["태그_1", "태그_4"]
+    new_tag_etag = tag_search_etag("태그_4", "ko", sqlite_session)
+    assert new_tag_etag != tag_etag
+    result = search_company_by_tag_name("태그_4", "ko", sqlite_session, version=new_tag_etag)
+    assert [item.company_name for item in result.data] == ["원티드랩", "스피링크"]
+
+
+def test_tag_search_etag_new_tag_name(sqlite_session, monkeypatch):
+    """
+    태그 검색 ETag는 캐시된 태그 그룹 id로 번역 테이블 조회 없이 만들고, 태그명이 새로 등록되면 바뀌어야 합니다.
+    """
+    monkeypatch.setattr(cache, "backend", LRUCache())
+    etag = tag_search_etag("태그_4", "ko", sqlite_session)
+
+    statements = []
+    event.listen(sqlite_session.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+    assert tag_search_etag("태그_4", "ko", sqlite_session) == etag
+    assert not any("tag_group_translation" in statement for statement in statements)
+
+    create_company(
+        NewCompanyRequest(company_name={"ko": "원티드랩"}, tags=[TagName(tag_name={"ko": "태그_4"})]),
+        "ko", sqlite_session
+    )
+    assert tag_search_etag("태그_4", "ko", sqlite_session) != etag
@@ -0,0 +1,31 @@
+from fastapi import FastAPI
+from starlette.testclient import TestClient
+
+from app.models.api.v1.company.response import AutoCompleteCompanyListResponse
+from app.services.api.v1.company import autocomplete_response
+from app.utils.json_response import FastJSON
+
+NAMES = ["원티드랩", "Wantedlab", "ｗａｎｔｅｄ", "a\"b\\c", "tab\tnew\nline\x01\x7f", " 이모지🍫", ""]
+
+
+def _client(enabled: bool) -> TestClient:
+    app = FastAPI()
+    fast_json = FastJSON(app, FAST_JSON_RESPONSE=enabled)
+
+    @app.get("/search", response_model=AutoCompleteCompanyListResponse)
+    def search():
+        return fast_json.response(autocomplete_response(NAMES))
+
+    return TestClient(app)
+
+
+def test_fast_json_byte_compatible():
+    """
+    빠른 직렬화 응답은 기존 응답과 바이트 단위로 같아야 합니다.
+    """
+    default = _client(False).get("/search")
+    fast = _client(True).get("/search")
+
+    assert fast.content == default.content
+    assert fast.headers["content-type"] == default.headers["content-type"]
+    assert [item["company_name"] for item in fast.json()["data"]] == NAMES
@@ -0,0 +1,68 @@
+import asyncio
+import json
+import logging
+import time
+from datetime import datetime
+
+import pytest
+from starlette.requests import Request
+
+from app.errors.exceptions import APIException
+from app.utils.logger_fastapi import access_log, api_logger, TIME_FORMAT
+
+
+def _request() -> Request:
+    request = Request({
+        "type": "http",
+        "method": "GET",
+        "path": "/companies/원티드랩",
+        "headers": [(b"host", b"localhost:5000")],
+    })
+    request.state.start = time.time()
+    request.state.ip = "127.0.0.1"
+    request.state.inspect = None
+    return request
+
+
+@pytest.fixture
+def logs(caplog):
+    # 다른 테스트에서 남은 로그 출력 후 시작
+    access_log.start()
+    access_log.stop()
+    caplog.clear()
+    access_log.start()
+    with caplog.at_level(logging.INFO, logger="fastapi"):
+        yield lambda: [json.loads(r.getMessage()) for r in caplog.records if r.name == "app.access"]
+    access_log.stop()
+    access_log.sample_rate_2xx = 1.0
+
+
+def _log_and_flush(**kwargs):
+    asyncio.run(api_logger(request=_request(), **kwargs))
+    access_log.stop()
+    access_log.start()
+
+
+def test_api_logger(logs):
+    """
+    접근 로그는 listener 스레드에서 JSON으로 출력되고 KST는 UTC+9 시간이어야 합니다.
+    """
+    _log_and_flush(status_code=200)
+
+    [log] = logs()
+    assert log["url"] == "localhost/companies/원티드랩"
+    assert log["statusCode"] == 200
+    utc = datetime.strptime(log["datetimeUTC"], TIME_FORMAT)
+    kst = datetime.strptime(log["datetimeKST"], TIME_FORMAT)
+    assert (kst - utc).total_seconds() == 9 * 3600
+
+
+def test_api_logger_sampling(logs):
+    """
+    2xx 응답은 샘플링 비율만큼 기록하고 에러는 항상 기록해야 합니다.
+    """
+    access_log.sample_rate_2xx = 0.0
+    _log_and_flush(status_code=200)
+    _log_and_flush(error=APIException())
+
+    assert [log["statusCode"] for log in logs()] == [500]
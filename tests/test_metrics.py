@@ -0,0 +1,56 @@
+import json
+
+from fastapi import FastAPI
+from starlette.testclient import TestClient
+
+from app.middlewares.access_validator import AccessControlMiddleware
+from app.utils.metrics import Metrics, mark_process_dead, metrics
+
+
+def test_metrics_route_histogram():
+    """
+    요청 수는 경로 템플릿, 상태 코드별로, 응답 시간은 histogram 으로 기록되어야 합니다.
+    """
+    app = FastAPI()
+
+    @app.get("/items/{name}")
+    def item(name: str):
+        return {"name": name}
+
+    app.add_middleware(AccessControlMiddleware)
+    client = TestClient(app)
+    for name in ("a", "b", "c"):
+        client.get(f"/items/{name}")
+    client.get("/missing")
+
+    text = metrics.render()
+    assert 'http_requests_total{method="GET",route="/items/{name}",status="200"} 3' in text
+    assert 'http_requests_total{method="GET",route="unmatched",status="404"} 1' in text
+    assert 'http_request_duration_seconds_bucket{method="GET",route="/items/{name}",le="+Inf"} 3' in text
+    assert 'http_request_duration_seconds_count{method="GET",route="/items/{name}"} 3' in text
+
+
+def test_metrics_multiprocess(tmp_path):
+    """
+    워커별 파일을 합산하고, 종료된 워커의 counter 는 유지, gauge 는 제외해야 합니다.
+    """
+    for pid, value in (("101", 2), ("102", 3)):
+        registry = Metrics()
+        registry.multiproc_dir = str(tmp_path)
+        registry.inc("jobs_total", dict(kind="a"), value)
+        registry.observe("latency_seconds", {}, 0.02)
+        registry.register_gauges(lambda: [("busy", {}, 1)])
+        (tmp_path / f"{pid}.json").write_text(json.dumps(registry.snapshot()))
+
+    reader = Metrics()
+    reader.multiproc_dir = str(tmp_path)
+    text = reader.render()
+    assert 'jobs_total{kind="a"} 5' in text
+    assert 'latency_seconds_bucket{le="0.025"} 2' in text
+    assert 'busy{pid="101"} 1' in text
+
+    mark_process_dead(101, str(tmp_path))
+    text = reader.render()
+    assert 'jobs_total{kind="a"} 5' in text
+    assert 'busy{pid="101"}' not in text
+    assert 'busy{pid="102"} 1' in text
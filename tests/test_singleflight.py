@@ -0,0 +1,126 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.services.api.v1.company import flight_key
+from app.utils.singleflight import SingleFlight
+
+
+def test_single_flight_threads():
+    """
+    같은 키의 동시 호출은 한번만 실행하고 결과, 예외를 공유해야 합니다.
+    """
+    single_flight = SingleFlight()
+    calls = []
+    started = threading.Event()
+
+    def load():
+        calls.append(1)
+        started.set()
+        time.sleep(0.1)
+        return {"company_name": "원티드랩"}
+
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        leader = executor.submit(single_flight.do, ("company_detail", "원티드랩", "ko"), load)
+        started.wait()
+        waiters = [executor.submit(single_flight.do, ("company_detail", "원티드랩", "ko"), load) for _ in range(9)]
+        results = [f.result() for f in [leader, *waiters]]
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+
+    def fail():
+        time.sleep(0.05)
+        raise ValueError("boom")
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [executor.submit(single_flight.do, ("tag_search", "태그_1", "ko"), fail) for _ in range(3)]
+        for future in futures:
+            with pytest.raises(ValueError):
+                future.result()
+    assert single_flight.do(("tag_search", "태그_1", "ko"), lambda: "ok") == "ok"
+
+
+def test_single_flight_async():
+    """
+    async 요청도 한번만 실행하고, 먼저 들어온 요청이 취소되면 나머지는 직접 실행해야 합니다.
+    """
+    single_flight = SingleFlight()
+    calls = []
+
+    async def load():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return len(calls)
+
+    async def main():
+        key = ("company_detail", "원티드랩", "ko")
+        results = await asyncio.gather(*[single_flight.do_async(key, load) for _ in range(10)])
+        assert results == [1] * 10
+
+        leader = asyncio.ensure_future(single_flight.do_async(key, load))
+        await asyncio.sleep(0)
+        waiter = asyncio.ensure_future(single_flight.do_async(key, load))
+        await asyncio.sleep(0)
+        leader.cancel()
+        assert await waiter == 3
+
+    asyncio.run(main())
+    assert len(calls) == 3
+
+
+def test_single_flight_wait_timeout():
+    """
+    먼저 들어온 요청이 timeout_sec 안에 끝나지 않으면 기다리던 요청은 직접 실행해야 합니다.
+    """
+    single_flight = SingleFlight()
+    single_flight.timeout_sec = 0.05
+    started, release = threading.Event(), threading.Event()
+
+    def hang():
+        started.set()
+        release.wait(5)
+        return "leader"
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(single_flight.do, ("company_detail", "원티드랩", "ko"), hang)
+        started.wait()
+        assert single_flight.do(("company_detail", "원티드랩", "ko"), lambda: "waiter") == "waiter"
+        release.set()
+        assert leader.result() == "leader"
+
+    async def main():
+        hung = asyncio.Event()
+
+        async def hang_async():
+            await hung.wait()
+            return "leader"
+
+        async def load():
+            return "waiter"
+
+        key = ("tag_search", "태그_1", "ko")
+        leader_task = asyncio.ensure_future(single_flight.do_async(key, hang_async))
+        await asyncio.sleep(0)
+        assert await single_flight.do_async(key, load) == "waiter"
+        hung.set()
+        assert await leader_task == "leader"
+
+    asyncio.run(main())
+
+
+def test_flight_key_engine():
+    """
+    같은 조회라도 세션이 조회하는 엔진이 다르면 요청 병합 키가 달라야 합니다.
+    """
+    writer, reader = create_engine("sqlite://"), create_engine("sqlite://")
+
+    assert flight_key(Session(writer), "company_detail", "원티드랩", "ko") == \
+        flight_key(Session(writer), "company_detail", "원티드랩", "ko")
+    assert flight_key(Session(writer), "company_detail", "원티드랩", "ko") != \
+        flight_key(Session(reader), "company_detail", "원티드랩", "ko")
@@ -0,0 +1,74 @@
+import contextvars
+import logging
+import threading
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from app.database.profiler import SqlProfiler, statement_shape
+
+
+def _profiler(**kwargs):
+    engine = create_engine("sqlite://")
+    profiler = SqlProfiler()
+    profiler.init_app([engine], **kwargs)
+    return profiler, engine
+
+
+def test_statement_shape():
+    """
+    IN 파라미터 개수, 공백만 다른 쿼리는 같은 형태여야 합니다.
+    """
+    assert statement_shape("SELECT a\n FROM t WHERE id IN (%s, %s, %s)") == "SELECT a FROM t WHERE id IN (?)"
+    assert statement_shape("SELECT a FROM t WHERE id IN (%s)") == "SELECT a FROM t WHERE id IN (?)"
+    assert statement_shape("SELECT a FROM t WHERE (a, b) IN ((?, ?), (?, ?))") == \
+        "SELECT a FROM t WHERE (a, b) IN ((?))"
+
+
+def test_track_counts_queries_in_threads():
+    """
+    요청 단위 집계는 스레드풀에서 실행된 쿼리도 포함해야 합니다.
+    """
+    profiler, engine = _profiler()
+
+    def query():
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+    with profiler.track("GET /") as stats:
+        query()
+        thread = threading.Thread(target=contextvars.copy_context().run, args=(query,))
+        thread.start()
+        thread.join()
+    query()
+
+    assert stats.count == 2
+    assert stats.repeated() == {"SELECT 1": 2}
+
+
+def test_n_plus_one_warning(caplog):
+    """
+    같은 형태의 쿼리가 기준 이상 실행되면 경고해야 합니다.
+    """
+    profiler, engine = _profiler(SQL_N_PLUS_ONE_THRESHOLD=3)
+    with caplog.at_level(logging.WARNING), profiler.track("GET /companies"):
+        with engine.connect() as conn:
+            for i in range(3):
+                conn.execute(text("SELECT :i"), dict(i=i))
+
+    assert "Possible N+1 queries in GET /companies" in caplog.text
+
+
+def test_assert_max_queries():
+    """
+    쿼리 수가 예산을 넘으면 AssertionError가 발생해야 합니다.
+    """
+    profiler, engine = _profiler()
+    with engine.connect() as conn:
+        with profiler.assert_max_queries(1):
+            conn.execute(text("SELECT 1"))
+
+        with pytest.raises(AssertionError, match="at most 1 queries, 2 executed"):
+            with profiler.assert_max_queries(1):
+                conn.execute(text("SELECT 1"))
+                conn.execute(text("SELECT 2"))
@@ -0,0 +1,54 @@
+from fastapi import FastAPI
+
+from app.utils.tracing import Tracing
+
+
+def test_tracing_disabled():
+    """
+    트레이싱 미사용시 span은 기록되지 않아야 합니다.
+    """
+    tracing = Tracing(FastAPI(), TRACING_ENABLED=False)
+    with tracing.start_span("GET /search") as span:
+        span.set_attribute("http.method", "GET")
+        tracing.set_ok(span)
+        assert not span.is_recording()
+
+
+def _memory_tracing(**kwargs) -> Tracing:
+    return Tracing(FastAPI(), TRACING_ENABLED=True, TRACING_EXPORTER="memory", TRACING_BATCH_EXPORT=False, **kwargs)
+
+
+def test_tracing_sampler():
+    """
+    상위 trace context 가 없으면 비율대로, 있으면 상위 샘플링 결정을 따라야 합니다.
+    """
+    tracing = _memory_tracing(TRACING_SAMPLE_RATE=1.0)
+    with tracing.start_span("GET /search", {}) as span:
+        tracing.set_ok(span)
+    assert [s.name for s in tracing.exporter.get_finished_spans()] == ["GET /search"]
+
+    tracing = _memory_tracing(TRACING_SAMPLE_RATE=0.0)
+    with tracing.start_span("GET /search", {}):
+        pass
+    assert tracing.exporter.get_finished_spans() == ()
+
+    parent = "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01"
+    with tracing.start_span("GET /search", {"traceparent": parent}) as span:
+        assert span.is_recording()
+    spans = tracing.exporter.get_finished_spans()
+    assert len(spans) == 1
+    assert format(spans[0].context.trace_id, "032x") == "0af7651916cd43dd8448eb211c80319c"
+
+
+def test_tracing_batch_export():
+    """
+    batch 내보내기는 종료시 큐에 남은 span 을 모두 내보내야 합니다.
+    """
+    tracing = Tracing(
+        FastAPI(), TRACING_ENABLED=True, TRACING_EXPORTER="memory", TRACING_MAX_QUEUE_SIZE=16,
+    )
+    for _ in range(3):
+        with tracing.start_span("GET /search"):
+            pass
+    tracing.shutdown()
+    assert len(tracing.exporter.get_finished_spans()) == 3
@@ -0,0 +1,51 @@
+from fastapi import FastAPI
+from starlette.testclient import TestClient
+
+from app.middlewares.trusted_hosts import TrustedHostMiddleware
+
+
+def _client(base_url: str = "http://api.choco.com"):
+    app = FastAPI()
+
+    @app.get("/health")
+    def health():
+        return "ok"
+
+    @app.get("/ping")
+    def ping():
+        return "pong"
+
+    app.add_middleware(
+        TrustedHostMiddleware,
+        allowed_hosts=[f"host{i}.example.com" for i in range(50)] + ["api.choco.com", "*.choco.io", "www.choco.com"],
+        except_path=["/health"],
+    )
+    return TestClient(app, base_url=base_url)
+
+
+def test_trusted_hosts():
+    """
+    허용된 host, 와일드카드 하위 도메인만 통과해야 합니다.
+    """
+    assert _client("http://api.choco.com").get("/ping").status_code == 200
+    assert _client("http://host49.example.com").get("/ping").status_code == 200
+    assert _client("http://a.b.choco.io").get("/ping").status_code == 200
+    assert _client("http://choco.io").get("/ping").status_code == 400
+    assert _client("http://evil.com").get("/ping").status_code == 400
+
+
+def test_trusted_hosts_except_path():
+    """
+    예외 경로는 host와 관계없이 통과해야 합니다.
+    """
+    assert _client("http://evil.com").get("/health").status_code == 200
+
+
+def test_trusted_hosts_www_redirect():
+    """
+    www. 가 붙은 host만 허용된 경우 www로 리다이렉트해야 합니다.
+    """
+    resp = _client("http://choco.com").get("/ping", follow_redirects=False)
+
+    assert resp.status_code == 307
+    assert resp.headers["location"] == "http://www.choco.com/ping"